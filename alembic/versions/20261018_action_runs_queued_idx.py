@@ -0,0 +1,54 @@
+"""Add partial index on queued action_runs for the worker claim query
+
+Revision ID: 20261018_action_runs_queued_idx
+Revises: 20260412_add_llm_summary_json
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+revision = "20261018_action_runs_queued_idx"
+down_revision = "20260412_add_llm_summary_json"
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = "ix_action_runs_queued_created_at"
+QUEUED_PREDICATE = sa.text("status = 'queued'")
+
+
+def _index_exists() -> bool:
+    inspector = inspect(op.get_bind())
+    return any(ix["name"] == INDEX_NAME for ix in inspector.get_indexes("action_runs"))
+
+
+def upgrade() -> None:
+    if _index_exists():
+        return
+    # Only queued rows are indexed, so the index stays small as run history grows
+    # and ORDER BY created_at LIMIT n FOR UPDATE SKIP LOCKED reads just the queue head.
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.create_index(
+                INDEX_NAME,
+                "action_runs",
+                ["created_at"],
+                postgresql_where=QUEUED_PREDICATE,
+                postgresql_concurrently=True,
+            )
+    else:
+        op.create_index(INDEX_NAME, "action_runs", ["created_at"], sqlite_where=QUEUED_PREDICATE)
+
+
+def downgrade() -> None:
+    if not _index_exists():
+        return
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.drop_index(INDEX_NAME, table_name="action_runs", postgresql_concurrently=True)
+    else:
+        op.drop_index(INDEX_NAME, table_name="action_runs")
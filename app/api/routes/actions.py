@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
+import threading
+from collections import OrderedDict
+
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db, require_shared_secret
@@ -17,6 +20,30 @@ from app.services.action_runner import enqueue_action_run
 
 router = APIRouter(prefix="/actions", tags=["actions"])
 
+# Runs in a terminal status are never updated again, so their encoded status
+# responses (which can carry a full solver result) are cached per process and
+# served to polling clients without a DB round-trip or re-serialization.
+_TERMINAL_STATUSES = frozenset({"success", "failed"})
+_TERMINAL_RESPONSE_CACHE_MAX = 512
+_terminal_responses: "OrderedDict[str, bytes]" = OrderedDict()
+_terminal_responses_lock = threading.Lock()
+
+
+def _cached_terminal_response(run_id: str) -> bytes | None:
+    with _terminal_responses_lock:
+        body = _terminal_responses.get(run_id)
+        if body is not None:
+            _terminal_responses.move_to_end(run_id)
+        return body
+
+
+def _cache_terminal_response(run_id: str, body: bytes) -> None:
+    with _terminal_responses_lock:
+        _terminal_responses[run_id] = body
+        _terminal_responses.move_to_end(run_id)
+        while len(_terminal_responses) > _TERMINAL_RESPONSE_CACHE_MAX:
+            _terminal_responses.popitem(last=False)
+
 
 @router.post("/run", response_model=ActionRunEnqueueResponse, dependencies=[Depends(require_shared_secret)])
 def run_action(req: ActionRunRequest, db: Session = Depends(get_db)) -> ActionRunEnqueueResponse:
@@ -33,10 +60,14 @@ def run_action(req: ActionRunRequest, db: Session = Depends(get_db)) -> ActionRu
 
 
 @router.get("/run/{run_id}", response_model=ActionRunStatusResponse, dependencies=[Depends(require_shared_secret)])
-def get_run_status(run_id: str, db: Session = Depends(get_db)) -> ActionRunStatusResponse:
+def get_run_status(run_id: str, db: Session = Depends(get_db)) -> ActionRunStatusResponse | Response:
     """
     Get the status of a specific action run by run_id.
     """
+    cached = _cached_terminal_response(run_id)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     ar: ActionRun | None = db.query(ActionRun).filter(ActionRun.run_id == run_id).one_or_none()
     if not ar:
         raise HTTPException(status_code=404, detail="run_id not found")
@@ -44,7 +75,7 @@ def get_run_status(run_id: str, db: Session = Depends(get_db)) -> ActionRunStatu
     def iso(dt):
         return dt.isoformat() if dt else None
 
-    return ActionRunStatusResponse(
+    response = ActionRunStatusResponse(
         run_id=ar.run_id,  # type: ignore[arg-type]
         action=ar.action,  # type: ignore[arg-type]
         status=ar.status,  # type: ignore[arg-type]
@@ -54,3 +85,8 @@ def get_run_status(run_id: str, db: Session = Depends(get_db)) -> ActionRunStatu
         result=ar.result_json,  # type: ignore[arg-type]
         error=ar.error_text,  # type: ignore[arg-type]
     )
+    if response.status in _TERMINAL_STATUSES:
+        body = response.model_dump_json().encode()
+        _cache_terminal_response(run_id, body)
+        return Response(content=body, media_type="application/json")
+    return response
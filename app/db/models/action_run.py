@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
-from sqlalchemy import JSON, Column, DateTime, Integer, String, Text
+from sqlalchemy import JSON, Column, DateTime, Index, Integer, String, Text, text
 
 from app.db.base import Base
 
@@ -13,6 +13,15 @@ class ActionRun(Base):
     """Execution ledger entry for sheet-triggered or system actions."""
 
     __tablename__ = "action_runs"
+    __table_args__ = (
+        # Queue head for the worker claim query (see action_runner._claim_one_queued)
+        Index(
+            "ix_action_runs_queued_created_at",
+            "created_at",
+            postgresql_where=text("status = 'queued'"),
+            sqlite_where=text("status = 'queued'"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
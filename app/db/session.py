@@ -1,9 +1,25 @@
 # productroadmap_sheet_project/app/db/session.py
 
+from typing import Any, Dict
+
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.config import settings  # expects DATABASE_URL
 
-engine = create_engine(settings.DATABASE_URL, future=True)
+
+def _engine_kwargs(url: str) -> Dict[str, Any]:
+    kwargs: Dict[str, Any] = {
+        "future": True,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+    }
+    # SQLite (local/test) uses its own pool classes that don't take sizing arguments
+    if not url.startswith("sqlite"):
+        kwargs["pool_size"] = settings.DB_POOL_SIZE
+        kwargs["max_overflow"] = settings.DB_MAX_OVERFLOW
+    return kwargs
+
+
+engine = create_engine(settings.DATABASE_URL, **_engine_kwargs(settings.DATABASE_URL))
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
\ No newline at end of file
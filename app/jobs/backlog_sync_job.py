@@ -8,7 +8,7 @@ from sqlalchemy.orm import Session
 
 from app.config import settings, BacklogSheetConfig
 from app.sheets.client import SheetsClient, get_sheets_service
-from app.sheets.backlog_writer import write_backlog_from_db
+from app.sheets.backlog_writer import write_backlog_fields_from_db, write_backlog_from_db
 
 
 class BacklogSyncResult(TypedDict):
@@ -73,6 +73,16 @@ def run_backlog_sync(
     )
 
 
+def _all_backlog_targets() -> list[BacklogSheetConfig]:
+    targets: list[BacklogSheetConfig] = []
+    if settings.CENTRAL_BACKLOG:
+        targets.append(settings.CENTRAL_BACKLOG)
+    targets.extend(settings.CENTRAL_BACKLOG_SHEETS)
+    if not targets:
+        raise ValueError("No backlog sheets configured.")
+    return targets
+
+
 def run_all_backlog_sync(db: Session, include_archived: bool = True) -> BacklogSyncResult:
     """Regenerate all configured backlog sheets (multi-org scenario).
     
@@ -81,12 +91,7 @@ def run_all_backlog_sync(db: Session, include_archived: bool = True) -> BacklogS
     """
     service_obj = get_sheets_service()
     client = SheetsClient(service_obj)
-    targets: list[BacklogSheetConfig] = []
-    if settings.CENTRAL_BACKLOG:
-        targets.append(settings.CENTRAL_BACKLOG)
-    targets.extend(settings.CENTRAL_BACKLOG_SHEETS)
-    if not targets:
-        raise ValueError("No backlog sheets configured.")
+    targets = _all_backlog_targets()
     
     total_initiatives = 0
     total_cells = 0
@@ -112,3 +117,60 @@ def run_all_backlog_sync(db: Session, include_archived: bool = True) -> BacklogS
         cells_updated=total_cells,
         archived_rows_excluded=total_archived_excluded,
     )
+
+
+def run_all_backlog_sync_for_keys(
+    db: Session,
+    initiative_keys: list[str],
+    fields: list[str],
+    include_archived: bool = True,
+) -> BacklogSyncResult:
+    """Refresh only the given fields of the given initiatives on all configured backlog sheets.
+
+    Falls back to a full regenerate of a sheet when some of the initiatives have no
+    row on it yet (e.g. the sheet is behind the DB).
+
+    Returns:
+        BacklogSyncResult with total counts across all sheets; initiatives_written is
+        the largest per-sheet count, and cells_updated only counts sheets that needed
+        the full regenerate.
+    """
+    service_obj = get_sheets_service()
+    client = SheetsClient(service_obj)
+    targets = _all_backlog_targets()
+
+    total_initiatives = 0
+    total_cells = 0
+    total_archived_excluded = 0
+    sheets_processed = 0
+
+    for cfg in targets:
+        targeted = write_backlog_fields_from_db(
+            db=db,
+            client=client,
+            spreadsheet_id=cfg.spreadsheet_id,
+            tab_name=cfg.tab_name,
+            initiative_keys=initiative_keys,
+            fields=fields,
+        )
+        sheets_processed += 1
+        if not targeted["initiatives_missing"]:
+            total_initiatives = max(total_initiatives, targeted["initiatives_written"])
+            continue
+        result = write_backlog_from_db(
+            db=db,
+            client=client,
+            backlog_spreadsheet_id=cfg.spreadsheet_id,
+            backlog_tab_name=cfg.tab_name,
+            include_archived=include_archived,
+        )
+        total_initiatives = max(total_initiatives, result["initiatives_written"])
+        total_cells += result["cells_updated"]
+        total_archived_excluded += result["archived_rows_excluded"]
+
+    return BacklogSyncResult(
+        sheets_processed=sheets_processed,
+        initiatives_written=total_initiatives,
+        cells_updated=total_cells,
+        archived_rows_excluded=total_archived_excluded,
+    )
@@ -222,6 +222,7 @@ def run_flow3_write_scores_to_sheet(
     tab_name: Optional[str] = None,
     initiative_keys: Optional[List[str]] = None,
     warnings_by_key: Optional[Dict[str, Any]] = None,
+    status_by_key: Optional[Dict[str, str]] = None,
 ) -> int:
     """Flow 3.C Phase 2: Write per-framework scores from DB back to Product Ops sheet.
 
@@ -247,6 +248,7 @@ def run_flow3_write_scores_to_sheet(
         tab_name: Override Scoring_Inputs tab name
         initiative_keys: Optional filter for specific initiatives
         warnings_by_key: Optional warnings to include in status column
+        status_by_key: Optional per-row Status messages, written in the same batch as scores
 
     Returns:
         Number of initiatives with scores written to sheet
@@ -269,6 +271,7 @@ def run_flow3_write_scores_to_sheet(
             tab,
             initiative_keys=initiative_keys,
             warnings_by_key=warnings_by_key,
+            status_by_key=status_by_key,
         )
         logger.info("flow3.write_scores.done", extra={"updated_count": count})
         return count
@@ -332,23 +332,27 @@ def _publish_results_to_sheets(
                 diagnostics=infeasible_diagnostics,
             )
         
-        # Build row data using service
+        # Build row data using service; the selected-key set is shared by all three builders
+        selected_keys = optimization_results_service.selected_keys_of(solution)
         runs_row = optimization_results_service.build_runs_row(
             run=opt_run,
             problem=problem,
             solution=solution,
+            selected_keys=selected_keys,
         )
         
         results_rows = optimization_results_service.build_results_rows(
             run_id=opt_run.run_id,
             problem=problem,
             solution=solution,
+            selected_keys=selected_keys,
         )
         
         gaps_rows = optimization_results_service.build_gaps_rows(
             run_id=opt_run.run_id,
             problem=problem,
             solution=solution,
+            selected_keys=selected_keys,
         )
         
         # Publish to sheets
@@ -9,6 +9,7 @@ from .optimization_center import (
 	TargetRowSchema,
 	ConstraintSetCompiled,
 	validate_constraint_row,
+	validate_constraint_rows_batch,
 	validate_target_row,
 	validate_scenario_config,
 )
@@ -31,6 +32,7 @@ __all__ = [
 	"TargetRowSchema",
 	"ConstraintSetCompiled",
 	"validate_constraint_row",
+	"validate_constraint_rows_batch",
 	"validate_target_row",
 	"validate_scenario_config",
 ]
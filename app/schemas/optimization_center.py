@@ -11,17 +11,63 @@ No sheet or DB I/O lives here; sync services can import these helpers.
 
 from __future__ import annotations
 
-from typing import Annotated, Dict, List, Optional, Union
+import json
+from dataclasses import dataclass
+from typing import Annotated, Dict, List, Optional, Sequence, Tuple, Union, cast
 
-from pydantic import BaseModel, Field, TypeAdapter, ValidationError, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError, field_validator, model_validator
 from typing_extensions import Literal
 
+# Allowed values / aliases used by row validators, built once at import.
+_FLOOR_OR_GOAL = frozenset({"floor", "goal"})
+_ALL_DIMENSION_ALIASES = frozenset({"all", "global", "total", "company"})
+
+
+def _blank_to_none(data, fields: Tuple[str, ...]):
+    """Map empty-string cells to None for the given fields (copying only when needed)."""
+    if not isinstance(data, dict) or not any(data.get(f) == "" for f in fields):
+        return data
+    data = dict(data)
+    for f in fields:
+        if data.get(f) == "":
+            data[f] = None
+    return data
+
+
+def _split_member_keys(raw: Optional[str]) -> List[str]:
+    """Split a '|' or ';' separated member list into stripped, de-duplicated keys (order kept)."""
+    if not raw:
+        return []
+    return list(dict.fromkeys(part for part in (p.strip() for p in raw.replace(";", "|").split("|")) if part))
+
+
+def _strip(v) -> str:
+    return v.strip() if isinstance(v, str) else str(v).strip()
+
+
+def _norm(v) -> str:
+    """Strip + lowercase a cell value; skips the str() round-trip when already a str."""
+    if isinstance(v, str):
+        return v.strip().lower()
+    return str(v).strip().lower()
+
+
+@dataclass(frozen=True, slots=True)
+class ValidationMessage:
+    """Per-row validation feedback; a plain record, so not a pydantic model."""
 
-class ValidationMessage(BaseModel):
     row_num: int
     key: str
-    errors: List[str] = Field(default_factory=list)
-    warnings: List[str] = Field(default_factory=list)
+    # Most rows validate cleanly; a shared empty tuple avoids allocating two lists per message
+    errors: Tuple[str, ...] = ()
+    warnings: Tuple[str, ...] = ()
+
+    def __str__(self) -> str:
+        # Same text the former BaseModel rendered; pm.save_optimization shows it to users
+        return (
+            f"row_num={self.row_num!r} key={self.key!r} "
+            f"errors={list(self.errors)!r} warnings={list(self.warnings)!r}"
+        )
 
 
 class ScenarioConfigSchema(BaseModel):
@@ -29,26 +75,27 @@ class ScenarioConfigSchema(BaseModel):
     period_key: Optional[str] = None
     capacity_total_tokens: Optional[float] = None
     objective_mode: Optional[str] = None
-    objective_weights_json: Optional[dict] = None
+    objective_weights_json: Optional[Union[str, dict]] = None  # raw sheet JSON text is parsed in validate_weights
     notes: Optional[str] = None
 
-    model_config = {"extra": "ignore"}
+    model_config = ConfigDict(extra="ignore", hide_input_in_errors=True, frozen=True)
 
-    @field_validator("capacity_total_tokens", mode="before")
+    @model_validator(mode="before")
     @classmethod
-    def to_float(cls, v):
-        if v is None or v == "":
-            return None
-        try:
-            return float(v)
-        except Exception as e:  # noqa: BLE001
-            raise ValueError(f"invalid number: {v}") from e
+    def blank_numbers_to_none(cls, data):
+        # Number parsing itself is left to pydantic-core's float validator
+        return _blank_to_none(data, ("capacity_total_tokens",))
 
     @field_validator("objective_weights_json")
     @classmethod
     def validate_weights(cls, v):
         if v is None:
             return None
+        if isinstance(v, str):
+            try:
+                v = json.loads(v)
+            except ValueError as e:
+                raise ValueError("objective_weights_json must be a JSON object") from e
         if not isinstance(v, dict):
             raise ValueError("objective_weights_json must be a JSON object")
         cleaned: Dict[str, float] = {}
@@ -78,25 +125,30 @@ class ConstraintRowBase(BaseModel):
     prereq_member_keys: Optional[str] = None
     notes: Optional[str] = None
 
-    model_config = {"extra": "ignore"}
+    # Not frozen: type-specific model validators normalize fields in place
+    model_config = ConfigDict(extra="ignore", hide_input_in_errors=True)
 
-    @field_validator("constraint_type", "dimension", "scenario_name", "constraint_set_name")
+    @model_validator(mode="before")
+    @classmethod
+    def normalize_fields(cls, data):
+        """Normalize raw cells for direct model validation without touching the caller's dict.
+
+        validate_constraint_rows_batch already normalized its rows (see
+        _normalize_constraint_fields), so those pass through without a copy.
+        """
+        if not isinstance(data, dict) or _constraint_fields_normalized(data):
+            return data
+        data = dict(data)
+        _normalize_constraint_fields(data)
+        return data
+
+    @field_validator("scenario_name", "constraint_set_name")
     @classmethod
     def not_blank(cls, v: str) -> str:
         if v is None or str(v).strip() == "":
             raise ValueError("must not be blank")
         return str(v).strip()
 
-    @field_validator("min_tokens", "max_tokens", mode="before")
-    @classmethod
-    def to_float(cls, v):
-        if v is None or v == "":
-            return None
-        try:
-            return float(v)
-        except Exception as e:  # noqa: BLE001
-            raise ValueError(f"invalid number: {v}") from e
-
     @field_validator("min_tokens", "max_tokens")
     @classmethod
     def non_negative(cls, v):
@@ -106,31 +158,6 @@ class ConstraintRowBase(BaseModel):
             raise ValueError("value must be >= 0")
         return v
 
-    # NOTE: constraint_type is used as discriminator, cannot use mode="before"
-    # Normalization happens in validate_constraint_row() before schema validation
-    @field_validator("constraint_type")
-    @classmethod
-    def normalize_type(cls, v: str) -> str:
-        return str(v).strip().lower()
-
-    @field_validator("dimension", mode="before")
-    @classmethod
-    def normalize_dimension(cls, v: str) -> str:
-        return str(v).strip().lower()
-
-    @field_validator("constraint_set_name", mode="before")
-    @classmethod
-    def normalize_constraint_set(cls, v: str) -> str:
-        return str(v).strip()
-
-    @field_validator("dimension_key")
-    @classmethod
-    def normalize_dimension_key(cls, v: Optional[str]) -> Optional[str]:
-        if v is None:
-            return None
-        sv = str(v).strip()
-        return sv if sv else None
-
     @model_validator(mode="after")
     def forbid_special_keys_for_wrong_types(self):
         if self.bundle_member_keys and str(self.constraint_type).strip() != "bundle_all_or_nothing":
@@ -226,17 +253,9 @@ class BundleRowSchema(ConstraintRowBase):
     def validate_bundle(self):
         if not self.dimension_key:
             raise ValueError("bundle_all_or_nothing requires bundle dimension_key")
-        member_source = self.bundle_member_keys or ""
-        members = [part.strip() for part in member_source.replace(";", "|").split("|") if part.strip()]
-        if not members:
+        unique_members = _split_member_keys(self.bundle_member_keys)
+        if not unique_members:
             raise ValueError("bundle_all_or_nothing requires at least one bundle_member_key")
-        # Deduplicate while preserving order
-        seen = set()
-        unique_members = []
-        for m in members:
-            if m not in seen:
-                seen.add(m)
-                unique_members.append(m)
         self.dimension_key = str(self.dimension_key).strip()
         self.bundle_member_keys = "|".join(unique_members)
         return self
@@ -290,21 +309,12 @@ class RequirePrereqRowSchema(ConstraintRowBase):
         if not dependent:
             raise ValueError("require_prereq dimension_key must be non-empty")
         
-        prereq_source = self.prereq_member_keys or ""
-        prereqs = [part.strip() for part in prereq_source.replace(";", "|").split("|") if part.strip()]
-        if not prereqs:
+        unique_prereqs = _split_member_keys(self.prereq_member_keys)
+        if not unique_prereqs:
             raise ValueError("require_prereq requires at least one prereq_member_key")
-        
-        # Deduplicate while preserving order
-        seen = set()
-        unique_prereqs = []
-        for p in prereqs:
-            if p not in seen:
-                if p == dependent:
-                    raise ValueError("require_prereq: dependent cannot be its own prerequisite")
-                seen.add(p)
-                unique_prereqs.append(p)
-        
+        if dependent in unique_prereqs:
+            raise ValueError("require_prereq: dependent cannot be its own prerequisite")
+
         self.dimension_key = dependent
         self.prereq_member_keys = "|".join(unique_prereqs)
         return self
@@ -344,6 +354,11 @@ ConstraintRow = Annotated[
 
 
 _CONSTRAINT_ROW_ADAPTER = TypeAdapter(ConstraintRow)
+# pydantic-core SchemaValidator behind the adapter; calling it directly skips the
+# TypeAdapter.validate_python wrapper frame on the per-row hot path.
+_CONSTRAINT_ROW_VALIDATOR = _CONSTRAINT_ROW_ADAPTER.validator
+# List adapter lets a whole sheet of rows be validated in one call.
+_CONSTRAINT_ROWS_VALIDATOR = TypeAdapter(List[ConstraintRow]).validator
 
 
 TargetDimension = Literal[
@@ -367,7 +382,14 @@ class TargetRowSchema(BaseModel):
     floor_or_goal: Optional[str] = None
     notes: Optional[str] = None
 
-    model_config = {"extra": "ignore"}
+    # Not frozen: require_value_and_goal aligns dimension/dimension_key in place
+    model_config = ConfigDict(extra="ignore", hide_input_in_errors=True)
+
+    @model_validator(mode="before")
+    @classmethod
+    def blank_numbers_to_none(cls, data):
+        # Number parsing itself is left to pydantic-core's float validator
+        return _blank_to_none(data, ("target_value",))
 
     @field_validator("scenario_name", "constraint_set_name", "kpi_key", "dimension_key")
     @classmethod
@@ -379,16 +401,14 @@ class TargetRowSchema(BaseModel):
     @field_validator("dimension", mode="before")
     @classmethod
     def normalize_dimension(cls, v: Optional[str]) -> str:
-        if v is None or str(v).strip() == "":
-            return "country"
-        return str(v).strip().lower()
+        val = _norm(v) if v is not None else ""
+        return val or "country"
 
     @field_validator("dimension_key", mode="before")
     @classmethod
     def normalize_dimension_key(cls, v: Optional[str]) -> str:
-        if v is None or str(v).strip() == "":
-            return "all"
-        return str(v).strip().lower()
+        val = _norm(v) if v is not None else ""
+        return val or "all"
 
     @field_validator("baseline_value", mode="before")
     @classmethod
@@ -412,7 +432,7 @@ class TargetRowSchema(BaseModel):
         if self.floor_or_goal is None:
             raise ValueError("floor_or_goal is required")
         # If dimension_key is 'all' or dimension is 'all', align both
-        if self.dimension_key in {"all", "global", "total", "company"} or self.dimension == "all":
+        if self.dimension_key in _ALL_DIMENSION_ALIASES or self.dimension == "all":
             self.dimension = "all"
             self.dimension_key = "all"
         return self
@@ -423,16 +443,6 @@ class TargetRowSchema(BaseModel):
     # - Excludes KPI from weighted objective (no gap to close)
     # This is more flexible than rejecting at validation time.
 
-    @field_validator("target_value", mode="before")
-    @classmethod
-    def to_float(cls, v):
-        if v is None or v == "":
-            return None
-        try:
-            return float(v)
-        except Exception as e:  # noqa: BLE001
-            raise ValueError(f"invalid number: {v}") from e
-
     # NOTE: Negative target_value is allowed for signed KPIs
     # (e.g., profit/loss targets, NPS goals, contribution margins).
     # Example: baseline=-50000 (loss), target=100000 (profit goal) → gap=150000
@@ -440,16 +450,20 @@ class TargetRowSchema(BaseModel):
     @field_validator("floor_or_goal")
     @classmethod
     def validate_floor_goal(cls, v: Optional[str]) -> Optional[str]:
-        if v is None or str(v).strip() == "":
+        val = _norm(v) if v is not None else ""
+        if not val:
             return None
-        val = str(v).strip().lower()
-        if val not in {"floor", "goal"}:
+        if val not in _FLOOR_OR_GOAL:
             raise ValueError("floor_or_goal must be 'floor' or 'goal'")
         return val
 
 
 class ConstraintSetCompiled(BaseModel):
-    """Compiled, system-generated representation of a constraint set (not a sheet row)."""
+    """Compiled, system-generated representation of a constraint set (not a sheet row).
+
+    The compiler builds this (and BundleCompiled) via model_construct from already-validated
+    rows; only use that path for internally compiled data, never for raw sheet/API input.
+    """
 
     capacity_floors: List["CapacityFloor"] = Field(default_factory=list)
     capacity_caps: List["CapacityCap"] = Field(default_factory=list)
@@ -462,33 +476,40 @@ class ConstraintSetCompiled(BaseModel):
     synergy_bonuses: List[List[str]] = Field(default_factory=list)
     notes: Optional[str] = None
 
-    model_config = {"extra": "ignore"}
+    # Not frozen: the compiler appends to and dedupes these lists in place
+    model_config = ConfigDict(extra="ignore")
 
 
 class BundleCompiled(BaseModel):
     bundle_key: str
     members: List[str]
 
-    model_config = {"extra": "ignore"}
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+
+# Row-level validators for scenario/target tabs (skip BaseModel.__init__ kwargs unpacking)
+_SCENARIO_CONFIG_VALIDATOR = TypeAdapter(ScenarioConfigSchema).validator
+_TARGET_ROW_VALIDATOR = TypeAdapter(TargetRowSchema).validator
 
 
-class CapacityFloor(BaseModel):
+# Compiler outputs below are plain records (never validated from sheet input),
+# so they are slotted frozen dataclasses rather than pydantic models.
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CapacityFloor:
     dimension: str
     dimension_key: str
     min_tokens: float
 
-    model_config = {"extra": "ignore"}
 
-
-class CapacityCap(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CapacityCap:
     dimension: str
     dimension_key: str
     max_tokens: float
 
-    model_config = {"extra": "ignore"}
-
 
-class TargetConstraint(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class TargetConstraint:
     dimension: str
     dimension_key: str
     kpi_key: str
@@ -497,92 +518,184 @@ class TargetConstraint(BaseModel):
     target_value: float
     notes: Optional[str] = None
 
-    model_config = {"extra": "ignore"}
 
-
-# Ensure forward refs resolve when imported elsewhere
+# Ensure forward refs resolve when imported elsewhere. ConstraintRowBase references
+# ConstraintType/Dimension before they are defined, so it is otherwise left incomplete
+# until first use.
+ConstraintRowBase.model_rebuild()
 ConstraintSetCompiled.model_rebuild()
 
 
-def validate_constraint_row(row_num: int, data: dict) -> ValidationMessage:
-    errors: List[str] = []
+def _constraint_fields_normalized(data: dict) -> bool:
+    """True when _normalize_constraint_fields would leave data unchanged."""
+    get = data.get
+    if get("min_tokens") == "" or get("max_tokens") == "":
+        return False
+    dim_key = get("dimension_key")
+    if dim_key is not None and (not isinstance(dim_key, str) or not dim_key or dim_key != dim_key.strip()):
+        return False
+    if "constraint_type" in data and data["constraint_type"] != _norm(data["constraint_type"]).replace(" ", "_"):
+        return False
+    if "dimension" in data and data["dimension"] != _norm(data["dimension"]):
+        return False
+    if "constraint_set_name" in data and data["constraint_set_name"] != str(data["constraint_set_name"]).strip():
+        return False
+    return True
+
+
+def _normalize_constraint_fields(data: dict) -> str:
+    """Normalize a constraint row in place before union selection; return its row key.
+
+    Callers pass a copy unless they opted into inplace=True; the schema's own
+    before-validator normalizes a copy, so model validation never mutates its input. The key is taken before blank dimension_key / token
+    cells become None, so it shows the cells as the PM typed them.
+    """
+    if "constraint_type" in data:
+        data["constraint_type"] = _norm(data["constraint_type"]).replace(" ", "_")
+    if "dimension" in data:
+        data["dimension"] = _norm(data["dimension"])
+    dim_key = data.get("dimension_key")
+    if dim_key is not None:
+        dim_key = data["dimension_key"] = _strip(dim_key)
+    key = _constraint_row_key(data)
+    if "constraint_set_name" in data:
+        data["constraint_set_name"] = str(data["constraint_set_name"]).strip()
+    if dim_key == "":
+        data["dimension_key"] = None
+    # Blank token cells mean "not set"; pydantic-core parses the rest as floats
+    for field in ("min_tokens", "max_tokens"):
+        if data.get(field) == "":
+            data[field] = None
+    return key
+
+
+# A row with none of its signal fields filled (e.g. a notes-only trailer row) is
+# not a constraint/target at all, so it is skipped before schema validation.
+_CONSTRAINT_SIGNAL_FIELDS = ("scenario_name", "constraint_set_name", "constraint_type")
+_TARGET_SIGNAL_FIELDS = ("scenario_name", "constraint_set_name", "kpi_key")
+EMPTY_ROW_WARNING = "empty row - skipped"
+
+
+def _is_empty_row(data: dict, fields: Tuple[str, ...]) -> bool:
+    get = data.get
+    return not any(_strip(get(f) or "") for f in fields)
+
+
+def _empty_row_message(row_num: int) -> ValidationMessage:
+    return ValidationMessage(row_num=row_num, key="", warnings=(EMPTY_ROW_WARNING,))
+
+
+def _constraint_row_key(normalized: dict) -> str:
+    # constraint_type / dimension / dimension_key are already stripped strings (or None)
+    # in _normalize_constraint_fields; only the name columns still need stripping.
+    get = normalized.get
+    return (
+        f"{_strip(get('scenario_name', ''))}|{_strip(get('constraint_set_name', ''))}"
+        f"|{get('constraint_type', '')}|{get('dimension', '')}|{get('dimension_key', '')}"
+    ).strip("|")
+
+
+def _constraint_row_message(row_num: int, key: str, model, errors: List[str]) -> ValidationMessage:
     warnings: List[str] = []
-    # Normalize discriminator and dimension before union selection
-    normalized = dict(data)
-    if "constraint_type" in normalized:
-        normalized["constraint_type"] = str(normalized["constraint_type"]).strip().lower().replace(" ", "_")
-    if "dimension" in normalized:
-        normalized["dimension"] = str(normalized["dimension"]).strip().lower()
-    if "dimension_key" in normalized and normalized.get("dimension_key") is not None:
-        normalized["dimension_key"] = str(normalized["dimension_key"]).strip()
-    key = "|".join([
-        str(normalized.get("scenario_name", "")).strip(),
-        str(normalized.get("constraint_set_name", "")).strip(),
-        str(normalized.get("constraint_type", "")).strip(),
-        str(normalized.get("dimension", "")).strip(),
-        str(normalized.get("dimension_key", "")).strip(),
-    ]).strip("|")
-    try:
-        # Discriminated union enforces type-specific rules
-        _CONSTRAINT_ROW_ADAPTER.validate_python(normalized)
-    except ValidationError as ve:
-        errors = [err['msg'] for err in ve.errors()]
-    # Additional semantic check: min <= max when both present
-    try:
-        min_v = float(normalized["min_tokens"]) if normalized.get("min_tokens") not in (None, "") else None
-        max_v = float(normalized["max_tokens"]) if normalized.get("max_tokens") not in (None, "") else None
+    # Additional semantic check: min <= max when both present.
+    # Reuse the floats pydantic already coerced instead of re-parsing the raw row.
+    if model is not None:
+        min_v = model.min_tokens
+        max_v = model.max_tokens
         if min_v is not None and max_v is not None and min_v > max_v:
             errors.append("min_tokens cannot exceed max_tokens")
         if min_v is not None and min_v == 0:
             warnings.append("min_tokens is 0")
         if max_v is not None and max_v == 0:
             warnings.append("max_tokens is 0")
-    except Exception:
-        # numeric errors already captured
-        pass
-    return ValidationMessage(row_num=row_num, key=key, errors=errors, warnings=warnings)
-
-
-def validate_target_row(row_num: int, data: dict, valid_kpis: Optional[set[str]] = None) -> ValidationMessage:
+    return ValidationMessage(row_num=row_num, key=key, errors=tuple(errors), warnings=tuple(warnings))
+
+
+def validate_constraint_rows_batch(
+    rows: Sequence[Tuple[int, dict]],
+    *,
+    inplace: bool = False,
+) -> List[Tuple[ValidationMessage, Optional[ConstraintRowBase]]]:
+    """Validate many constraint rows with a single pydantic-core call.
+
+    Returns one (message, parsed_row) pair per input row, in order. parsed_row is the
+    type-specific ConstraintRow model, or None when the row failed schema validation.
+    With inplace=True the caller's row dicts are normalized directly instead of copied.
+    Rows with no scenario, constraint set or type get an EMPTY_ROW_WARNING and no model.
+    """
+    results: List[Tuple[ValidationMessage, Optional[ConstraintRowBase]]] = [
+        (_empty_row_message(row_num), None) for row_num, _ in rows
+    ]
+    live = [i for i, (_, data) in enumerate(rows) if not _is_empty_row(data, _CONSTRAINT_SIGNAL_FIELDS)]
+    if not live:
+        return results
+    normalized_rows = [rows[i][1] if inplace else dict(rows[i][1]) for i in live]
+    keys = [_normalize_constraint_fields(normalized) for normalized in normalized_rows]
+    errors_by_index: Dict[int, List[str]] = {}
+    try:
+        models: List[Optional[ConstraintRowBase]] = _CONSTRAINT_ROWS_VALIDATOR.validate_python(normalized_rows)
+    except ValidationError as ve:
+        for err in ve.errors():
+            errors_by_index.setdefault(cast(int, err["loc"][0]), []).append(err["msg"])
+        # A failed list validation yields no models; re-parse only the rows that were clean.
+        models = [
+            None if idx in errors_by_index else _CONSTRAINT_ROW_VALIDATOR.validate_python(normalized)
+            for idx, normalized in enumerate(normalized_rows)
+        ]
+    for idx, (i, key, model) in enumerate(zip(live, keys, models)):
+        results[i] = (
+            _constraint_row_message(rows[i][0], key, model, errors_by_index.get(idx, [])),
+            model,
+        )
+    return results
+
+
+def validate_constraint_row(row_num: int, data: dict, *, inplace: bool = False) -> ValidationMessage:
+    return validate_constraint_rows_batch([(row_num, data)], inplace=inplace)[0][0]
+
+
+def validate_target_row(
+    row_num: int, data: dict, valid_kpis: Optional[set[str]] = None, *, inplace: bool = False
+) -> ValidationMessage:
+    if _is_empty_row(data, _TARGET_SIGNAL_FIELDS):
+        return _empty_row_message(row_num)
     errors: List[str] = []
     warnings: List[str] = []
-    normalized = dict(data)
+    # inplace=True lets callers that own the row skip the defensive copy
+    normalized = data if inplace else dict(data)
     if "dimension" in normalized:
         normalized["dimension"] = str(normalized.get("dimension", "country")).strip().lower()
     if "dimension_key" in normalized:
         normalized["dimension_key"] = str(normalized["dimension_key"]).strip().lower()
     if "kpi_key" in normalized and normalized.get("kpi_key") is not None:
         normalized["kpi_key"] = str(normalized["kpi_key"]).strip()
-    key = "|".join([
-        str(normalized.get("scenario_name", "")).strip(),
-        str(normalized.get("constraint_set_name", "")).strip(),
-        str(normalized.get("dimension", "")).strip(),
-        str(normalized.get("dimension_key", "")).strip(),
-        str(normalized.get("kpi_key", "")).strip(),
-    ]).strip("|")
+    get = normalized.get
+    key = (
+        f"{_strip(get('scenario_name', ''))}|{_strip(get('constraint_set_name', ''))}"
+        f"|{get('dimension', '')}|{get('dimension_key', '')}|{get('kpi_key', '')}"
+    ).strip("|")
+    model = None
     try:
-        TargetRowSchema(**normalized)
+        model = _TARGET_ROW_VALIDATOR.validate_python(normalized)
     except ValidationError as ve:
         errors = [err['msg'] for err in ve.errors()]
     if valid_kpis is not None:
         kpi = str(normalized.get("kpi_key", "")).strip()
         if kpi and kpi not in valid_kpis:
             errors.append("kpi_key not found in Metrics_Config")
-    try:
-        tv = float(normalized["target_value"]) if normalized.get("target_value") not in (None, "") else None
-        if tv is not None and tv == 0:
-            warnings.append("target_value is 0")
-    except Exception:
-        pass
-    return ValidationMessage(row_num=row_num, key=key, errors=errors, warnings=warnings)
+    # target_value was already coerced by the schema; skip when validation failed
+    if model is not None and model.target_value == 0:
+        warnings.append("target_value is 0")
+    return ValidationMessage(row_num=row_num, key=key, errors=tuple(errors), warnings=tuple(warnings))
 
 
 def validate_scenario_config(row_num: int, data: dict, allowed_objective_modes: Optional[set[str]] = None, weights_required_modes: Optional[set[str]] = None) -> ValidationMessage:
     errors: List[str] = []
     warnings: List[str] = []
     key = str(data.get("name", "")).strip()
+    model = None
     try:
-        ScenarioConfigSchema(**data)
+        model = _SCENARIO_CONFIG_VALIDATOR.validate_python(data)
     except ValidationError as ve:
         errors = [err['msg'] for err in ve.errors()]
     if allowed_objective_modes is not None:
@@ -592,19 +705,17 @@ def validate_scenario_config(row_num: int, data: dict, allowed_objective_modes:
         if weights_required_modes and mode in weights_required_modes:
             if data.get("objective_weights_json") in (None, {}, "", []):
                 errors.append("objective_weights_json is required for this objective_mode")
-    weights = data.get("objective_weights_json")
+    # Weights were parsed and cleaned by the schema; shape errors are already captured
+    weights = model.objective_weights_json if model is not None else None
     if isinstance(weights, dict) and weights:
-        try:
-            total = float(sum(float(v) for v in weights.values()))
-            if total != 0 and not (0.99 <= total <= 1.01):
-                warnings.append("objective_weights_json does not sum to 1.0 (warning only)")
-        except Exception:
-            # shape errors are already caught in schema validation
-            pass
-    return ValidationMessage(row_num=row_num, key=key, errors=errors, warnings=warnings)
+        total = sum(weights.values())
+        if total != 0 and not (0.99 <= total <= 1.01):
+            warnings.append("objective_weights_json does not sum to 1.0 (warning only)")
+    return ValidationMessage(row_num=row_num, key=key, errors=tuple(errors), warnings=tuple(warnings))
 
 
 __all__ = [
+    "EMPTY_ROW_WARNING",
     "ValidationMessage",
     "ScenarioConfigSchema",
     "ConstraintRow",
@@ -614,6 +725,7 @@ __all__ = [
     "TargetConstraint",
     "ConstraintSetCompiled",
     "validate_constraint_row",
+    "validate_constraint_rows_batch",
     "validate_target_row",
     "validate_scenario_config",
 ]
@@ -29,6 +29,7 @@ class ObjectiveSpec(BaseModel):
     - weighted_kpis: Maximize weighted sum of multiple KPIs
     - lexicographic: Prioritize KPIs in strict order (future)
     """
+    # Not frozen: the problem builder fills north_star_kpi_key after construction
     model_config = ConfigDict(extra="ignore")
 
     mode: ObjectiveMode
@@ -74,7 +75,7 @@ class Candidate(BaseModel):
     IMPORTANT: This candidate has already passed deadline feasibility filtering.
     Solver should assume all candidates are time-feasible for the period.
     """
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     initiative_key: str
 
@@ -104,7 +105,7 @@ class ConstraintSetPayload(BaseModel):
     All governance constraints come from OptimizationConstraintSet, 
     NOT from Initiative-level fields (those have been removed).
     """
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     # Capacity bounds: {dimension: {dimension_key: value}}
     floors: Dict[str, Dict[str, float]] = Field(default_factory=dict)
@@ -130,7 +131,7 @@ class RunScope(BaseModel):
     - selected_only: PM explicitly selected candidates on Candidates sheet 
     - all_candidates: All DB candidates for period (is_optimization_candidate=True and period_key matches)
     """
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     type: ScopeType
     initiative_keys: Optional[List[str]] = None  # Required when type=selected_only
@@ -150,7 +151,7 @@ class OptimizationProblem(BaseModel):
     This object is persisted to OptimizationRun.inputs_snapshot_json for
     full reproducibility and audit trail.
     """
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     # Identity / lineage
     scenario_name: str
@@ -173,3 +174,23 @@ class OptimizationProblem(BaseModel):
     # Debuggable, snapshot-friendly metadata
     # PRODUCTION FIX: Store diagnostic info here (excluded candidates, filter stats, etc.)
     metadata: Dict[str, Any] = Field(default_factory=dict)
+
+    @classmethod
+    def from_trusted_snapshot(cls, snapshot: Dict[str, Any]) -> "OptimizationProblem":
+        """
+        Rehydrate a problem from OptimizationRun.inputs_snapshot_json without re-validating.
+
+        The snapshot was produced by model_dump() of an already-validated problem, so nested
+        models are rebuilt with model_construct. Use model_validate for any untrusted input.
+        """
+        return cls.model_construct(
+            scenario_name=snapshot["scenario_name"],
+            constraint_set_name=snapshot["constraint_set_name"],
+            period_key=snapshot.get("period_key"),
+            capacity_total_tokens=snapshot.get("capacity_total_tokens"),
+            objective=ObjectiveSpec.model_construct(**snapshot["objective"]),
+            candidates=[Candidate.model_construct(**c) for c in snapshot.get("candidates") or []],
+            constraint_set=ConstraintSetPayload.model_construct(**(snapshot.get("constraint_set") or {})),
+            scope=RunScope.model_construct(**snapshot["scope"]),
+            metadata=dict(snapshot.get("metadata") or {}),
+        )
@@ -9,16 +9,20 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
+from pydantic.dataclasses import dataclass
 from typing_extensions import Literal
 
 
 SolveStatus = Literal["optimal", "feasible", "infeasible", "model_invalid", "unknown"]
 
 
-class SelectedItem(BaseModel):
-    """A single candidate's selection status and allocated resources."""
-    
-    model_config = ConfigDict(extra="ignore")
+@dataclass(frozen=True, slots=True, config=ConfigDict(extra="ignore"))
+class SelectedItem:
+    """A single candidate's selection status and allocated resources.
+
+    A slotted pydantic dataclass rather than a BaseModel: one is created per
+    candidate on every solve, and it carries no model-level validators.
+    """
 
     initiative_key: str
     selected: bool
@@ -38,6 +42,7 @@ class OptimizationSolution(BaseModel):
     - Diagnostics for debugging
     """
     
+    # Hot solver-path model: built eagerly at import (no defer_build)
     model_config = ConfigDict(extra="ignore")
 
     status: SolveStatus
@@ -1,9 +1,12 @@
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class RoadmapBase(BaseModel):
+    # Core schema is built on first validation rather than at import
+    model_config = ConfigDict(defer_build=True)
+
     name: str
     description: Optional[str] = None
     timeframe_label: Optional[str] = None
@@ -19,4 +22,4 @@ class RoadmapRead(RoadmapBase):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
\ No newline at end of file
+    model_config = {"from_attributes": True, "frozen": True, "defer_build": True}
\ No newline at end of file
@@ -1,8 +1,12 @@
+import sys
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, field_validator
 
 
 class RoadmapEntryBase(BaseModel):
+    # Core schema is built on first validation rather than at import
+    model_config = ConfigDict(defer_build=True)
+
     roadmap_id: int
     initiative_id: int
     source_portfolio_item_id: Optional[int] = None
@@ -14,6 +18,12 @@ class RoadmapEntryBase(BaseModel):
     is_locked_in: bool = False
     notes: Optional[str] = None
 
+    @field_validator("planned_quarter")
+    @classmethod
+    def intern_planned_quarter(cls, v: Optional[str]) -> Optional[str]:
+        # Few distinct quarters ("Q1-2025", ...) across many entries
+        return sys.intern(v) if v is not None else v
+
 
 class RoadmapEntryCreate(RoadmapEntryBase):
     pass
@@ -22,4 +32,4 @@ class RoadmapEntryCreate(RoadmapEntryBase):
 class RoadmapEntryRead(RoadmapEntryBase):
     id: int
 
-    model_config = {"from_attributes": True}
\ No newline at end of file
+    model_config = {"from_attributes": True, "frozen": True, "defer_build": True}
\ No newline at end of file
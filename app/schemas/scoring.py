@@ -1,12 +1,13 @@
 # productroadmap_sheet_project/app/schemas/scoring.py
 
+import sys
 from datetime import datetime
 from typing import Any, Optional
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, field_validator
 
 
 class InitiativeMathModelRead(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
     
     id: int
     framework: str
@@ -20,7 +21,7 @@ class InitiativeMathModelRead(BaseModel):
 
 
 class InitiativeParamRead(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
     
     id: int
     initiative_id: int
@@ -39,8 +40,16 @@ class InitiativeParamRead(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+    @field_validator("framework")
+    @classmethod
+    def intern_framework(cls, v: str) -> str:
+        # Low-cardinality label repeated on every param row
+        return sys.intern(v)
+
 
 class InitiativeMathModelBase(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     framework: str = "MATH_MODEL"
     formula_text: str
     parameters_json: Optional[Any] = None
@@ -61,4 +70,10 @@ class InitiativeScoreRead(BaseModel):
     approved_by_user: bool = False
     created_at: datetime
 
-    model_config = {"from_attributes": True}
\ No newline at end of file
+    @field_validator("framework_name")
+    @classmethod
+    def intern_framework_name(cls, v: str) -> str:
+        # Low-cardinality label repeated on every score row
+        return sys.intern(v)
+
+    model_config = {"from_attributes": True, "frozen": True, "defer_build": True}
\ No newline at end of file
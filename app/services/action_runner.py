@@ -6,13 +6,16 @@ Action runner service for enqueuing and executing sheet-triggered actions.
 from __future__ import annotations
 
 import logging
+import threading
+import time
 import traceback
 import uuid
-from dataclasses import dataclass
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional, Set, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import insert, select, update
 from sqlalchemy.orm import Session
 
 from app.config import settings
@@ -20,7 +23,7 @@ from app.db.models.action_run import ActionRun
 from app.services.product_ops.scoring import ScoringFramework
 from app.services.product_ops.scoring_service import ScoringService
 
-from app.jobs.backlog_sync_job import run_all_backlog_sync
+from app.jobs.backlog_sync_job import run_all_backlog_sync, run_all_backlog_sync_for_keys
 from app.jobs.backlog_update_job import run_backlog_update
 from app.jobs.flow1_full_sync_job import run_flow1_full_sync
 from app.jobs.flow3_product_ops_job import run_flow3_write_scores_to_sheet, run_flow3_sync_inputs_to_initiatives, run_flow3_populate_initiatives
@@ -28,6 +31,7 @@ from app.jobs.flow2_scoring_activation_job import run_scoring_batch
 from app.jobs.sync_intake_job import run_sync_all_intake_sheets
 
 from app.sheets.client import SheetsClient, get_sheets_service
+from app.sheets.productops_writer import write_status_to_sheet
 from app.services.product_ops.math_model_service import MathModelSyncService
 from app.services.product_ops.metrics_config_sync_service import MetricsConfigSyncService
 from app.services.product_ops.params_sync_service import ParamsSyncService
@@ -53,12 +57,29 @@ STATUS_SUCCESS = "success"
 STATUS_FAILED = "failed"
 
 
+def _safe_dict(payload: Dict[str, Any], key: str) -> Dict[str, Any]:
+    """payload[key] if it is a dict, else {} (missing, None or malformed sections)."""
+    value = payload.get(key)
+    return value if isinstance(value, dict) else {}
+
+
 @dataclass(frozen=True)
 class ActionContext:
-    """Convenience wrapper around payload and resolved runtime dependencies."""
+    """Convenience wrapper around payload and resolved runtime dependencies.
+
+    sheet_context/options/scope are resolved from the payload once; each is
+    always a dict (non-dict payload values fall back to {}).
+    """
     payload: Dict[str, Any]
     sheets_client: SheetsClient
     llm_client: Optional[LLMClient]
+    sheet_context: Dict[str, Any] = field(init=False, repr=False)
+    options: Dict[str, Any] = field(init=False, repr=False)
+    scope: Dict[str, Any] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        for name in ("sheet_context", "options", "scope"):
+            object.__setattr__(self, name, _safe_dict(self.payload, name))
 
 
 ActionFn = Callable[[Session, ActionContext], Dict[str, Any]]
@@ -74,52 +95,95 @@ def _now() -> datetime:
     return datetime.now(timezone.utc)
 
 
-def _make_run_id() -> str:
+def _make_run_id(now: Optional[datetime] = None) -> str:
     # Example: run_20251221T120102Z_a1b2c3d4
-    ts = _now().strftime("%Y%m%dT%H%M%SZ")
+    ts = (now or _now()).strftime("%Y%m%dT%H%M%SZ")
     short = uuid.uuid4().hex[:8]
     return f"run_{ts}_{short}"
 
 
-def enqueue_action_run(db: Session, payload: Dict[str, Any]) -> ActionRun:
-    """Create an ActionRun row with status=queued and return the ORM object."""
-    run_id = _make_run_id()
-    action = str(payload.get("action") or "").strip()
+_PAYLOAD_DICT_FIELDS = ("sheet_context", "options", "scope", "requested_by")
+
+
+def _normalize_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of payload with a stripped action and dict-typed sections.
+
+    Non-dict sheet_context/options/scope/requested_by become {}; other keys pass through.
+    Stored as payload_json so executors and replays read the same shape.
+    """
+    normalized = dict(payload)
+    normalized["action"] = str(payload.get("action") or "").strip()
+    for name in _PAYLOAD_DICT_FIELDS:
+        normalized[name] = _safe_dict(payload, name)
+    return normalized
+
+
+def _build_action_run_mapping(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate a payload and build the column values for a new queued ActionRun."""
+    created_at = _now()
+    run_id = _make_run_id(created_at)
+    payload = _normalize_payload(payload)
+    action = payload["action"]
     if not action:
         raise ValueError("payload.action is required")
     
     # Validate action exists in registry to prevent poison jobs
-    if action not in _ACTION_REGISTRY:
-        raise ValueError(f"Unknown action: {action}. Valid actions: {', '.join(sorted(_ACTION_REGISTRY.keys()))}")
-
-    requested_by = payload.get("requested_by") or {}
-    sheet_ctx = payload.get("sheet_context") or {}
-    scope = payload.get("scope") or {}
-
-    ar = ActionRun(
-        run_id=run_id,
-        action=action,
-        status=STATUS_QUEUED,
-        payload_json=payload,
-        requested_by_email=(requested_by.get("user_email") if isinstance(requested_by, dict) else None),
-        requested_by_ui=(requested_by.get("ui") if isinstance(requested_by, dict) else None),
-        spreadsheet_id=(sheet_ctx.get("spreadsheet_id") if isinstance(sheet_ctx, dict) else None),
-        tab_name=(sheet_ctx.get("tab") if isinstance(sheet_ctx, dict) else None),
-        scope_type=(scope.get("type") if isinstance(scope, dict) else None),
-        scope_summary=_build_scope_summary(scope),
-        created_at=_now(),
-    )
+    if action not in _ACTION_KEYS:
+        raise ValueError(f"Unknown action: {action}. Valid actions: {_ACTION_KEYS_CSV}")
+
+    requested_by = payload["requested_by"]
+    sheet_ctx = payload["sheet_context"]
+    scope = payload["scope"]
+
+    return {
+        "run_id": run_id,
+        "action": action,
+        "status": STATUS_QUEUED,
+        "payload_json": payload,
+        "requested_by_email": requested_by.get("user_email"),
+        "requested_by_ui": requested_by.get("ui"),
+        "spreadsheet_id": sheet_ctx.get("spreadsheet_id"),
+        "tab_name": sheet_ctx.get("tab"),
+        "scope_type": scope.get("type"),
+        "scope_summary": _build_scope_summary(scope),
+        "created_at": created_at,
+    }
+
+
+def enqueue_action_run(db: Session, payload: Dict[str, Any]) -> ActionRun:
+    """Create an ActionRun row with status=queued and return the ORM object."""
+    ar = ActionRun(**_build_action_run_mapping(payload))
     db.add(ar)
     db.commit()
     db.refresh(ar)
 
-    logger.info(
-        "action_run.enqueued",
-        extra={"run_id": ar.run_id, "action": ar.action, "status": ar.status},
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "action_run.enqueued",
+            extra={"run_id": ar.run_id, "action": ar.action, "status": STATUS_QUEUED},
+        )
     return ar
 
 
+def enqueue_action_runs(db: Session, payloads: List[Dict[str, Any]]) -> List[str]:
+    """Create queued ActionRun rows for many payloads in one INSERT; return their run_ids.
+
+    All payloads are validated before anything is written, so an invalid payload
+    enqueues nothing (ValueError, same messages as enqueue_action_run).
+    """
+    mappings = [_build_action_run_mapping(p) for p in payloads]
+    if not mappings:
+        return []
+
+    db.execute(insert(ActionRun), mappings)
+    db.commit()
+
+    run_ids = [m["run_id"] for m in mappings]
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("action_run.enqueued_bulk", extra={"count": len(run_ids), "run_ids": run_ids})
+    return run_ids
+
+
 def _build_scope_summary(scope: Any) -> Optional[str]:
     """Short human-friendly text for UI display (action runs table, Apps Script response)."""
     if not isinstance(scope, dict):
@@ -141,284 +205,267 @@ def _build_scope_summary(scope: Any) -> Optional[str]:
     return str(t) if t else None
 
 
-def _extract_summary(action: str, result: Dict[str, Any]) -> Dict[str, Any]:
-    """Extract standardized summary from action-specific result for UI display.
-    
-    Returns a normalized dict with common fields:
-    - total: total items processed/considered
-    - success: items successfully processed
-    - skipped: items skipped
-    - failed: items failed (if applicable)
-    """
-    summary = {
-        "total": 0,
-        "success": 0,
-        "skipped": 0,
-        "failed": 0,
-    }
-    
-    # Flow 3 actions
-    if action == "flow3.compute_all_frameworks":
-        summary["total"] = result.get("processed", 0)
-        summary["success"] = result.get("processed", 0)
-    
-    elif action == "flow3.write_scores":
-        summary["total"] = result.get("updated_initiatives", 0)
-        summary["success"] = result.get("updated_initiatives", 0)
-    
-    elif action == "flow3.sync_inputs":
-        summary["total"] = result.get("updated", 0)
-        summary["success"] = result.get("updated", 0)
-    
-    # Flow 2 actions
-    elif action == "flow2.activate":
-        summary["total"] = result.get("activated", 0)
-        summary["success"] = result.get("activated", 0)
-    
-    # Flow 1 actions
-    elif action == "flow1.backlog_sync":
-        # Boolean flag, treat as single-unit task for UX clarity
-        synced = bool(result.get("synced"))
-        summary["total"] = 1
-        summary["success"] = 1 if synced else 0
-        summary["failed"] = 0 if synced else 1
-    
-    elif action == "flow1.full_sync":
-        # Count completed substeps
-        substeps = result.get("substeps", [])
-        summary["total"] = 3  # Expected substeps
-        summary["success"] = len(substeps)
-        summary["intake_archived"] = result.get("intake_archived", 0)
-        summary["intake_unarchived"] = result.get("intake_unarchived", 0)
-        summary["archived_rows_excluded"] = result.get("archived_rows_excluded", 0)
-        # Check for partial failure
-        if not result.get("backlog_update_completed", True):
-            summary["failed"] = 1
-    
-    # Flow 4 actions
-    elif action == "flow4.suggest_mathmodels":
-        # Stats from run_math_model_generation_job
-        summary["total"] = result.get("rows", 0)
-        summary["success"] = result.get("suggested", 0)
-        summary["skipped"] = (
+# ----------------------------
+# Run summaries (UI)
+# ----------------------------
+# Every summary carries total/success/skipped/failed; some actions append extra counters.
+SummaryFn = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+
+def _summary(total: Any = 0, success: Any = 0, skipped: Any = 0, failed: Any = 0) -> Dict[str, Any]:
+    return {"total": total, "success": success, "skipped": skipped, "failed": failed}
+
+
+def _summary_zero(result: Dict[str, Any]) -> Dict[str, Any]:
+    return _summary()
+
+
+def _summary_skipped_job() -> Dict[str, Any]:
+    # Guided skip (_pm_guided_skip): a single skipped unit
+    return _summary(total=1, skipped=1)
+
+
+def _summary_count(key: str) -> SummaryFn:
+    """Summary where a single counter is both total and success."""
+    def extract(result: Dict[str, Any]) -> Dict[str, Any]:
+        n = result.get(key, 0)
+        return _summary(total=n, success=n)
+    return extract
+
+
+def _summary_synced_flag(result: Dict[str, Any]) -> Dict[str, Any]:
+    # Boolean flag, treat as single-unit task for UX clarity
+    synced = bool(result.get("synced"))
+    return _summary(total=1, success=1 if synced else 0, failed=0 if synced else 1)
+
+
+def _summary_flow1_full_sync(result: Dict[str, Any]) -> Dict[str, Any]:
+    # Count completed substeps (3 expected)
+    summary = _summary(total=3, success=len(result.get("substeps", [])))
+    summary["intake_archived"] = result.get("intake_archived", 0)
+    summary["intake_unarchived"] = result.get("intake_unarchived", 0)
+    summary["archived_rows_excluded"] = result.get("archived_rows_excluded", 0)
+    # Check for partial failure
+    if not result.get("backlog_update_completed", True):
+        summary["failed"] = 1
+    return summary
+
+
+def _summary_flow4_suggest_mathmodels(result: Dict[str, Any]) -> Dict[str, Any]:
+    # Stats from run_math_model_generation_job
+    return _summary(
+        total=result.get("rows", 0),
+        success=result.get("suggested", 0),
+        skipped=(
             result.get("skipped_approved", 0)
             + result.get("skipped_no_desc", 0)
             + result.get("skipped_has_suggestion", 0)
             + result.get("skipped_missing_initiative", 0)
-        )
-    
-    elif action == "flow4.seed_params":
-        summary["total"] = result.get("rows_scanned_mathmodelstab", 0)
-        summary["success"] = result.get("seeded_params_paramsstab", 0)
-        summary["skipped"] = (
+        ),
+    )
+
+
+def _summary_flow4_seed_params(result: Dict[str, Any]) -> Dict[str, Any]:
+    return _summary(
+        total=result.get("rows_scanned_mathmodelstab", 0),
+        success=result.get("seeded_params_paramsstab", 0),
+        skipped=(
             result.get("skipped_row_mathmodeltab_no_missing", 0) +
             result.get("skipped_row_mathmodeltab_unapproved", 0) +
             result.get("skipped_row_mathmodeltab_no_identifiers", 0) +
             result.get("skipped_row_mathmodeltab_invalid_formula", 0)
-        )
-    
-    elif action == "flow4.sync_mathmodels":
-        # Stats from MathModelSyncService.sync_sheet_to_db
-        summary["total"] = result.get("row_count", 0)
-        summary["success"] = result.get("updated", 0)
-        summary["skipped"] = result.get("skipped_no_initiative", 0) + result.get("skipped_no_formula", 0)
-
-    elif action == "flow4.sync_params":
-        # Stats from ParamsSyncService.sync_sheet_to_db
-        summary["total"] = result.get("row_count", 0)
-        summary["success"] = result.get("upserts", 0)
-        summary["skipped"] = result.get("skipped_no_initiative", 0) + result.get("skipped_no_name", 0)
-    
-    # Flow 0 actions
-    elif action == "flow0.intake_sync":
-        # Boolean flag, treat as single-unit task for UX clarity
-        synced = bool(result.get("synced"))
-        summary["total"] = 1
-        summary["success"] = 1 if synced else 0
-        summary["failed"] = 0 if synced else 1
-    
+        ),
+    )
+
+
+def _summary_flow4_sync_mathmodels(result: Dict[str, Any]) -> Dict[str, Any]:
+    # Stats from MathModelSyncService.sync_sheet_to_db
+    return _summary(
+        total=result.get("row_count", 0),
+        success=result.get("updated", 0),
+        skipped=result.get("skipped_no_initiative", 0) + result.get("skipped_no_formula", 0),
+    )
+
+
+def _summary_flow4_sync_params(result: Dict[str, Any]) -> Dict[str, Any]:
+    # Stats from ParamsSyncService.sync_sheet_to_db
+    return _summary(
+        total=result.get("row_count", 0),
+        success=result.get("upserts", 0),
+        skipped=result.get("skipped_no_initiative", 0) + result.get("skipped_no_name", 0),
+    )
+
+
+def _summary_pm_backlog_sync(result: Dict[str, Any]) -> Dict[str, Any]:
+    # Two-step PM refresh: intake sync -> backlog write
+    summary = _summary(total=2, success=len(result.get("substeps", [])))
+    # Include counts for AppScript display
+    summary["updated_count"] = result.get("updated_count", 0)
+    summary["cells_updated"] = result.get("cells_updated", 0)
+    summary["initiatives_written"] = result.get("initiatives_written", 0)
+    summary["intake_created"] = result.get("intake_created", 0)
+    summary["intake_updated"] = result.get("intake_updated", 0)
+    summary["intake_archived"] = result.get("intake_archived", 0)
+    summary["intake_unarchived"] = result.get("intake_unarchived", 0)
+    summary["archived_rows_excluded"] = result.get("archived_rows_excluded", 0)
+    summary["intake_deleted"] = result.get("intake_deleted", 0)
+    return summary
+
+
+def _summary_pm_selection(result: Dict[str, Any]) -> Dict[str, Any]:
+    # pm.score_selected / pm.switch_framework: success = selected minus failures
+    if result.get("status") == "skipped":
+        return _summary_skipped_job()
+    selected_count = result.get("selected_count", 0)
+    skipped = result.get("skipped_no_key", 0)
+    failed = result.get("failed_count", 0)
+    return _summary(total=selected_count + skipped, success=selected_count - failed, skipped=skipped, failed=failed)
+
+
+def _summary_pm_explain_selection(result: Dict[str, Any]) -> Dict[str, Any]:
+    ok = result.get("status") == "ok"
+    return _summary(
+        total=result.get("input_candidates_count", 0),
+        success=1 if ok else 0,
+        failed=0 if ok else 1,
+        skipped=1 if result.get("status") == "skipped" else 0,
+    )
+
+
+def _summary_pm_save_selected(result: Dict[str, Any]) -> Dict[str, Any]:
+    if result.get("status") == "skipped":
+        return _summary_skipped_job()
+    skipped = result.get("skipped_no_key", 0)
+    return _summary(
+        total=result.get("selected_count", 0) + skipped,
+        success=result.get("saved_count", 0),
+        skipped=skipped,
+        failed=result.get("failed_count", 0),
+    )
+
+
+def _summary_pm_save_optimization(result: Dict[str, Any]) -> Dict[str, Any]:
+    synced_scenarios = result.get("synced_scenarios", 0)
+    synced_constraints = result.get("synced_constraints", 0)
+    synced_candidates = result.get("synced_candidates", 0)
+    total_synced = result.get("total_synced", synced_scenarios + synced_constraints + synced_candidates)
+    errors = result.get("errors", []) or []
+    return _summary(total=total_synced, success=total_synced, failed=len(errors))
+
+
+def _summary_pm_status_counts(result: Dict[str, Any]) -> Dict[str, Any]:
+    # Total = all keys (valid + invalid); Success = OK statuses; Skipped = blank keys + logic skips; Failed = FAILED statuses
+    if result.get("status") == "skipped":
+        return _summary_skipped_job()
+    skipped_no_key = result.get("skipped_no_key", 0)
+    return _summary(
+        total=result.get("selected_count", 0) + skipped_no_key,
+        success=result.get("ok_count", 0),
+        skipped=skipped_no_key + result.get("skipped_count", 0),
+        failed=result.get("failed_count", 0),
+    )
+
+
+def _summary_pm_sync_backlog_db(result: Dict[str, Any]) -> Dict[str, Any]:
+    if result.get("status") == "skipped":
+        return _summary_skipped_job()
+    summary = _summary_pm_status_counts(result)
+    summary["rows_updated"] = result.get("rows_updated", 0)
+    summary["no_op_count"] = result.get("no_op_count", 0)
+    summary["db_rows_updated"] = result.get("db_rows_updated", result.get("db_updated", 0))
+    summary["db_fields_updated"] = result.get("db_fields_updated", 0)
+    summary["sheet_rows_updated"] = result.get("sheet_updated", 0)
+    summary["sheet_fields_updated"] = result.get("sheet_fields_updated", 0)
+    summary["changes_log"] = result.get("changes_log", {})
+    return summary
+
+
+def _summary_pm_populate_initiatives(result: Dict[str, Any]) -> Dict[str, Any]:
+    if result.get("status") == "skipped":
+        return _summary_skipped_job()
+    # Total = all optimization candidates in DB
+    # Success = newly added to sheet
+    # Skipped = already existed in sheet
+    # titles_backfilled is tracked separately for PM-facing UX
+    # Failed = failed_count (if any)
+    summary = _summary(
+        total=result.get("total_candidates", 0),
+        success=result.get("newly_added", 0),
+        skipped=result.get("existing_in_sheet", 0),
+        failed=result.get("failed_count", 0),
+    )
+    summary["titles_backfilled"] = result.get("titles_backfilled", 0)
+    return summary
+
+
+def _summary_pm_populate_candidates(result: Dict[str, Any]) -> Dict[str, Any]:
+    if result.get("status") == "skipped":
+        return _summary_skipped_job()
+    return _summary(
+        total=result.get("populated_count", 0) + result.get("skipped_no_key", 0),
+        success=result.get("populated_count", 0),
+        skipped=result.get("skipped_no_key", 0),
+        failed=result.get("failed_count", 0),
+    )
+
+
+def _summary_pm_optimize(result: Dict[str, Any]) -> Dict[str, Any]:
+    # Total = candidates considered; Success = initiatives selected by solver; Failed = 1 if optimization failed
+    selected = result.get("selected_initiatives_count", 0)
+    opt_status = result.get("optimization_status", "unknown")
+    return _summary(
+        total=result.get("input_candidates_count", 0),
+        success=selected if opt_status in {"success", "infeasible"} else 0,
+        failed=1 if opt_status == "failed" else 0,
+    )
+
+
+_SUMMARY_EXTRACTORS: Dict[str, SummaryFn] = {
+    # Flow 3
+    "flow3.compute_all_frameworks": _summary_count("processed"),
+    "flow3.write_scores": _summary_count("updated_initiatives"),
+    "flow3.sync_inputs": _summary_count("updated"),
+    # Flow 2
+    "flow2.activate": _summary_count("activated"),
+    # Flow 1
+    "flow1.backlog_sync": _summary_synced_flag,
+    "flow1.full_sync": _summary_flow1_full_sync,
+    # Flow 4
+    "flow4.suggest_mathmodels": _summary_flow4_suggest_mathmodels,
+    "flow4.seed_params": _summary_flow4_seed_params,
+    "flow4.sync_mathmodels": _summary_flow4_sync_mathmodels,
+    "flow4.sync_params": _summary_flow4_sync_params,
+    # Flow 0
+    "flow0.intake_sync": _summary_synced_flag,
     # PM jobs
-    elif action == "pm.backlog_sync":
-        # Two-step PM refresh: intake sync -> backlog write
-        substeps = result.get("substeps", [])
-        summary["total"] = 2
-        summary["success"] = len(substeps)
-        # Include counts for AppScript display
-        summary["updated_count"] = result.get("updated_count", 0)
-        summary["cells_updated"] = result.get("cells_updated", 0)
-        summary["initiatives_written"] = result.get("initiatives_written", 0)
-        summary["intake_created"] = result.get("intake_created", 0)
-        summary["intake_updated"] = result.get("intake_updated", 0)
-        summary["intake_archived"] = result.get("intake_archived", 0)
-        summary["intake_unarchived"] = result.get("intake_unarchived", 0)
-        summary["archived_rows_excluded"] = result.get("archived_rows_excluded", 0)
-        summary["intake_deleted"] = result.get("intake_deleted", 0)
-    
-    elif action == "pm.score_selected":
-        if result.get("status") == "skipped":
-            summary["total"] = 1
-            summary["skipped"] = 1
-            return summary
-        selected_count = result.get("selected_count", 0)
-        skipped = result.get("skipped_no_key", 0)
-        failed = result.get("failed_count", 0)
-        summary["total"] = selected_count + skipped
-        summary["success"] = selected_count - failed
-        summary["skipped"] = skipped
-        summary["failed"] = failed
-    
-    elif action == "pm.switch_framework":
-        if result.get("status") == "skipped":
-            summary["total"] = 1
-            summary["skipped"] = 1
-            return summary
-        selected_count = result.get("selected_count", 0)
-        skipped = result.get("skipped_no_key", 0)
-        failed = result.get("failed_count", 0)
-        summary["total"] = selected_count + skipped
-        summary["success"] = selected_count - failed
-        summary["skipped"] = skipped
-        summary["failed"] = failed
-
-    elif action == "pm.explain_selection":
-        summary["total"] = result.get("input_candidates_count", 0)
-        summary["success"] = 1 if result.get("status") == "ok" else 0
-        summary["failed"] = 0 if result.get("status") == "ok" else 1
-        summary["skipped"] = 1 if result.get("status") == "skipped" else 0
-
-    elif action == "pm.save_selected":
-        if result.get("status") == "skipped":
-            summary["total"] = 1
-            summary["skipped"] = 1
-            return summary
-        selected_count = result.get("selected_count", 0)
-        skipped = result.get("skipped_no_key", 0)
-        failed = result.get("failed_count", 0)
-        saved = result.get("saved_count", 0)
-        summary["total"] = selected_count + skipped
-        summary["success"] = saved
-        summary["skipped"] = skipped
-        summary["failed"] = failed
-
-    elif action == "pm.save_optimization":
-        synced_scenarios = result.get("synced_scenarios", 0)
-        synced_constraints = result.get("synced_constraints", 0)
-        synced_candidates = result.get("synced_candidates", 0)
-        total_synced = result.get("total_synced", synced_scenarios + synced_constraints + synced_candidates)
-        errors = result.get("errors", []) or []
-        summary["total"] = total_synced
-        summary["success"] = total_synced
-        summary["failed"] = len(errors)
-
-    elif action == "pm.suggest_math_model_llm":
-        if result.get("status") == "skipped":
-            summary["total"] = 1
-            summary["skipped"] = 1
-            return summary
-        selected_count = result.get("selected_count", 0)
-        skipped_no_key = result.get("skipped_no_key", 0)
-        ok_count = result.get("ok_count", 0)
-        skipped_count = result.get("skipped_count", 0)
-        failed_count = result.get("failed_count", 0)
-        # Total = all keys (valid + invalid); Success = OK (suggested); Skipped = blank keys + logic skips; Failed = FAILED statuses
-        summary["total"] = selected_count + skipped_no_key
-        summary["success"] = ok_count
-        summary["skipped"] = skipped_no_key + skipped_count
-        summary["failed"] = failed_count
-
-    elif action == "pm.generate_llm_summary":
-        if result.get("status") == "skipped":
-            summary["total"] = 1
-            summary["skipped"] = 1
-            return summary
-        selected_count = result.get("selected_count", 0)
-        skipped_no_key = result.get("skipped_no_key", 0)
-        summary["total"] = selected_count + skipped_no_key
-        summary["success"] = result.get("ok_count", 0)
-        summary["skipped"] = skipped_no_key + result.get("skipped_count", 0)
-        summary["failed"] = result.get("failed_count", 0)
-
-    elif action == "pm.sync_backlog_db":
-        if result.get("status") == "skipped":
-            summary["total"] = 1
-            summary["skipped"] = 1
-            return summary
-        selected_count = result.get("selected_count", 0)
-        skipped_no_key = result.get("skipped_no_key", 0)
-        summary["total"] = selected_count + skipped_no_key
-        summary["success"] = result.get("ok_count", 0)
-        summary["skipped"] = skipped_no_key + result.get("skipped_count", 0)
-        summary["failed"] = result.get("failed_count", 0)
-        summary["rows_updated"] = result.get("rows_updated", 0)
-        summary["no_op_count"] = result.get("no_op_count", 0)
-        summary["db_rows_updated"] = result.get("db_rows_updated", result.get("db_updated", 0))
-        summary["db_fields_updated"] = result.get("db_fields_updated", 0)
-        summary["sheet_rows_updated"] = result.get("sheet_updated", 0)
-        summary["sheet_fields_updated"] = result.get("sheet_fields_updated", 0)
-        summary["changes_log"] = result.get("changes_log", {})
-
-    elif action == "pm.seed_math_params":
-        if result.get("status") == "skipped":
-            summary["total"] = 1
-            summary["skipped"] = 1
-            return summary
-        selected_count = result.get("selected_count", 0)
-        skipped_no_key = result.get("skipped_no_key", 0)
-        ok_count = result.get("ok_count", 0)
-        skipped_count = result.get("skipped_count", 0)
-        failed_count = result.get("failed_count", 0)
-        # Total = all keys (valid + invalid); Success = OK statuses; Skipped = blank keys + logic skips; Failed = FAILED statuses
-        summary["total"] = selected_count + skipped_no_key
-        summary["success"] = ok_count
-        summary["skipped"] = skipped_no_key + skipped_count
-        summary["failed"] = failed_count
-
-    elif action == "pm.populate_initiatives":
-        if result.get("status") == "skipped":
-            summary["total"] = 1
-            summary["skipped"] = 1
-        else:
-            # Total = all optimization candidates in DB
-            # Success = newly added to sheet
-            # Skipped = already existed in sheet
-            # titles_backfilled is tracked separately for PM-facing UX
-            # Failed = failed_count (if any)
-            summary["total"] = result.get("total_candidates", 0)
-            summary["success"] = result.get("newly_added", 0)
-            summary["skipped"] = result.get("existing_in_sheet", 0)
-            summary["failed"] = result.get("failed_count", 0)
-            summary["titles_backfilled"] = result.get("titles_backfilled", 0)
-
-    elif action == "pm.populate_candidates":
-        if result.get("status") == "skipped":
-            summary["total"] = 1
-            summary["skipped"] = 1
-        else:
-            summary["total"] = result.get("populated_count", 0) + result.get("skipped_no_key", 0)
-            summary["success"] = result.get("populated_count", 0)
-            summary["skipped"] = result.get("skipped_no_key", 0)
-            summary["failed"] = result.get("failed_count", 0)
-    
+    "pm.backlog_sync": _summary_pm_backlog_sync,
+    "pm.score_selected": _summary_pm_selection,
+    "pm.switch_framework": _summary_pm_selection,
+    "pm.explain_selection": _summary_pm_explain_selection,
+    "pm.save_selected": _summary_pm_save_selected,
+    "pm.save_optimization": _summary_pm_save_optimization,
+    "pm.suggest_math_model_llm": _summary_pm_status_counts,
+    "pm.generate_llm_summary": _summary_pm_status_counts,
+    "pm.sync_backlog_db": _summary_pm_sync_backlog_db,
+    "pm.seed_math_params": _summary_pm_status_counts,
+    "pm.populate_initiatives": _summary_pm_populate_initiatives,
+    "pm.populate_candidates": _summary_pm_populate_candidates,
     # PM optimization jobs (Flow 5)
-    elif action == "pm.optimize_run_selected_candidates":
-        input_count = result.get("input_candidates_count", 0)
-        selected = result.get("selected_initiatives_count", 0)
-        opt_status = result.get("optimization_status", "unknown")
-        # Total = candidates considered; Success = initiatives selected by solver; Failed = 1 if optimization failed
-        summary["total"] = input_count
-        summary["success"] = selected if opt_status in {"success", "infeasible"} else 0
-        summary["failed"] = 1 if opt_status == "failed" else 0
-    
-    elif action == "pm.optimize_run_all_candidates":
-        input_count = result.get("input_candidates_count", 0)
-        selected = result.get("selected_initiatives_count", 0)
-        opt_status = result.get("optimization_status", "unknown")
-        # Total = all candidates in scenario; Success = initiatives selected by solver; Failed = 1 if optimization failed
-        summary["total"] = input_count
-        summary["success"] = selected if opt_status in {"success", "infeasible"} else 0
-        summary["failed"] = 1 if opt_status == "failed" else 0
+    "pm.optimize_run_selected_candidates": _summary_pm_optimize,
+    "pm.optimize_run_all_candidates": _summary_pm_optimize,
+}
+
+
+def _extract_summary(action: str, result: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract standardized summary from action-specific result for UI display.
     
-    return summary
+    Returns a normalized dict with common fields:
+    - total: total items processed/considered
+    - success: items successfully processed
+    - skipped: items skipped
+    - failed: items failed (if applicable)
+    """
+    return _SUMMARY_EXTRACTORS.get(action, _summary_zero)(result)
 
 
 def _pm_guided_skip(
@@ -534,74 +581,182 @@ def execute_next_queued_run(db: Session) -> Optional[ActionRun]:
     run = _claim_one_queued(db)
     if not run:
         return None
+    return _execute_claimed_run(db, run)
+
 
-    logger.info("action_run.start", extra={"run_id": run.run_id, "action": run.action})
+def execute_queued_runs(db: Session, max_runs: int = 10, max_seconds: Optional[float] = None) -> List[ActionRun]:
+    """
+    Claim up to max_runs queued ActionRuns in one statement and execute them back-to-back.
+
+    All runs share the given Session (one connection checkout for the batch); each run
+    still commits on its own. If max_seconds elapses, runs not yet started are put back
+    to queued for other workers. Returns the executed runs (empty if none were queued).
+    """
+    runs = _claim_n_queued(db, max_runs)
+    if not runs:
+        return []
+
+    deadline = time.monotonic() + max_seconds if max_seconds is not None else None
+    executed: List[ActionRun] = []
+    for i, run in enumerate(runs):
+        if deadline is not None and executed and time.monotonic() >= deadline:
+            _requeue_runs(db, runs[i:])
+            break
+        try:
+            executed.append(_execute_claimed_run(db, run))
+        except Exception:
+            # Failure while recording the failure itself; keep the rest of the batch going
+            logger.exception("action_run.batch_item_error", extra={"run_id": run.run_id, "action": run.action})
+            try:
+                db.rollback()
+            except Exception:
+                pass
+    return executed
+
+
+def _execute_claimed_run(db: Session, run: ActionRun) -> ActionRun:
+    """
+    Execute a run already claimed as running and persist its outcome.
+
+    run is detached (see _commit_claimed); the outcome is written with a Core UPDATE
+    and mirrored onto run so callers see the final state without a reload.
+    """
+    # Same extras for start/success/failed; built once per run
+    run_pk = run.id
+    action: str = run.action  # type: ignore[assignment]
+    log_extra = {"run_id": run.run_id, "action": action}
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("action_run.start", extra=log_extra)
 
     try:
-        ctx = _build_action_context(run.payload_json)  # type: ignore[arg-type]
-        fn = _resolve_action(run.action)  # type: ignore[arg-type]
+        ctx = _build_action_context(run.payload_json, action)  # type: ignore[arg-type]
+        fn = _resolve_action(action)
         result = fn(db, ctx)
         
         # Wrap result with normalized summary for UI consistency
-        summary = _extract_summary(run.action, result)  # type: ignore[arg-type]
+        summary = _extract_summary(action, result)
         wrapped_result = {
             "raw": result,
             "summary": summary,
         }
 
-        run.status = STATUS_SUCCESS  # type: ignore[assignment]
-        run.result_json = wrapped_result  # type: ignore[assignment]
-        run.error_text = None  # type: ignore[assignment]
-        run.finished_at = _now()  # type: ignore[assignment]
-
+        # Record the outcome with one UPDATE of just these columns, mirroring the failure path
+        outcome = {
+            "status": STATUS_SUCCESS,
+            "result_json": wrapped_result,
+            "error_text": None,
+            "finished_at": _now(),
+        }
+        db.execute(
+            update(ActionRun)
+            .where(ActionRun.id == run_pk)
+            .values(**outcome)
+            .execution_options(synchronize_session=False)
+        )
         db.commit()
-        logger.info("action_run.success", extra={"run_id": run.run_id, "action": run.action})
+        _apply_outcome(run, outcome)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("action_run.success", extra=log_extra)
         return run
 
-    except Exception:
+    except Exception as exc:
         # record failure; do not re-raise to keep worker alive
         try:
             db.rollback()
         except Exception:
             pass
 
-        # re-load the run row and mark failed
-        run = db.query(ActionRun).filter(ActionRun.id == run.id).one()
-        run.status = STATUS_FAILED  # type: ignore[assignment]
-        
-        # Store full traceback (truncated) for debugging
-        error_msg = traceback.format_exc()
-        if len(error_msg) > 5000:
-            error_msg = error_msg[:5000] + "... (truncated)"
-        run.error_text = error_msg  # type: ignore[assignment]
-        
-        run.finished_at = _now()  # type: ignore[assignment]
+        # mark failed with a single UPDATE (no reload)
+        outcome = {
+            "status": STATUS_FAILED,
+            # Store traceback (truncated) for debugging
+            "error_text": _format_error_text(exc),
+            "finished_at": _now(),
+        }
+        db.execute(
+            update(ActionRun)
+            .where(ActionRun.id == run_pk)
+            .values(**outcome)
+            .execution_options(synchronize_session=False)
+        )
         db.commit()
+        _apply_outcome(run, outcome)
 
-        logger.exception("action_run.failed", extra={"run_id": run.run_id, "action": run.action})
+        logger.exception("action_run.failed", extra=log_extra)
         return run
 
 
+def _apply_outcome(run: ActionRun, values: Dict[str, Any]) -> None:
+    """Mirror persisted outcome columns onto a detached run (no SQL is issued)."""
+    for key, value in values.items():
+        setattr(run, key, value)
+
+
+_ERROR_TEXT_MAX_CHARS = 5000
+_ERROR_TEXT_MAX_FRAMES = 40
+
+
+def _format_error_text(exc: BaseException) -> str:
+    """Format a traceback for ActionRun.error_text.
+
+    Frames are capped before formatting so deep stacks don't build a large string
+    that is then mostly discarded by the length cap.
+    """
+    error_msg = "".join(
+        traceback.format_exception(type(exc), exc, exc.__traceback__, limit=_ERROR_TEXT_MAX_FRAMES)
+    )
+    if len(error_msg) > _ERROR_TEXT_MAX_CHARS:
+        error_msg = error_msg[:_ERROR_TEXT_MAX_CHARS] + "... (truncated)"
+    return error_msg
+
+
+def _short_error(exc: BaseException, limit: int = 50) -> str:
+    """Truncated error text for per-row Status cells.
+
+    Uses the message argument directly when there is one, so exceptions whose
+    __str__ renders large payloads (e.g. SQL statements) are not fully formatted
+    just to be cut down to a few characters.
+    """
+    if len(exc.args) == 1 and isinstance(exc.args[0], str):
+        return exc.args[0][:limit]
+    return str(exc)[:limit]
+
+
 def _claim_one_queued(db: Session) -> Optional[ActionRun]:
     """
     Claim one queued action run.
 
-    Uses SELECT ... FOR UPDATE SKIP LOCKED when available to prevent double execution
-    under concurrent workers. Falls back to plain select for SQLite/dev environments.
+    Claims in a single round-trip with
+    UPDATE ... WHERE id = (SELECT ... FOR UPDATE SKIP LOCKED) RETURNING, which prevents
+    double execution under concurrent workers. Falls back to select-then-update for
+    databases without RETURNING support (single-worker mode).
+
+    The partial index ix_action_runs_queued_created_at covers only queued rows, so
+    the ordered SKIP LOCKED scan reads the queue head regardless of run history size.
+
+    The claimed row is detached before the claim commit (see _commit_claimed), so the
+    commit does not expire it and executing the run issues no reload SELECT.
     """
+    started_at = _now()
+    next_id = (
+        select(ActionRun.id)
+        .where(ActionRun.status == STATUS_QUEUED)
+        .order_by(ActionRun.created_at.asc())
+        .limit(1)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
     try:
-        # Try Postgres-style locking first
         stmt = (
-            select(ActionRun)
-            .where(ActionRun.status == STATUS_QUEUED)
-            .order_by(ActionRun.created_at.asc())
-            .with_for_update(skip_locked=True)
-            .limit(1)
+            update(ActionRun)
+            .where(ActionRun.id == next_id)
+            .values(status=STATUS_RUNNING, started_at=started_at)
+            .returning(ActionRun)
         )
         run = db.execute(stmt).scalars().first()
     except Exception:
-        # Fallback for SQLite or other DBs without SKIP LOCKED support
-        logger.warning("FOR UPDATE SKIP LOCKED not supported, falling back to plain select (single-worker mode)")
+        db.rollback()
+        logger.warning("UPDATE ... RETURNING claim not supported, falling back to select-then-update (single-worker mode)")
         stmt = (
             select(ActionRun)
             .where(ActionRun.status == STATUS_QUEUED)
@@ -609,33 +764,167 @@ def _claim_one_queued(db: Session) -> Optional[ActionRun]:
             .limit(1)
         )
         run = db.execute(stmt).scalars().first()
-    
+        if run:
+            run.status = STATUS_RUNNING  # type: ignore[assignment]
+            run.started_at = started_at  # type: ignore[assignment]
+
     if not run:
+        db.rollback()
         return None
 
-    run.status = STATUS_RUNNING  # type: ignore[assignment]
-    run.started_at = _now()  # type: ignore[assignment]
-    db.commit()
-    db.refresh(run)
+    _commit_claimed(db, [run])
     return run
 
 
-def _build_action_context(payload: Dict[str, Any]) -> ActionContext:
+def _claim_n_queued(db: Session, n: int) -> List[ActionRun]:
+    """
+    Claim up to n queued action runs, oldest first.
+
+    Same locking semantics as _claim_one_queued (FOR UPDATE SKIP LOCKED inside a single
+    UPDATE ... RETURNING), with the same select-then-update fallback.
+    """
+    if n <= 0:
+        return []
+
+    started_at = _now()
+    next_ids = (
+        select(ActionRun.id)
+        .where(ActionRun.status == STATUS_QUEUED)
+        .order_by(ActionRun.created_at.asc())
+        .limit(n)
+        .with_for_update(skip_locked=True)
+    )
+    try:
+        stmt = (
+            update(ActionRun)
+            .where(ActionRun.id.in_(next_ids))
+            .values(status=STATUS_RUNNING, started_at=started_at)
+            .returning(ActionRun)
+        )
+        runs = list(db.execute(stmt).scalars().all())
+    except Exception:
+        db.rollback()
+        logger.warning("UPDATE ... RETURNING claim not supported, falling back to select-then-update (single-worker mode)")
+        stmt = (
+            select(ActionRun)
+            .where(ActionRun.status == STATUS_QUEUED)
+            .order_by(ActionRun.created_at.asc())
+            .limit(n)
+        )
+        runs = list(db.execute(stmt).scalars().all())
+        for run in runs:
+            run.status = STATUS_RUNNING  # type: ignore[assignment]
+            run.started_at = started_at  # type: ignore[assignment]
+
+    if not runs:
+        db.rollback()
+        return []
+
+    _commit_claimed(db, runs)
+    # RETURNING row order is not guaranteed; execute in queue order
+    runs.sort(key=lambda r: (r.created_at, r.id))
+    return runs
+
+
+def _commit_claimed(db: Session, runs: List[ActionRun]) -> None:
+    """
+    Commit a claim and detach the claimed rows from the Session.
+
+    The rows are fully loaded by RETURNING (or the fallback SELECT); detached, they
+    are not expired by this commit or by the commits each action makes, so reading
+    them later costs no SELECT. Outcomes are written with Core UPDATEs by primary key.
+    """
+    db.flush()
+    for run in runs:
+        db.expunge(run)
+    db.commit()
+
+
+def _requeue_runs(db: Session, runs: List[ActionRun]) -> None:
+    """Put claimed-but-unstarted runs back on the queue."""
+    db.execute(
+        update(ActionRun)
+        .where(ActionRun.id.in_([run.id for run in runs]))
+        .values(status=STATUS_QUEUED, started_at=None)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    for run in runs:
+        run.status = STATUS_QUEUED  # type: ignore[assignment]
+        run.started_at = None  # type: ignore[assignment]
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("action_run.requeued", extra={"run_ids": [r.run_id for r in runs]})
+
+
+# ----------------------------
+# Per-process client cache
+# ----------------------------
+# Building the Sheets service (credentials + discovery) and the OpenAI client is
+# expensive relative to short actions, so each worker builds them once. The Sheets
+# service sits on an httplib2 connection, which is not thread-safe, so it is kept
+# per thread; the LLM client is shared by the whole process.
+_clients_lock = threading.Lock()
+_thread_clients = threading.local()
+_sheets_client_generation = 0
+_llm_client: Optional[LLMClient] = None
+
+
+def _get_sheets_client() -> SheetsClient:
+    generation = _sheets_client_generation
+    client: Optional[SheetsClient] = getattr(_thread_clients, "sheets_client", None)
+    if client is None or getattr(_thread_clients, "generation", None) != generation:
+        client = SheetsClient(get_sheets_service())
+        _thread_clients.sheets_client = client
+        _thread_clients.generation = generation
+    return client
+
+
+def _get_llm_client() -> LLMClient:
+    global _llm_client
+    if _llm_client is None:
+        with _clients_lock:
+            if _llm_client is None:
+                _llm_client = LLMClient()
+    return _llm_client
+
+
+def reset_clients() -> None:
+    """Drop the cached Sheets/LLM clients (e.g. after credential rotation, or in tests).
+
+    Sheets clients cached by other threads are rebuilt on their next use.
+    """
+    global _sheets_client_generation, _llm_client
+    with _clients_lock:
+        _sheets_client_generation += 1
+        _thread_clients.__dict__.clear()
+        _llm_client = None
+
+
+# Actions that get an LLMClient in their context (registry names are exact; no prefix matching)
+_ACTIONS_REQUIRING_LLM: frozenset[str] = frozenset({
+    "pm.seed_math_params",
+    "pm.suggest_math_model_llm",
+    "pm.generate_llm_summary",
+    "flow4.suggest_mathmodels",
+    "flow4.seed_params",
+})
+
+
+def _build_action_context(payload: Dict[str, Any], action: str) -> ActionContext:
     """Build execution context with lazy dependency resolution.
     
-    Note: Creates a new SheetsClient per action run. This is fine for v1 single-worker
-    mode, but could be optimized with client pooling for multi-worker deployments.
+    The SheetsClient (and LLMClient, when needed) are cached per worker
+    rather than rebuilt for every action run. `action` is the run's indexed
+    action column, which enqueue validated against the registry.
     """
-    service = get_sheets_service()
-    sheets_client = SheetsClient(service)
+    sheets_client = _get_sheets_client()
 
-    action = str(payload.get("action") or "")
+    action = action.strip()
     llm_client: Optional[LLMClient] = None
     
     # Only instantiate LLM when needed
-    # Use exact equality for PM jobs (safer), startswith for Flow 4 (multiple variants)
-    if action in {"pm.seed_math_params", "pm.suggest_math_model_llm", "pm.generate_llm_summary"} or any(action.startswith(prefix) for prefix in ["flow4.suggest_mathmodels", "flow4.seed_params"]):
-        llm_client = LLMClient()
+    if action in _ACTIONS_REQUIRING_LLM:
+        llm_client = _get_llm_client()
 
     return ActionContext(payload=payload, sheets_client=sheets_client, llm_client=llm_client)
 
@@ -646,15 +935,16 @@ def _build_action_context(payload: Dict[str, Any]) -> ActionContext:
 
 def _resolve_action(action: str) -> ActionFn:
     action = action.strip()
-    if action not in _ACTION_REGISTRY:
+    fn = _ACTION_REGISTRY.get(action)
+    if fn is None:
         raise ValueError(f"Unknown action: {action}")
-    return _ACTION_REGISTRY[action]
+    return fn
 
 
 # ---------- Flow 3 actions ----------
 
 def _action_flow3_compute_all(db: Session, ctx: ActionContext) -> Dict[str, Any]:
-    options = (ctx.payload.get("options") or {}) if isinstance(ctx.payload.get("options"), dict) else {}
+    options = ctx.options
     commit_every = options.get("commit_every")
 
     service = ScoringService(db)
@@ -663,13 +953,12 @@ def _action_flow3_compute_all(db: Session, ctx: ActionContext) -> Dict[str, Any]
 
 
 def _action_flow3_write_scores(db: Session, ctx: ActionContext) -> Dict[str, Any]:
-    sheet_ctx = ctx.payload.get("sheet_context") or {}
-    if not isinstance(sheet_ctx, dict):
-        sheet_ctx = {}
+    sheet_ctx = ctx.sheet_context
 
     # Prefer explicit sheet_context, fallback to settings.PRODUCT_OPS
-    spreadsheet_id = sheet_ctx.get("spreadsheet_id") or (settings.PRODUCT_OPS.spreadsheet_id if settings.PRODUCT_OPS else None)
-    tab = sheet_ctx.get("tab") or (settings.PRODUCT_OPS.scoring_inputs_tab if settings.PRODUCT_OPS else "Scoring_Inputs")
+    cfg = settings.PRODUCT_OPS
+    spreadsheet_id = sheet_ctx.get("spreadsheet_id") or (cfg.spreadsheet_id if cfg else None)
+    tab = sheet_ctx.get("tab") or (cfg.scoring_inputs_tab if cfg else "Scoring_Inputs")
 
     if not spreadsheet_id:
         raise ValueError("sheet_context.spreadsheet_id missing and PRODUCT_OPS not configured")
@@ -679,15 +968,12 @@ def _action_flow3_write_scores(db: Session, ctx: ActionContext) -> Dict[str, Any
 
 
 def _action_flow3_sync_inputs(db: Session, ctx: ActionContext) -> Dict[str, Any]:
-    sheet_ctx = ctx.payload.get("sheet_context") or {}
-    options = (ctx.payload.get("options") or {}) if isinstance(ctx.payload.get("options"), dict) else {}
-    if not isinstance(sheet_ctx, dict):
-        sheet_ctx = {}
-    if not isinstance(options, dict):
-        options = {}
-
-    spreadsheet_id = sheet_ctx.get("spreadsheet_id") or (settings.PRODUCT_OPS.spreadsheet_id if settings.PRODUCT_OPS else None)
-    tab = sheet_ctx.get("tab") or (settings.PRODUCT_OPS.scoring_inputs_tab if settings.PRODUCT_OPS else "Scoring_Inputs")
+    sheet_ctx = ctx.sheet_context
+    options = ctx.options
+
+    cfg = settings.PRODUCT_OPS
+    spreadsheet_id = sheet_ctx.get("spreadsheet_id") or (cfg.spreadsheet_id if cfg else None)
+    tab = sheet_ctx.get("tab") or (cfg.scoring_inputs_tab if cfg else "Scoring_Inputs")
     commit_every = options.get("commit_every")
 
     if not spreadsheet_id:
@@ -700,7 +986,7 @@ def _action_flow3_sync_inputs(db: Session, ctx: ActionContext) -> Dict[str, Any]
 # ---------- Flow 2 actions ----------
 
 def _action_flow2_activate(db: Session, ctx: ActionContext) -> Dict[str, Any]:
-    options = (ctx.payload.get("options") or {}) if isinstance(ctx.payload.get("options"), dict) else {}
+    options = ctx.options
     fw_raw = options.get("framework")  # optional: "RICE"/"WSJF"/"MATH_MODEL"
     batch_size = options.get("commit_every")
     only_missing = bool(options.get("only_missing", True))
@@ -728,7 +1014,7 @@ def _action_flow1_backlog_sync(db: Session, ctx: ActionContext) -> Dict[str, Any
 
 def _action_flow1_full_sync(db: Session, ctx: ActionContext) -> Dict[str, Any]:
     # Full Flow 1 cycle: intake sync → backlog update → backlog sync
-    options = (ctx.payload.get("options") or {}) if isinstance(ctx.payload.get("options"), dict) else {}
+    options = ctx.options
     allow_status_override = bool(options.get("allow_status_override_global", False))
     backlog_commit_every = options.get("backlog_commit_every")
     product_org = options.get("product_org")
@@ -772,15 +1058,12 @@ def _action_flow1_full_sync(db: Session, ctx: ActionContext) -> Dict[str, Any]:
 def _action_flow4_suggest_mathmodels(db: Session, ctx: ActionContext) -> Dict[str, Any]:
     assert ctx.llm_client is not None, "LLM client required for this action"
 
-    sheet_ctx = ctx.payload.get("sheet_context") or {}
-    options = ctx.payload.get("options") or {}
-    if not isinstance(sheet_ctx, dict):
-        sheet_ctx = {}
-    if not isinstance(options, dict):
-        options = {}
+    sheet_ctx = ctx.sheet_context
+    options = ctx.options
 
-    spreadsheet_id = sheet_ctx.get("spreadsheet_id") or (settings.PRODUCT_OPS.spreadsheet_id if settings.PRODUCT_OPS else None)
-    tab = sheet_ctx.get("tab") or (settings.PRODUCT_OPS.mathmodels_tab if settings.PRODUCT_OPS else "MathModels")
+    cfg = settings.PRODUCT_OPS
+    spreadsheet_id = sheet_ctx.get("spreadsheet_id") or (cfg.spreadsheet_id if cfg else None)
+    tab = sheet_ctx.get("tab") or (cfg.mathmodels_tab if cfg else "MathModels")
 
     if not spreadsheet_id:
         raise ValueError("sheet_context.spreadsheet_id missing and PRODUCT_OPS not configured")
@@ -805,19 +1088,16 @@ def _action_flow4_suggest_mathmodels(db: Session, ctx: ActionContext) -> Dict[st
 def _action_flow4_seed_params(db: Session, ctx: ActionContext) -> Dict[str, Any]:
     assert ctx.llm_client is not None, "LLM client required for this action"
 
-    sheet_ctx = ctx.payload.get("sheet_context") or {}
-    options = ctx.payload.get("options") or {}
-    if not isinstance(sheet_ctx, dict):
-        sheet_ctx = {}
-    if not isinstance(options, dict):
-        options = {}
+    sheet_ctx = ctx.sheet_context
+    options = ctx.options
 
-    spreadsheet_id = sheet_ctx.get("spreadsheet_id") or (settings.PRODUCT_OPS.spreadsheet_id if settings.PRODUCT_OPS else None)
+    cfg = settings.PRODUCT_OPS
+    spreadsheet_id = sheet_ctx.get("spreadsheet_id") or (cfg.spreadsheet_id if cfg else None)
     if not spreadsheet_id:
         raise ValueError("sheet_context.spreadsheet_id missing and PRODUCT_OPS not configured")
 
-    mathmodels_tab = options.get("mathmodels_tab") or (settings.PRODUCT_OPS.mathmodels_tab if settings.PRODUCT_OPS else "MathModels")
-    params_tab = options.get("params_tab") or (settings.PRODUCT_OPS.params_tab if settings.PRODUCT_OPS else "Params")
+    mathmodels_tab = options.get("mathmodels_tab") or (cfg.mathmodels_tab if cfg else "MathModels")
+    params_tab = options.get("params_tab") or (cfg.params_tab if cfg else "Params")
     max_llm_calls = int(options.get("max_llm_calls", 10))
     limit = options.get("limit")
 
@@ -835,15 +1115,12 @@ def _action_flow4_seed_params(db: Session, ctx: ActionContext) -> Dict[str, Any]
 
 
 def _action_flow4_sync_mathmodels(db: Session, ctx: ActionContext) -> Dict[str, Any]:
-    sheet_ctx = ctx.payload.get("sheet_context") or {}
-    options = ctx.payload.get("options") or {}
-    if not isinstance(sheet_ctx, dict):
-        sheet_ctx = {}
-    if not isinstance(options, dict):
-        options = {}
-
-    spreadsheet_id = sheet_ctx.get("spreadsheet_id") or (settings.PRODUCT_OPS.spreadsheet_id if settings.PRODUCT_OPS else None)
-    tab = sheet_ctx.get("tab") or (settings.PRODUCT_OPS.mathmodels_tab if settings.PRODUCT_OPS else "MathModels")
+    sheet_ctx = ctx.sheet_context
+    options = ctx.options
+
+    cfg = settings.PRODUCT_OPS
+    spreadsheet_id = sheet_ctx.get("spreadsheet_id") or (cfg.spreadsheet_id if cfg else None)
+    tab = sheet_ctx.get("tab") or (cfg.mathmodels_tab if cfg else "MathModels")
     commit_every = int(options.get("commit_every", settings.SCORING_BATCH_COMMIT_EVERY))
 
     if not spreadsheet_id:
@@ -854,15 +1131,12 @@ def _action_flow4_sync_mathmodels(db: Session, ctx: ActionContext) -> Dict[str,
 
 
 def _action_flow4_sync_params(db: Session, ctx: ActionContext) -> Dict[str, Any]:
-    sheet_ctx = ctx.payload.get("sheet_context") or {}
-    options = ctx.payload.get("options") or {}
-    if not isinstance(sheet_ctx, dict):
-        sheet_ctx = {}
-    if not isinstance(options, dict):
-        options = {}
-
-    spreadsheet_id = sheet_ctx.get("spreadsheet_id") or (settings.PRODUCT_OPS.spreadsheet_id if settings.PRODUCT_OPS else None)
-    tab = sheet_ctx.get("tab") or (settings.PRODUCT_OPS.params_tab if settings.PRODUCT_OPS else "Params")
+    sheet_ctx = ctx.sheet_context
+    options = ctx.options
+
+    cfg = settings.PRODUCT_OPS
+    spreadsheet_id = sheet_ctx.get("spreadsheet_id") or (cfg.spreadsheet_id if cfg else None)
+    tab = sheet_ctx.get("tab") or (cfg.params_tab if cfg else "Params")
     commit_every = int(options.get("commit_every", settings.SCORING_BATCH_COMMIT_EVERY))
 
     if not spreadsheet_id:
@@ -875,7 +1149,7 @@ def _action_flow4_sync_params(db: Session, ctx: ActionContext) -> Dict[str, Any]
 # ---------- Flow 0 actions ----------
 
 def _action_flow0_intake_sync(db: Session, ctx: ActionContext) -> Dict[str, Any]:
-    options = (ctx.payload.get("options") or {}) if isinstance(ctx.payload.get("options"), dict) else {}
+    options = ctx.options
     allow_status_override = bool(options.get("allow_status_override_global", False))
 
     run_sync_all_intake_sheets(db=db, allow_status_override_global=allow_status_override)
@@ -884,6 +1158,38 @@ def _action_flow0_intake_sync(db: Session, ctx: ActionContext) -> Dict[str, Any]
 
 # ---------- PM Jobs ----------
 
+def _selected_keys(scope: Dict[str, Any]) -> Tuple[List[str], int]:
+    """Selected initiative keys from scope: non-blank strings, deduped in order.
+
+    Returns (keys, skipped_no_key) where skipped_no_key counts dropped entries
+    (blanks, non-strings and duplicates).
+    """
+    raw = scope.get("initiative_keys")
+    if not isinstance(raw, list):
+        return [], 0
+    seen: Dict[str, None] = {}
+    for k in raw:
+        if isinstance(k, str) and k.strip():
+            seen[k] = None
+    return list(seen), len(raw) - len(seen)
+
+
+def _no_keys_substeps(*steps: str) -> List[Dict[str, Any]]:
+    """Substep entries for a PM job that returned early because no keys were selected."""
+    return [{"step": step, "status": "skipped", "reason": "no keys selected"} for step in steps]
+
+
+def _selection_commit_every(options: Dict[str, Any], keys: List[str]) -> int:
+    """Commit batch size for a PM job over selected keys.
+
+    An explicit options.commit_every wins; otherwise the whole selection is one
+    batch so each pipeline stage commits once instead of every N rows.
+    """
+    if options.get("commit_every") is not None:
+        return int(options["commit_every"])
+    return max(len(keys), 1)
+
+
 def _action_pm_backlog_sync(db: Session, ctx: ActionContext) -> Dict[str, Any]:
     """PM Job #1: Sync intake to backlog.
 
@@ -895,7 +1201,7 @@ def _action_pm_backlog_sync(db: Session, ctx: ActionContext) -> Dict[str, Any]:
     It must NOT read Central Backlog edits back into DB as part of the same run,
     otherwise stale sheet values can overwrite freshly-synced intake fields.
     """
-    options = (ctx.payload.get("options") or {}) if isinstance(ctx.payload.get("options"), dict) else {}
+    options = ctx.options
     allow_status_override = bool(options.get("allow_status_override_global", False))
     archive_missing = bool(options.get("archive_missing_initiatives", True))
     include_archived = bool(options.get("include_archived", True))
@@ -930,40 +1236,58 @@ def _action_pm_backlog_sync(db: Session, ctx: ActionContext) -> Dict[str, Any]:
     }
 
 
+@contextmanager
+def _pm_status_step(
+    ctx: ActionContext,
+    pm_job: str,
+    spreadsheet_id: str,
+    tab: str,
+    keys: List[str],
+    step: str,
+    label: str,
+) -> Iterator[None]:
+    """Run one PM job step; on failure mark every key FAILED on the sheet (best-effort) and raise.
+
+    The failure is logged once, with the status write outcome attached. The full
+    traceback is only included at DEBUG, since the runner logs it with the run.
+    """
+    try:
+        yield
+    except Exception as e:
+        status_written = True
+        try:
+            write_status_to_sheet(ctx.sheets_client, spreadsheet_id, tab, dict.fromkeys(keys, f"FAILED: {label} failed"))
+        except Exception:
+            status_written = False
+        logger.error(
+            f"{pm_job}.{step}_failed",
+            extra={"error": _short_error(e, 200), "status_written": status_written},
+            exc_info=logger.isEnabledFor(logging.DEBUG),
+        )
+        raise RuntimeError(f"{pm_job} {step} failed: {str(e)[:100]}") from e
+
+
 def _action_pm_score_selected(db: Session, ctx: ActionContext) -> Dict[str, Any]:
     """PM Job #2: Score selected initiatives.
 
     Orchestrates selection-scoped Flow 3: sync inputs → compute all frameworks → write scores.
     Writes per-row Status messages on the Scoring_Inputs tab.
     """
-    sheet_ctx = ctx.payload.get("sheet_context") or {}
-    options = ctx.payload.get("options") or {}
-    scope = ctx.payload.get("scope") or {}
-    if not isinstance(sheet_ctx, dict):
-        sheet_ctx = {}
-    if not isinstance(options, dict):
-        options = {}
-    if not isinstance(scope, dict):
-        scope = {}
+    sheet_ctx = ctx.sheet_context
+    options = ctx.options
+    scope = ctx.scope
 
     cfg = settings.PRODUCT_OPS
     spreadsheet_id = sheet_ctx.get("spreadsheet_id") or (cfg.spreadsheet_id if cfg else None)
     requested_tab = sheet_ctx.get("tab")
     resolved_tab = _resolve_pm_tab(requested_tab, cfg, default_kind="scoring_inputs")
     tab = resolved_tab.canonical_tab
-    commit_every = int(options.get("commit_every", settings.SCORING_BATCH_COMMIT_EVERY))
-
-    keys = scope.get("initiative_keys") or []
-    if not isinstance(keys, list):
-        keys = []
-    # sanitize: skip blanks, dedupe
-    keys = [k for k in keys if isinstance(k, str) and k.strip()]
-    keys = list(dict.fromkeys(keys))
-    original_keys = scope.get("initiative_keys")
-    skipped_no_key = (len(original_keys) - len(keys)) if isinstance(original_keys, list) else 0
+    keys, skipped_no_key = _selected_keys(scope)
+    commit_every = _selection_commit_every(options, keys)
 
     if not spreadsheet_id:
         raise ValueError("sheet_context.spreadsheet_id missing and PRODUCT_OPS not configured")
+    spreadsheet_id = str(spreadsheet_id)
 
     expected_tab = cfg.scoring_inputs_tab if cfg else "Scoring_Inputs"
     if resolved_tab.kind != "scoring_inputs":
@@ -987,88 +1311,39 @@ def _action_pm_score_selected(db: Session, ctx: ActionContext) -> Dict[str, Any]
             "written": 0,
             "skipped_no_key": skipped_no_key,
             "failed_count": 0,
-            "substeps": [
-                {"step": "flow3.sync_inputs", "status": "skipped", "reason": "no keys selected"},
-                {"step": "flow3.compute_selected", "status": "skipped", "reason": "no keys selected"},
-                {"step": "flow3.write_scores", "status": "skipped", "reason": "no keys selected"},
-                {"step": "status_write", "status": "skipped", "reason": "no keys selected"},
-            ],
+            "substeps": _no_keys_substeps("flow3.sync_inputs", "flow3.compute_selected", "flow3.write_scores", "status_write"),
         }
 
+    def step(name: str, label: str) -> ContextManager[None]:
+        return _pm_status_step(ctx, "pm.score_selected", spreadsheet_id, tab, keys, name, label)
+
     # 1) Sync inputs for selected keys
-    status_by_key: Dict[str, Optional[str]] = {k: None for k in keys}  # Initialize all keys; update as we go
-    try:
+    with step("sync_inputs", "sync"):
         updated_inputs = run_flow3_sync_inputs_to_initiatives(
             db=db,
             commit_every=commit_every,
-            spreadsheet_id=str(spreadsheet_id),
-            tab_name=str(tab),
+            spreadsheet_id=spreadsheet_id,
+            tab_name=tab,
             initiative_keys=keys,
         )
-    except Exception as e:
-        logger.exception("pm.score_selected.sync_inputs_failed")
-        for k in keys:
-            status_by_key[k] = "FAILED: sync failed"
-        # Best-effort status write before propagating failure
-        try:
-            from app.sheets.productops_writer import write_status_to_sheet
-            write_status_to_sheet(
-                ctx.sheets_client,
-                str(spreadsheet_id),
-                str(tab),
-                {k: v for k, v in status_by_key.items() if v is not None},
-            )
-        except Exception:
-            logger.warning("pm.score_selected.status_write_failed_on_sync_error")
-        raise RuntimeError(f"pm.score_selected sync_inputs failed: {str(e)[:100]}") from e
 
     # 2) Compute all frameworks for selected keys
     svc = ScoringService(db)
-    try:
+    with step("compute", "compute"):
         computed = svc.compute_for_initiatives(keys, commit_every=commit_every)
-    except Exception as e:
-        logger.exception("pm.score_selected.compute_failed")
-        for k in keys:
-            status_by_key[k] = "FAILED: compute failed"
-        # Best-effort status write before propagating failure
-        try:
-            from app.sheets.productops_writer import write_status_to_sheet
-            write_status_to_sheet(
-                ctx.sheets_client,
-                str(spreadsheet_id),
-                str(tab),
-                {k: v for k, v in status_by_key.items() if v is not None},
-            )
-        except Exception:
-            logger.warning("pm.score_selected.status_write_failed_on_compute_error")
-        raise RuntimeError(f"pm.score_selected compute failed: {str(e)[:100]}") from e
 
-    # 3) Write scores back to sheet for selected keys
-    try:
+    # 3) Write scores back to sheet for selected keys, with per-row Status in the same batch.
+    # Later steps are non-fatal, so every key is OK once this succeeds.
+    with step("write_scores", "write"):
         written = run_flow3_write_scores_to_sheet(
             db=db,
             client=ctx.sheets_client,
-            spreadsheet_id=str(spreadsheet_id),
-            tab_name=str(tab),
+            spreadsheet_id=spreadsheet_id,
+            tab_name=tab,
             initiative_keys=keys,
             warnings_by_key=svc.latest_math_warnings or None,
+            status_by_key=dict.fromkeys(keys, "OK"),
         )
-    except Exception as e:
-        logger.exception("pm.score_selected.write_scores_failed")
-        for k in keys:
-            status_by_key[k] = "FAILED: write failed"
-        # Best-effort status write before propagating failure
-        try:
-            from app.sheets.productops_writer import write_status_to_sheet
-            write_status_to_sheet(
-                ctx.sheets_client,
-                str(spreadsheet_id),
-                str(tab),
-                {k: v for k, v in status_by_key.items() if v is not None},
-            )
-        except Exception:
-            logger.warning("pm.score_selected.status_write_failed_on_write_error")
-        raise RuntimeError(f"pm.score_selected write_scores failed: {str(e)[:100]}") from e
 
     # 3.5) Write KPI contributions back to KPI_Contributions tab (if exists)
     kpi_contributions_written = 0
@@ -1079,7 +1354,7 @@ def _action_pm_score_selected(db: Session, ctx: ActionContext) -> Dict[str, Any]
             kpi_contributions_written = write_kpi_contributions_to_sheet(
                 db=db,
                 client=ctx.sheets_client,
-                spreadsheet_id=str(spreadsheet_id),
+                spreadsheet_id=spreadsheet_id,
                 tab_name=str(kpi_tab),
                 initiative_keys=keys,
             )
@@ -1103,7 +1378,7 @@ def _action_pm_score_selected(db: Session, ctx: ActionContext) -> Dict[str, Any]
             mathmodels_written = write_computed_scores_to_mathmodels_sheet(
                 db=db,
                 client=ctx.sheets_client,
-                spreadsheet_id=str(spreadsheet_id),
+                spreadsheet_id=spreadsheet_id,
                 tab_name=str(mm_tab),
                 initiative_keys=keys,
             )
@@ -1118,22 +1393,6 @@ def _action_pm_score_selected(db: Session, ctx: ActionContext) -> Dict[str, Any]
             )
             # Non-fatal: continue with status write
 
-    # All steps succeeded; mark all keys as OK
-    for k in keys:
-        status_by_key[k] = "OK"
-
-    # 4) Per-row Status write (best-effort)
-    try:
-        from app.sheets.productops_writer import write_status_to_sheet
-        write_status_to_sheet(
-            ctx.sheets_client,
-            str(spreadsheet_id),
-            str(tab),
-            {k: v for k, v in status_by_key.items() if v is not None},
-        )
-    except Exception:
-        logger.warning("pm.score_selected.status_write_failed")
-
     return {
         "pm_job": "pm.score_selected",
         "selected_count": len(keys),
@@ -1179,30 +1438,19 @@ def _action_pm_suggest_math_model_llm(db: Session, ctx: ActionContext) -> Dict[s
       6. Runs pm.save_selected → Persists to DB
       7. Runs pm.score_selected → Computes math model scores
     """
-    sheet_ctx = ctx.payload.get("sheet_context") or {}
-    options = ctx.payload.get("options") or {}
-    scope = ctx.payload.get("scope") or {}
-    if not isinstance(sheet_ctx, dict):
-        sheet_ctx = {}
-    if not isinstance(options, dict):
-        options = {}
-    if not isinstance(scope, dict):
-        scope = {}
+    sheet_ctx = ctx.sheet_context
+    options = ctx.options
+    scope = ctx.scope
 
-    spreadsheet_id = sheet_ctx.get("spreadsheet_id") or (settings.PRODUCT_OPS.spreadsheet_id if settings.PRODUCT_OPS else None)
+    cfg = settings.PRODUCT_OPS
+    spreadsheet_id = sheet_ctx.get("spreadsheet_id") or (cfg.spreadsheet_id if cfg else None)
     requested_tab = sheet_ctx.get("tab")
-    configured_mathmodels_tab = settings.PRODUCT_OPS.mathmodels_tab if settings.PRODUCT_OPS else "MathModels"
-    resolved_tab = _resolve_pm_tab(requested_tab, settings.PRODUCT_OPS, default_kind="mathmodels")
+    configured_mathmodels_tab = cfg.mathmodels_tab if cfg else "MathModels"
+    resolved_tab = _resolve_pm_tab(requested_tab, cfg, default_kind="mathmodels")
     mathmodels_tab = configured_mathmodels_tab
     max_llm_calls = int(options.get("max_llm_calls", 10))
 
-    keys = scope.get("initiative_keys") or []
-    if not isinstance(keys, list):
-        keys = []
-    keys = [k for k in keys if isinstance(k, str) and k.strip()]
-    keys = list(dict.fromkeys(keys))
-    original_keys = scope.get("initiative_keys")
-    skipped_no_key = (len(original_keys) - len(keys)) if isinstance(original_keys, list) else 0
+    keys, skipped_no_key = _selected_keys(scope)
 
     if not spreadsheet_id:
         raise ValueError("sheet_context.spreadsheet_id missing and PRODUCT_OPS not configured")
@@ -1228,9 +1476,7 @@ def _action_pm_suggest_math_model_llm(db: Session, ctx: ActionContext) -> Dict[s
             "ok_count": 0,
             "skipped_count": 0,
             "failed_count": 0,
-            "substeps": [
-                {"step": "model_suggestion", "status": "skipped", "reason": "no keys selected"},
-            ],
+            "substeps": _no_keys_substeps("model_suggestion"),
         }
 
     from app.sheets.math_models_reader import MathModelsReader
@@ -1239,7 +1485,8 @@ def _action_pm_suggest_math_model_llm(db: Session, ctx: ActionContext) -> Dict[s
     from app.llm.scoring_assistant import build_math_model_prompt_enrichment, build_math_model_prompt_input, load_metrics_config_prompt_json
     from app.db.models.initiative import Initiative
     
-    status_by_key: Dict[str, Optional[str]] = {k: None for k in keys}
+    # Only keys that have been given a status; passed to the sheet writer as-is
+    status_by_key: Dict[str, str] = {}
     suggestions_to_write = []
 
     try:
@@ -1264,7 +1511,7 @@ def _action_pm_suggest_math_model_llm(db: Session, ctx: ActionContext) -> Dict[s
         metrics_config_json = load_metrics_config_prompt_json(
             ctx.sheets_client,
             spreadsheet_id=str(spreadsheet_id),
-            tab_name=getattr(settings.PRODUCT_OPS, "metrics_config_tab", None) if settings.PRODUCT_OPS else None,
+            tab_name=getattr(cfg, "metrics_config_tab", None) if cfg else None,
         )
 
         models_suggested = 0
@@ -1371,7 +1618,7 @@ def _action_pm_suggest_math_model_llm(db: Session, ctx: ActionContext) -> Dict[s
 
             except Exception as exc:
                 logger.exception(f"pm.suggest_math_model_llm.llm_failed for {key}")
-                status_by_key[key] = f"FAILED: LLM error: {str(exc)[:50]}"
+                status_by_key[key] = f"FAILED: LLM error: {_short_error(exc)}"
                 continue
         
         # Batch write all suggestions
@@ -1384,28 +1631,26 @@ def _action_pm_suggest_math_model_llm(db: Session, ctx: ActionContext) -> Dict[s
 
     except Exception as e:
         logger.exception("pm.suggest_math_model_llm.failed")
+        failed_status = f"FAILED: {_short_error(e)}"
         for k in keys:
-            if status_by_key[k] is None:
-                status_by_key[k] = f"FAILED: {str(e)[:50]}"
+            status_by_key.setdefault(k, failed_status)
         # Best-effort status write before propagating failure
         try:
-            from app.sheets.productops_writer import write_status_to_sheet
-            write_status_to_sheet(ctx.sheets_client, str(spreadsheet_id), mathmodels_tab, {k: v for k, v in status_by_key.items() if v is not None})
+            write_status_to_sheet(ctx.sheets_client, str(spreadsheet_id), mathmodels_tab, status_by_key)
         except Exception:
             logger.warning("pm.suggest_math_model_llm.status_write_failed_on_error")
         raise RuntimeError(f"pm.suggest_math_model_llm failed: {str(e)[:100]}") from e
 
     # Write status to MathModels tab
     try:
-        from app.sheets.productops_writer import write_status_to_sheet
-        write_status_to_sheet(ctx.sheets_client, str(spreadsheet_id), mathmodels_tab, {k: v for k, v in status_by_key.items() if v is not None})
+        write_status_to_sheet(ctx.sheets_client, str(spreadsheet_id), mathmodels_tab, status_by_key)
     except Exception:
         logger.warning("pm.suggest_math_model_llm.status_write_failed")
 
     # Count statuses by prefix
-    ok_count = sum(1 for v in status_by_key.values() if v and v.startswith("OK"))
-    skipped_count = sum(1 for v in status_by_key.values() if v and v.startswith("SKIPPED"))
-    failed_count = sum(1 for v in status_by_key.values() if v and v.startswith("FAILED"))
+    ok_count = sum(1 for v in status_by_key.values() if v.startswith("OK"))
+    skipped_count = sum(1 for v in status_by_key.values() if v.startswith("SKIPPED"))
+    failed_count = sum(1 for v in status_by_key.values() if v.startswith("FAILED"))
 
     return {
         "pm_job": "pm.suggest_math_model_llm",
@@ -1423,12 +1668,8 @@ def _action_pm_suggest_math_model_llm(db: Session, ctx: ActionContext) -> Dict[s
 
 def _action_pm_generate_llm_summary(db: Session, ctx: ActionContext) -> Dict[str, Any]:
     """Generate and overwrite selected initiative summaries on Central Backlog."""
-    sheet_ctx = ctx.payload.get("sheet_context") or {}
-    scope = ctx.payload.get("scope") or {}
-    if not isinstance(sheet_ctx, dict):
-        sheet_ctx = {}
-    if not isinstance(scope, dict):
-        scope = {}
+    sheet_ctx = ctx.sheet_context
+    scope = ctx.scope
 
     cfg = settings.PRODUCT_OPS
     spreadsheet_id = sheet_ctx.get("spreadsheet_id") or (cfg.spreadsheet_id if cfg else None)
@@ -1436,13 +1677,7 @@ def _action_pm_generate_llm_summary(db: Session, ctx: ActionContext) -> Dict[str
     resolved_tab = _resolve_pm_tab(requested_tab, cfg, default_kind="backlog")
     tab = resolved_tab.canonical_tab
 
-    keys = scope.get("initiative_keys") or []
-    if not isinstance(keys, list):
-        keys = []
-    keys = [k for k in keys if isinstance(k, str) and k.strip()]
-    keys = list(dict.fromkeys(keys))
-    original_keys = scope.get("initiative_keys")
-    skipped_no_key = (len(original_keys) - len(keys)) if isinstance(original_keys, list) else 0
+    keys, skipped_no_key = _selected_keys(scope)
 
     if not spreadsheet_id:
         raise ValueError("sheet_context.spreadsheet_id missing and PRODUCT_OPS not configured")
@@ -1467,10 +1702,7 @@ def _action_pm_generate_llm_summary(db: Session, ctx: ActionContext) -> Dict[str
             "skipped_count": 0,
             "skipped_no_key": skipped_no_key,
             "failed_count": 0,
-            "substeps": [
-                {"step": "generate_summary", "status": "skipped", "reason": "no keys selected"},
-                {"step": "status_write", "status": "skipped", "reason": "no keys selected"},
-            ],
+            "substeps": _no_keys_substeps("generate_summary", "status_write"),
         }
 
     assert ctx.llm_client is not None, "LLM client required for pm.generate_llm_summary"
@@ -1483,7 +1715,6 @@ def _action_pm_generate_llm_summary(db: Session, ctx: ActionContext) -> Dict[str
     )
 
     try:
-        from app.sheets.productops_writer import write_status_to_sheet
 
         write_status_to_sheet(
             ctx.sheets_client,
@@ -1513,12 +1744,8 @@ def _action_pm_generate_llm_summary(db: Session, ctx: ActionContext) -> Dict[str
 def _action_pm_sync_backlog_db(db: Session, ctx: ActionContext) -> Dict[str, Any]:
     from app.services.backlog_reconciliation_service import BacklogReconciliationService
 
-    sheet_ctx = ctx.payload.get("sheet_context") or {}
-    scope = ctx.payload.get("scope") or {}
-    if not isinstance(sheet_ctx, dict):
-        sheet_ctx = {}
-    if not isinstance(scope, dict):
-        scope = {}
+    sheet_ctx = ctx.sheet_context
+    scope = ctx.scope
 
     cfg = settings.PRODUCT_OPS
     spreadsheet_id = sheet_ctx.get("spreadsheet_id") or (cfg.spreadsheet_id if cfg else None)
@@ -1526,13 +1753,7 @@ def _action_pm_sync_backlog_db(db: Session, ctx: ActionContext) -> Dict[str, Any
     resolved_tab = _resolve_pm_tab(requested_tab, cfg, default_kind="backlog")
     tab = resolved_tab.canonical_tab
 
-    keys = scope.get("initiative_keys") or []
-    if not isinstance(keys, list):
-        keys = []
-    keys = [k for k in keys if isinstance(k, str) and k.strip()]
-    keys = list(dict.fromkeys(keys))
-    original_keys = scope.get("initiative_keys")
-    skipped_no_key = (len(original_keys) - len(keys)) if isinstance(original_keys, list) else 0
+    keys, skipped_no_key = _selected_keys(scope)
 
     if not spreadsheet_id:
         raise ValueError("sheet_context.spreadsheet_id missing and PRODUCT_OPS not configured")
@@ -1560,10 +1781,7 @@ def _action_pm_sync_backlog_db(db: Session, ctx: ActionContext) -> Dict[str, Any
             "sheet_updated": 0,
             "db_updated": 0,
             "status_by_key": {},
-            "substeps": [
-                {"step": "reconcile", "status": "skipped", "reason": "no keys selected"},
-                {"step": "status_write", "status": "skipped", "reason": "no keys selected"},
-            ],
+            "substeps": _no_keys_substeps("reconcile", "status_write"),
         }
 
     service = BacklogReconciliationService(ctx.sheets_client)
@@ -1575,7 +1793,6 @@ def _action_pm_sync_backlog_db(db: Session, ctx: ActionContext) -> Dict[str, Any
     )
 
     try:
-        from app.sheets.productops_writer import write_status_to_sheet
 
         write_status_to_sheet(
             ctx.sheets_client,
@@ -1610,31 +1827,20 @@ def _action_pm_seed_math_params(db: Session, ctx: ActionContext) -> Dict[str, An
 
     PM must then fill param values and run pm.score_selected to compute scores.
     """
-    sheet_ctx = ctx.payload.get("sheet_context") or {}
-    options = ctx.payload.get("options") or {}
-    scope = ctx.payload.get("scope") or {}
-    if not isinstance(sheet_ctx, dict):
-        sheet_ctx = {}
-    if not isinstance(options, dict):
-        options = {}
-    if not isinstance(scope, dict):
-        scope = {}
+    sheet_ctx = ctx.sheet_context
+    options = ctx.options
+    scope = ctx.scope
 
-    spreadsheet_id = sheet_ctx.get("spreadsheet_id") or (settings.PRODUCT_OPS.spreadsheet_id if settings.PRODUCT_OPS else None)
+    cfg = settings.PRODUCT_OPS
+    spreadsheet_id = sheet_ctx.get("spreadsheet_id") or (cfg.spreadsheet_id if cfg else None)
     requested_tab = sheet_ctx.get("tab")
-    configured_mathmodels_tab = settings.PRODUCT_OPS.mathmodels_tab if settings.PRODUCT_OPS else "MathModels"
-    resolved_tab = _resolve_pm_tab(requested_tab, settings.PRODUCT_OPS, default_kind="mathmodels")
+    configured_mathmodels_tab = cfg.mathmodels_tab if cfg else "MathModels"
+    resolved_tab = _resolve_pm_tab(requested_tab, cfg, default_kind="mathmodels")
     mathmodels_tab = configured_mathmodels_tab
-    params_tab = settings.PRODUCT_OPS.params_tab if settings.PRODUCT_OPS else "Params"
+    params_tab = cfg.params_tab if cfg else "Params"
     max_llm_calls = int(options.get("max_llm_calls", 10))
 
-    keys = scope.get("initiative_keys") or []
-    if not isinstance(keys, list):
-        keys = []
-    keys = [k for k in keys if isinstance(k, str) and k.strip()]
-    keys = list(dict.fromkeys(keys))
-    original_keys = scope.get("initiative_keys")
-    skipped_no_key = (len(original_keys) - len(keys)) if isinstance(original_keys, list) else 0
+    keys, skipped_no_key = _selected_keys(scope)
 
     if not spreadsheet_id:
         raise ValueError("sheet_context.spreadsheet_id missing and PRODUCT_OPS not configured")
@@ -1659,9 +1865,7 @@ def _action_pm_seed_math_params(db: Session, ctx: ActionContext) -> Dict[str, An
             "params_seeded": 0,
             "skipped_no_key": skipped_no_key,
             "failed_count": 0,
-            "substeps": [
-                {"step": "param_seeding", "status": "skipped", "reason": "no keys selected"},
-            ],
+            "substeps": _no_keys_substeps("param_seeding"),
         }
 
     # Import param seeding logic
@@ -1670,7 +1874,8 @@ def _action_pm_seed_math_params(db: Session, ctx: ActionContext) -> Dict[str, An
     from app.sheets.params_writer import ParamsWriter
     from app.utils.safe_eval import extract_identifiers, validate_formula
 
-    status_by_key: Dict[str, Optional[str]] = {k: None for k in keys}
+    # Only keys that have been given a status; passed to the sheet writer as-is
+    status_by_key: Dict[str, str] = {}
 
     try:
         math_reader = MathModelsReader(ctx.sheets_client)
@@ -1727,7 +1932,7 @@ def _action_pm_seed_math_params(db: Session, ctx: ActionContext) -> Dict[str, An
             try:
                 identifiers = extract_identifiers(math_row.formula_text)
             except Exception as exc:
-                status_by_key[key] = f"FAILED: Cannot parse formula: {str(exc)[:50]}"
+                status_by_key[key] = f"FAILED: Cannot parse formula: {_short_error(exc)}"
                 continue
 
             if not identifiers:
@@ -1777,7 +1982,7 @@ def _action_pm_seed_math_params(db: Session, ctx: ActionContext) -> Dict[str, An
                 llm_calls += 1
             except Exception as exc:
                 logger.exception(f"pm.build_math_model.llm_failed for {key}")
-                status_by_key[key] = f"FAILED: LLM error: {str(exc)[:50]}"
+                status_by_key[key] = f"FAILED: LLM error: {_short_error(exc)}"
                 continue
 
             # Build params to append
@@ -1824,28 +2029,26 @@ def _action_pm_seed_math_params(db: Session, ctx: ActionContext) -> Dict[str, An
 
     except Exception as e:
         logger.exception("pm.seed_math_params.failed")
+        failed_status = f"FAILED: {_short_error(e)}"
         for k in keys:
-            if status_by_key[k] is None:
-                status_by_key[k] = f"FAILED: {str(e)[:50]}"
+            status_by_key.setdefault(k, failed_status)
         # Best-effort status write before propagating failure
         try:
-            from app.sheets.productops_writer import write_status_to_sheet
-            write_status_to_sheet(ctx.sheets_client, str(spreadsheet_id), mathmodels_tab, {k: v for k, v in status_by_key.items() if v is not None})
+            write_status_to_sheet(ctx.sheets_client, str(spreadsheet_id), mathmodels_tab, status_by_key)
         except Exception:
             logger.warning("pm.seed_math_params.status_write_failed_on_error")
         raise RuntimeError(f"pm.seed_math_params failed: {str(e)[:100]}") from e
 
     # Write status to MathModels tab
     try:
-        from app.sheets.productops_writer import write_status_to_sheet
-        write_status_to_sheet(ctx.sheets_client, str(spreadsheet_id), mathmodels_tab, {k: v for k, v in status_by_key.items() if v is not None})
+        write_status_to_sheet(ctx.sheets_client, str(spreadsheet_id), mathmodels_tab, status_by_key)
     except Exception:
         logger.warning("pm.seed_math_params.status_write_failed")
 
     # Count statuses by prefix for accurate summary
-    ok_count = sum(1 for v in status_by_key.values() if v and v.startswith("OK"))
-    skipped_count = sum(1 for v in status_by_key.values() if v and v.startswith("SKIPPED"))
-    failed_count = sum(1 for v in status_by_key.values() if v and v.startswith("FAILED"))
+    ok_count = sum(1 for v in status_by_key.values() if v.startswith("OK"))
+    skipped_count = sum(1 for v in status_by_key.values() if v.startswith("SKIPPED"))
+    failed_count = sum(1 for v in status_by_key.values() if v.startswith("FAILED"))
 
     return {
         "pm_job": "pm.seed_math_params",
@@ -1862,6 +2065,17 @@ def _action_pm_seed_math_params(db: Session, ctx: ActionContext) -> Dict[str, An
     }
 
 
+# Backlog columns changed by activating a framework (plus the usual write provenance)
+_SWITCH_FRAMEWORK_BACKLOG_FIELDS: List[str] = [
+    "active_scoring_framework",
+    "value_score",
+    "effort_score",
+    "overall_score",
+    "updated_at",
+    "updated_source",
+]
+
+
 def _action_pm_switch_framework(db: Session, ctx: ActionContext) -> Dict[str, Any]:
     """PM Job #3: Switch active scoring framework for selected initiatives.
 
@@ -1880,15 +2094,9 @@ def _action_pm_switch_framework(db: Session, ctx: ActionContext) -> Dict[str, An
       3. Sync Central_Backlog view from DB
       4. Per-row status write (optional if Backlog has Status column)
     """
-    sheet_ctx = ctx.payload.get("sheet_context") or {}
-    options = ctx.payload.get("options") or {}
-    scope = ctx.payload.get("scope") or {}
-    if not isinstance(sheet_ctx, dict):
-        sheet_ctx = {}
-    if not isinstance(options, dict):
-        options = {}
-    if not isinstance(scope, dict):
-        scope = {}
+    sheet_ctx = ctx.sheet_context
+    options = ctx.options
+    scope = ctx.scope
 
     cfg = settings.PRODUCT_OPS
 
@@ -1896,19 +2104,12 @@ def _action_pm_switch_framework(db: Session, ctx: ActionContext) -> Dict[str, An
     requested_tab = sheet_ctx.get("tab")
     resolved_tab = _resolve_pm_tab(requested_tab, cfg, default_kind="scoring_inputs")
     tab = resolved_tab.canonical_tab
-    commit_every = int(options.get("commit_every", settings.SCORING_BATCH_COMMIT_EVERY))
-
-    keys = scope.get("initiative_keys") or []
-    if not isinstance(keys, list):
-        keys = []
-    # Sanitize: skip blanks, dedupe
-    keys = [k for k in keys if isinstance(k, str) and k.strip()]
-    keys = list(dict.fromkeys(keys))
-    original_keys = scope.get("initiative_keys")
-    skipped_no_key = (len(original_keys) - len(keys)) if isinstance(original_keys, list) else 0
+    keys, skipped_no_key = _selected_keys(scope)
+    commit_every = _selection_commit_every(options, keys)
 
     if not spreadsheet_id:
         raise ValueError("sheet_context.spreadsheet_id missing and PRODUCT_OPS not configured")
+    spreadsheet_id = str(spreadsheet_id)
 
     expected_scoring_tab = cfg.scoring_inputs_tab if cfg else "Scoring_Inputs"
     if resolved_tab.kind not in {"scoring_inputs", "backlog"}:
@@ -1934,15 +2135,9 @@ def _action_pm_switch_framework(db: Session, ctx: ActionContext) -> Dict[str, An
             "activated": 0,
             "written": 0,
             "skipped_no_key": skipped_no_key,
-            "substeps": [
-                {"step": "sync_or_backlog_update", "status": "skipped", "reason": "no keys selected"},
-                {"step": "activate_framework", "status": "skipped", "reason": "no keys selected"},
-                {"step": "write_or_sync_view", "status": "skipped", "reason": "no keys selected"},
-            ],
+            "substeps": _no_keys_substeps("sync_or_backlog_update", "activate_framework", "write_or_sync_view"),
         }
 
-    status_by_key: Dict[str, Optional[str]] = {k: None for k in keys}
-
     # Detect branch based on tab
     is_backlog_tab = resolved_tab.kind == "backlog"
 
@@ -1954,8 +2149,6 @@ def _action_pm_switch_framework(db: Session, ctx: ActionContext) -> Dict[str, An
             run_backlog_update(db, initiative_keys=keys, product_org=options.get("product_org"))
         except Exception as e:
             logger.exception("pm.switch_framework.backlog_update_failed")
-            for k in keys:
-                status_by_key[k] = "FAILED: backlog update failed"
             raise RuntimeError(f"pm.switch_framework backlog_update failed: {str(e)[:100]}") from e
 
         # Step B2: Activate for selected initiatives
@@ -1964,23 +2157,15 @@ def _action_pm_switch_framework(db: Session, ctx: ActionContext) -> Dict[str, An
             activated = svc.activate_for_initiatives(keys, commit_every=commit_every)
         except Exception as e:
             logger.exception("pm.switch_framework.activate_failed")
-            for k in keys:
-                status_by_key[k] = "FAILED: activate failed"
             raise RuntimeError(f"pm.switch_framework activate failed: {str(e)[:100]}") from e
 
-        # Step B3: Sync Central_Backlog view from DB (full sync v1)
+        # Step B3: Refresh the activated score columns of the selected rows on Central_Backlog
         try:
-            run_all_backlog_sync(db)
+            run_all_backlog_sync_for_keys(db, keys, _SWITCH_FRAMEWORK_BACKLOG_FIELDS)
         except Exception as e:
             logger.exception("pm.switch_framework.backlog_sync_failed")
-            for k in keys:
-                status_by_key[k] = "FAILED: backlog sync failed"
             raise RuntimeError(f"pm.switch_framework backlog_sync failed: {str(e)[:100]}") from e
 
-        # All steps succeeded
-        for k in keys:
-            status_by_key[k] = "OK"
-
         # Step B4: Status write (best-effort, optional)
         try:
             # Only attempt if Backlog sheet has Status column (we don't know for sure, so skip for now)
@@ -2006,95 +2191,36 @@ def _action_pm_switch_framework(db: Session, ctx: ActionContext) -> Dict[str, An
     else:
         # ========== BRANCH A: Scoring_Inputs ==========
 
+        def step(name: str, label: str) -> ContextManager[None]:
+            return _pm_status_step(ctx, "pm.switch_framework", spreadsheet_id, tab, keys, name, label)
+
         # Step A1: Sync inputs from sheet to DB
-        try:
+        with step("sync_inputs", "sync"):
             updated_inputs = run_flow3_sync_inputs_to_initiatives(
                 db=db,
                 commit_every=commit_every,
-                spreadsheet_id=str(spreadsheet_id),
-                tab_name=str(tab),
+                spreadsheet_id=spreadsheet_id,
+                tab_name=tab,
                 initiative_keys=keys,
             )
-        except Exception as e:
-            logger.exception("pm.switch_framework.sync_inputs_failed")
-            for k in keys:
-                status_by_key[k] = "FAILED: sync failed"
-            # Best-effort status write before propagating failure
-            try:
-                from app.sheets.productops_writer import write_status_to_sheet
-                write_status_to_sheet(
-                    ctx.sheets_client,
-                    str(spreadsheet_id),
-                    str(tab),
-                    {k: v for k, v in status_by_key.items() if v is not None},
-                )
-            except Exception:
-                logger.warning("pm.switch_framework.status_write_failed_on_sync_error")
-            raise RuntimeError(f"pm.switch_framework sync_inputs failed: {str(e)[:100]}") from e
 
         # Step A2: Activate for selected initiatives
         svc = ScoringService(db)
-        try:
+        with step("activate", "activate"):
             activated = svc.activate_for_initiatives(keys, commit_every=commit_every)
-        except Exception as e:
-            logger.exception("pm.switch_framework.activate_failed")
-            for k in keys:
-                status_by_key[k] = "FAILED: activate failed"
-            # Best-effort status write before propagating failure
-            try:
-                from app.sheets.productops_writer import write_status_to_sheet
-                write_status_to_sheet(
-                    ctx.sheets_client,
-                    str(spreadsheet_id),
-                    str(tab),
-                    {k: v for k, v in status_by_key.items() if v is not None},
-                )
-            except Exception:
-                logger.warning("pm.switch_framework.status_write_failed_on_activate_error")
-            raise RuntimeError(f"pm.switch_framework activate failed: {str(e)[:100]}") from e
 
-        # Step A3: Write updated scores back to Scoring_Inputs
-        try:
+        # Step A3: Write updated scores back to Scoring_Inputs, with per-row Status (A4) in the same batch
+        with step("write_scores", "write"):
             written = run_flow3_write_scores_to_sheet(
                 db=db,
-                spreadsheet_id=str(spreadsheet_id),
-                tab_name=str(tab),
+                spreadsheet_id=spreadsheet_id,
+                tab_name=tab,
                 initiative_keys=keys,
                 client=ctx.sheets_client,
+                status_by_key=dict.fromkeys(keys, "OK"),
             )
-        except Exception as e:
-            logger.exception("pm.switch_framework.write_scores_failed")
-            for k in keys:
-                status_by_key[k] = "FAILED: write failed"
-            # Best-effort status write before propagating failure
-            try:
-                from app.sheets.productops_writer import write_status_to_sheet
-                write_status_to_sheet(
-                    ctx.sheets_client,
-                    str(spreadsheet_id),
-                    str(tab),
-                    {k: v for k, v in status_by_key.items() if v is not None},
-                )
-            except Exception:
-                logger.warning("pm.switch_framework.status_write_failed_on_write_error")
-            raise RuntimeError(f"pm.switch_framework write_scores failed: {str(e)[:100]}") from e
 
         # All steps succeeded
-        for k in keys:
-            status_by_key[k] = "OK"
-
-        # Step A4: Per-row status write (best-effort)
-        try:
-            from app.sheets.productops_writer import write_status_to_sheet
-            write_status_to_sheet(
-                ctx.sheets_client,
-                str(spreadsheet_id),
-                str(tab),
-                {k: v for k, v in status_by_key.items() if v is not None},
-            )
-        except Exception:
-            logger.warning("pm.switch_framework.status_write_failed")
-
         return {
             "pm_job": "pm.switch_framework",
             "tab": tab,
@@ -2125,17 +2251,11 @@ def _action_pm_save_selected(db: Session, ctx: ActionContext) -> Dict[str, Any]:
 
     Always local-only (no cross-sheet propagation). Best-effort per-row Status write when supported.
     """
-    sheet_ctx = ctx.payload.get("sheet_context") or {}
-    options = ctx.payload.get("options") or {}
-    scope = ctx.payload.get("scope") or {}
-    if not isinstance(sheet_ctx, dict):
-        sheet_ctx = {}
-    if not isinstance(options, dict):
-        options = {}
-    if not isinstance(scope, dict):
-        scope = {}
+    sheet_ctx = ctx.sheet_context
+    options = ctx.options
+    scope = ctx.scope
 
-    scope_type = scope.get("type") if isinstance(scope, dict) else None
+    scope_type = scope.get("type")
     is_scope_all = scope_type == "all"
 
     cfg = settings.PRODUCT_OPS
@@ -2145,14 +2265,7 @@ def _action_pm_save_selected(db: Session, ctx: ActionContext) -> Dict[str, Any]:
     tab = resolved_tab.canonical_tab
     commit_every = int(options.get("commit_every", settings.SCORING_BATCH_COMMIT_EVERY))
 
-    keys = scope.get("initiative_keys") or []
-    if not isinstance(keys, list):
-        keys = []
-    # Sanitize: skip blanks, dedupe
-    keys = [k for k in keys if isinstance(k, str) and k.strip()]
-    keys = list(dict.fromkeys(keys))
-    original_keys = scope.get("initiative_keys")
-    skipped_no_key = (len(original_keys) - len(keys)) if isinstance(original_keys, list) else 0
+    keys, skipped_no_key = _selected_keys(scope)
 
     metrics_kpi_keys = scope.get("kpi_keys") or []
     if not isinstance(metrics_kpi_keys, list):
@@ -2162,6 +2275,7 @@ def _action_pm_save_selected(db: Session, ctx: ActionContext) -> Dict[str, Any]:
 
     if not spreadsheet_id:
         raise ValueError("sheet_context.spreadsheet_id missing and PRODUCT_OPS not configured")
+    spreadsheet_id = str(spreadsheet_id)
 
     supported_tabs = [
         cfg.scoring_inputs_tab if cfg else "Scoring_Inputs",
@@ -2194,22 +2308,17 @@ def _action_pm_save_selected(db: Session, ctx: ActionContext) -> Dict[str, Any]:
             "saved_count": 0,
             "skipped_no_key": skipped_no_key,
             "failed_count": 0,
-            "substeps": [
-                {"step": "save", "status": "skipped", "reason": "no keys selected"},
-                {"step": "status_write", "status": "skipped", "reason": "no keys selected"},
-            ],
+            "substeps": _no_keys_substeps("save", "status_write"),
         }
 
-    status_by_key: Dict[str, Optional[str]] = {k: None for k in keys}
-
     if resolved_tab.kind == "metrics_config":
         # ---------- Branch M: Metrics_Config ----------
         try:
             svc = MetricsConfigSyncService(ctx.sheets_client)
             result = svc.sync_sheet_to_db(
                 db=db,
-                spreadsheet_id=str(spreadsheet_id),
-                tab_name=str(tab),
+                spreadsheet_id=spreadsheet_id,
+                tab_name=tab,
                 commit_every=commit_every,
                 kpi_keys=metrics_kpi_keys or None,
             )
@@ -2239,8 +2348,8 @@ def _action_pm_save_selected(db: Session, ctx: ActionContext) -> Dict[str, Any]:
             svc = KPIContributionsSyncService(ctx.sheets_client)
             result = svc.sync_sheet_to_db(
                 db=db,
-                spreadsheet_id=str(spreadsheet_id),
-                tab_name=str(tab),
+                spreadsheet_id=spreadsheet_id,
+                tab_name=tab,
                 commit_every=commit_every,
                 initiative_keys=keys or None,
             )
@@ -2254,8 +2363,8 @@ def _action_pm_save_selected(db: Session, ctx: ActionContext) -> Dict[str, Any]:
                 writeback_count = write_kpi_contributions_to_sheet(
                     db=db,
                     client=ctx.sheets_client,
-                    spreadsheet_id=str(spreadsheet_id),
-                    tab_name=str(tab),
+                    spreadsheet_id=spreadsheet_id,
+                    tab_name=tab,
                     initiative_keys=keys or None,
                 )
                 logger.info(
@@ -2271,8 +2380,6 @@ def _action_pm_save_selected(db: Session, ctx: ActionContext) -> Dict[str, Any]:
                 
         except Exception as e:
             logger.exception("pm.save_selected.kpi_contributions_sync_failed")
-            for k in keys:
-                status_by_key[k] = "FAILED: save failed"
             raise RuntimeError(f"pm.save_selected kpi_contributions_sync failed: {str(e)[:100]}") from e
 
         return {
@@ -2295,37 +2402,31 @@ def _action_pm_save_selected(db: Session, ctx: ActionContext) -> Dict[str, Any]:
             svc = MathModelSyncService(ctx.sheets_client)
             result = svc.sync_sheet_to_db(
                 db=db,
-                spreadsheet_id=str(spreadsheet_id),
-                tab_name=str(tab),
+                spreadsheet_id=spreadsheet_id,
+                tab_name=tab,
                 commit_every=commit_every,
                 initiative_keys=keys,
             )
             saved = int(result.get("updated", 0))
         except Exception as e:
             logger.exception("pm.save_selected.mathmodels_sync_failed")
-            for k in keys:
-                status_by_key[k] = "FAILED: save failed"
             try:
-                from app.sheets.productops_writer import write_status_to_productops_sheet as write_status_to_sheet
                 write_status_to_sheet(
                     ctx.sheets_client,
-                    str(spreadsheet_id),
-                    str(tab),
-                    {k: v for k, v in status_by_key.items() if v is not None},
+                    spreadsheet_id,
+                    tab,
+                    dict.fromkeys(keys, "FAILED: save failed"),
                 )
             except Exception:
                 logger.warning("pm.save_selected.status_write_failed_on_mathmodels_error")
             raise RuntimeError(f"pm.save_selected mathmodels_sync failed: {str(e)[:100]}") from e
 
-        for k in keys:
-            status_by_key[k] = "OK"
         try:
-            from app.sheets.productops_writer import write_status_to_productops_sheet as write_status_to_sheet
             write_status_to_sheet(
                 ctx.sheets_client,
-                str(spreadsheet_id),
-                str(tab),
-                {k: v for k, v in status_by_key.items() if v is not None},
+                spreadsheet_id,
+                tab,
+                dict.fromkeys(keys, "OK"),
             )
         except Exception:
             logger.warning("pm.save_selected.status_write_failed_mathmodels")
@@ -2349,37 +2450,31 @@ def _action_pm_save_selected(db: Session, ctx: ActionContext) -> Dict[str, Any]:
             svc = ParamsSyncService(ctx.sheets_client)
             result = svc.sync_sheet_to_db(
                 db=db,
-                spreadsheet_id=str(spreadsheet_id),
-                tab_name=str(tab),
+                spreadsheet_id=spreadsheet_id,
+                tab_name=tab,
                 commit_every=commit_every,
                 initiative_keys=keys,
             )
             saved = int(result.get("upserts", 0))
         except Exception as e:
             logger.exception("pm.save_selected.params_sync_failed")
-            for k in keys:
-                status_by_key[k] = "FAILED: save failed"
             try:
-                from app.sheets.productops_writer import write_status_to_productops_sheet as write_status_to_sheet
                 write_status_to_sheet(
                     ctx.sheets_client,
-                    str(spreadsheet_id),
-                    str(tab),
-                    {k: v for k, v in status_by_key.items() if v is not None},
+                    spreadsheet_id,
+                    tab,
+                    dict.fromkeys(keys, "FAILED: save failed"),
                 )
             except Exception:
                 logger.warning("pm.save_selected.status_write_failed_on_params_error")
             raise RuntimeError(f"pm.save_selected params_sync failed: {str(e)[:100]}") from e
 
-        for k in keys:
-            status_by_key[k] = "OK"
         try:
-            from app.sheets.productops_writer import write_status_to_productops_sheet as write_status_to_sheet
             write_status_to_sheet(
                 ctx.sheets_client,
-                str(spreadsheet_id),
-                str(tab),
-                {k: v for k, v in status_by_key.items() if v is not None},
+                spreadsheet_id,
+                tab,
+                dict.fromkeys(keys, "OK"),
             )
         except Exception:
             logger.warning("pm.save_selected.status_write_failed_params")
@@ -2402,38 +2497,32 @@ def _action_pm_save_selected(db: Session, ctx: ActionContext) -> Dict[str, Any]:
         try:
             saved = run_backlog_update(
                 db,
-                spreadsheet_id=str(spreadsheet_id),
-                tab_name=str(tab),
+                spreadsheet_id=spreadsheet_id,
+                tab_name=tab,
                 product_org=options.get("product_org"),
                 commit_every=commit_every,
                 initiative_keys=keys,
             )
         except Exception as e:
             logger.exception("pm.save_selected.backlog_update_failed")
-            for k in keys:
-                status_by_key[k] = "FAILED: save failed"
             # Best-effort status write (only if Backlog has a Status column; skip if not present)
             try:
-                from app.sheets.productops_writer import write_status_to_productops_sheet as write_status_to_sheet
                 write_status_to_sheet(
                     ctx.sheets_client,
-                    str(spreadsheet_id),
-                    str(tab),
-                    {k: v for k, v in status_by_key.items() if v is not None},
+                    spreadsheet_id,
+                    tab,
+                    dict.fromkeys(keys, "FAILED: save failed"),
                 )
             except Exception:
                 logger.warning("pm.save_selected.status_write_failed_on_backlog_error")
             raise RuntimeError(f"pm.save_selected backlog_update failed: {str(e)[:100]}") from e
 
-        for k in keys:
-            status_by_key[k] = "OK"
         try:
-            from app.sheets.productops_writer import write_status_to_productops_sheet as write_status_to_sheet
             write_status_to_sheet(
                 ctx.sheets_client,
-                str(spreadsheet_id),
-                str(tab),
-                {k: v for k, v in status_by_key.items() if v is not None},
+                spreadsheet_id,
+                tab,
+                dict.fromkeys(keys, "OK"),
             )
         except Exception:
             logger.warning("pm.save_selected.status_write_failed_backlog")
@@ -2459,35 +2548,29 @@ def _action_pm_save_selected(db: Session, ctx: ActionContext) -> Dict[str, Any]:
         saved = run_flow3_sync_inputs_to_initiatives(
             db=db,
             commit_every=commit_every,
-            spreadsheet_id=str(spreadsheet_id),
-            tab_name=str(tab),
+            spreadsheet_id=spreadsheet_id,
+            tab_name=tab,
             initiative_keys=initiative_keys_arg,
         )
     except Exception as e:
         logger.exception("pm.save_selected.inputs_sync_failed")
-        for k in keys:
-            status_by_key[k] = "FAILED: save failed"
         try:
-            from app.sheets.productops_writer import write_status_to_productops_sheet as write_status_to_sheet
             write_status_to_sheet(
                 ctx.sheets_client,
-                str(spreadsheet_id),
-                str(tab),
-                {k: v for k, v in status_by_key.items() if v is not None},
+                spreadsheet_id,
+                tab,
+                dict.fromkeys(keys, "FAILED: save failed"),
             )
         except Exception:
             logger.warning("pm.save_selected.status_write_failed_on_inputs_error")
         raise RuntimeError(f"pm.save_selected inputs_sync failed: {str(e)[:100]}") from e
 
-    for k in keys:
-        status_by_key[k] = "OK"
     try:
-        from app.sheets.productops_writer import write_status_to_productops_sheet as write_status_to_sheet
         write_status_to_sheet(
             ctx.sheets_client,
-            str(spreadsheet_id),
-            str(tab),
-            {k: v for k, v in status_by_key.items() if v is not None},
+            spreadsheet_id,
+            tab,
+            dict.fromkeys(keys, "OK"),
         )
     except Exception:
         logger.warning("pm.save_selected.status_write_failed_inputs")
@@ -2542,10 +2625,8 @@ def _action_pm_populate_initiatives(db: Session, ctx: ActionContext) -> Dict[str
                 ValueError: if PRODUCT_OPS not configured
                 RuntimeError: if the populate job itself fails
     """
-    sheet_ctx = ctx.payload.get("sheet_context") or {}
-    options = ctx.payload.get("options") or {}
-    if not isinstance(options, dict):
-        options = {}
+    sheet_ctx = ctx.sheet_context
+    options = ctx.options
     
     cfg = settings.PRODUCT_OPS
     if not cfg:
@@ -2683,9 +2764,9 @@ def _action_pm_save_optimization(db: Session, ctx: ActionContext) -> Dict[str, A
         sync_candidates_from_sheet,
     )
 
-    sheet_ctx = ctx.payload.get("sheet_context") or {}
-    options = ctx.payload.get("options") or {}
-    scope = ctx.payload.get("scope") or {}
+    sheet_ctx = ctx.sheet_context
+    options = ctx.options
+    scope = ctx.scope
 
     save_all = bool(options.get("save_all", False))
 
@@ -2715,6 +2796,10 @@ def _action_pm_save_optimization(db: Session, ctx: ActionContext) -> Dict[str, A
     synced_candidates_count = 0
     errors: List[str] = []
 
+    def record_failure(step: str, label: str, e: Exception) -> None:
+        substeps.append({"step": step, "status": "failed", "error": str(e)[:100]})
+        errors.append(f"{label}: {str(e)[:80]}")
+
     # Determine which syncs to run based on active tab (or save_all)
     do_scenarios = save_all
     do_constraints = save_all
@@ -2756,12 +2841,7 @@ def _action_pm_save_optimization(db: Session, ctx: ActionContext) -> Dict[str, A
             )
         except Exception as e:
             logger.exception("pm.save_optimization.scenarios_failed")
-            substeps.append({
-                "step": "sync_scenarios",
-                "status": "failed",
-                "error": str(e)[:100],
-            })
-            errors.append(f"scenarios: {str(e)[:80]}")
+            record_failure("sync_scenarios", "scenarios", e)
 
     # --- Constraint Sets (reads both Constraints + Targets tabs) ---
     if do_constraints:
@@ -2787,12 +2867,7 @@ def _action_pm_save_optimization(db: Session, ctx: ActionContext) -> Dict[str, A
             )
         except Exception as e:
             logger.exception("pm.save_optimization.constraints_failed")
-            substeps.append({
-                "step": "sync_constraints",
-                "status": "failed",
-                "error": str(e)[:100],
-            })
-            errors.append(f"constraints: {str(e)[:80]}")
+            record_failure("sync_constraints", "constraints", e)
 
     # --- Candidates (PM-editable fields → Initiative DB) ---
     if do_candidates:
@@ -2825,12 +2900,7 @@ def _action_pm_save_optimization(db: Session, ctx: ActionContext) -> Dict[str, A
             )
         except Exception as e:
             logger.exception("pm.save_optimization.candidates_failed")
-            substeps.append({
-                "step": "sync_candidates",
-                "status": "failed",
-                "error": str(e)[:100],
-            })
-            errors.append(f"candidates: {str(e)[:80]}")
+            record_failure("sync_candidates", "candidates", e)
 
     any_failed = any(s.get("status") == "failed" for s in substeps)
     total_synced = synced_scenarios_count + synced_constraints_count + synced_candidates_count
@@ -2879,15 +2949,9 @@ def _action_pm_populate_candidates(db: Session, ctx: ActionContext) -> Dict[str,
     """
     from app.sheets.optimization_candidates_writer import populate_candidates_from_db
     
-    sheet_ctx = ctx.payload.get("sheet_context") or {}
-    options = ctx.payload.get("options") or {}
-    scope = ctx.payload.get("scope") or {}
-    if not isinstance(sheet_ctx, dict):
-        sheet_ctx = {}
-    if not isinstance(options, dict):
-        options = {}
-    if not isinstance(scope, dict):
-        scope = {}
+    sheet_ctx = ctx.sheet_context
+    options = ctx.options
+    scope = ctx.scope
 
     oc = settings.OPTIMIZATION_CENTER
     if not oc:
@@ -2934,13 +2998,7 @@ def _action_pm_populate_candidates(db: Session, ctx: ActionContext) -> Dict[str,
         raise ValueError("Missing scenario_name or constraint_set_name in options for pm.populate_candidates")
     
     # Extract initiative keys from scope (optional filter)
-    keys = scope.get("initiative_keys") or []
-    if not isinstance(keys, list):
-        keys = []
-    
-    # Sanitize: skip blanks, dedupe
-    keys = [k for k in keys if isinstance(k, str) and k.strip()]
-    keys = list(dict.fromkeys(keys))
+    keys, _ = _selected_keys(scope)
     
     logger.info(
         "pm.populate_candidates.starting",
@@ -3013,8 +3071,8 @@ def _action_pm_optimize_run_selected_candidates(db: Session, ctx: ActionContext)
         sync_candidates_from_sheet,
     )
     
-    sheet_ctx = ctx.payload.get("sheet_context") or {}
-    options = ctx.payload.get("options") or {}
+    sheet_ctx = ctx.sheet_context
+    options = ctx.options
     
     # Extract parameters
     scenario_name = options.get("scenario_name")
@@ -3025,7 +3083,7 @@ def _action_pm_optimize_run_selected_candidates(db: Session, ctx: ActionContext)
         raise ValueError("Missing scenario_name or constraint_set_name in options for pm.optimize_run_selected_candidates")
     
     # Check if scope.initiative_keys is provided (explicit selection)
-    scope = ctx.payload.get("scope") or {}
+    scope = ctx.scope
     explicit_keys = scope.get("initiative_keys") or []
     
     # Track sync results for reporting
@@ -3209,8 +3267,8 @@ def _action_pm_optimize_run_all_candidates(db: Session, ctx: ActionContext) -> D
         sync_candidates_from_sheet,
     )
     
-    sheet_ctx = ctx.payload.get("sheet_context") or {}
-    options = ctx.payload.get("options") or {}
+    sheet_ctx = ctx.sheet_context
+    options = ctx.options
     
     # Extract parameters
     scenario_name = options.get("scenario_name")
@@ -3397,7 +3455,7 @@ def _action_pm_explain_selection(db: Session, ctx: ActionContext) -> Dict[str, A
     from app.services.optimization.constraint_explainer import evaluate_selection, suggest_repairs
     from app.services.optimization.optimization_compiler import normalize_initiative_key
 
-    options = ctx.payload.get("options") or {}
+    options = ctx.options
     scenario_name = options.get("scenario_name")
     constraint_set_name = options.get("constraint_set_name")
     sync_candidates = bool(options.get("sync_candidates_first", False))
@@ -3405,13 +3463,11 @@ def _action_pm_explain_selection(db: Session, ctx: ActionContext) -> Dict[str, A
     if not scenario_name or not constraint_set_name:
         raise ValueError("Missing scenario_name or constraint_set_name in options for pm.explain_selection")
 
-    scope = ctx.payload.get("scope") or {}
+    scope = ctx.scope
     explicit_keys = scope.get("initiative_keys") or []
 
     # Resolve sheet config: prefer sheet_context, fallback to settings.OPTIMIZATION_CENTER
-    sheet_ctx = ctx.payload.get("sheet_context") or {}
-    if not isinstance(sheet_ctx, dict):
-        sheet_ctx = {}
+    sheet_ctx = ctx.sheet_context
     
     cfg = settings.OPTIMIZATION_CENTER
     spreadsheet_id = sheet_ctx.get("spreadsheet_id") or (cfg.spreadsheet_id if cfg else None)
@@ -3533,12 +3589,8 @@ def _action_pm_refresh_tab_instructions(db: Session, ctx: ActionContext) -> Dict
     from app.sheets.instructions_registry import get_tab_instructions
     from app.sheets.instructions_writer import write_tab_instructions_row
 
-    sheet_ctx = ctx.payload.get("sheet_context") or {}
-    options = ctx.payload.get("options") or {}
-    if not isinstance(sheet_ctx, dict):
-        sheet_ctx = {}
-    if not isinstance(options, dict):
-        options = {}
+    sheet_ctx = ctx.sheet_context
+    options = ctx.options
 
     sheet_type = str(options.get("sheet_type") or "").strip().lower()
     spreadsheet_id = sheet_ctx.get("spreadsheet_id")
@@ -3575,12 +3627,8 @@ def _action_pm_refresh_sheet_instructions(db: Session, ctx: ActionContext) -> Di
     from app.sheets.instructions_registry import INSTRUCTIONS_REGISTRY
     from app.sheets.instructions_writer import write_tab_instructions_row
 
-    sheet_ctx = ctx.payload.get("sheet_context") or {}
-    options = ctx.payload.get("options") or {}
-    if not isinstance(sheet_ctx, dict):
-        sheet_ctx = {}
-    if not isinstance(options, dict):
-        options = {}
+    sheet_ctx = ctx.sheet_context
+    options = ctx.options
 
     sheet_type = str(options.get("sheet_type") or "").strip().lower()
     only_tabs = options.get("tabs") or None
@@ -3672,3 +3720,7 @@ _ACTION_REGISTRY: Dict[str, ActionFn] = {
     "pm.refresh_tab_instructions": _action_pm_refresh_tab_instructions,
     "pm.refresh_sheet_instructions": _action_pm_refresh_sheet_instructions,
 }
+
+# The registry is static after import; precompute lookups used for validation and error messages
+_ACTION_KEYS: frozenset[str] = frozenset(_ACTION_REGISTRY)
+_ACTION_KEYS_CSV: str = ", ".join(sorted(_ACTION_REGISTRY))
@@ -13,13 +13,13 @@ from typing import Any, Dict, List, Optional, Tuple, cast
 from pydantic import TypeAdapter, ValidationError
 
 from app.schemas.optimization_center import (
+    EMPTY_ROW_WARNING,
     BundleRowSchema,
     BundleCompiled,
     CapacityCap,
     CapacityCapRowSchema,
     CapacityFloor,
     CapacityFloorRowSchema,
-    ConstraintRow,
     ConstraintSetCompiled,
     ExcludeInitiativeRowSchema,
     ExcludePairRowSchema,
@@ -29,7 +29,7 @@ from app.schemas.optimization_center import (
     TargetConstraint,
     TargetRowSchema,
     ValidationMessage,
-    validate_constraint_row,
+    validate_constraint_rows_batch,
     validate_target_row,
 )
 
@@ -67,14 +67,17 @@ def _normalize_key_list(keys: list[str]) -> list[str]:
             out.append(nk)
     return out
 
-_CONSTRAINT_ADAPTER = TypeAdapter(ConstraintRow)
 _TARGET_ADAPTER = TypeAdapter(TargetRowSchema)
+# Underlying pydantic-core validator, called directly per row
+_TARGET_VALIDATOR = _TARGET_ADAPTER.validator
 
 
 def _bucket(compiled: Dict[Tuple[str, str], ConstraintSetCompiled], scenario: str, cset: str) -> ConstraintSetCompiled:
     key = (scenario.strip(), cset.strip())
     if key not in compiled:
-        compiled[key] = ConstraintSetCompiled()
+        # Compiled sets are only ever filled from rows that already passed schema
+        # validation, so skip pydantic validation when creating them.
+        compiled[key] = ConstraintSetCompiled.model_construct()
     return compiled[key]
 
 
@@ -87,6 +90,7 @@ def compile_constraint_sets(
 
     Returns a tuple of (compiled_by_key, validation_messages).
     Rows with errors are skipped; warnings are preserved in the messages list.
+    Constraint row dicts are normalized in place during validation.
     
     This is a pure function with no I/O dependencies.
     """
@@ -94,9 +98,9 @@ def compile_constraint_sets(
     messages: List[ValidationMessage] = []
     compiled: Dict[Tuple[str, str], ConstraintSetCompiled] = {}
 
-    # Constraints first
-    for row_num, raw in constraint_rows:
-        msg = validate_constraint_row(row_num, raw)
+    # Constraints first: one batched schema pass yields both feedback and parsed rows
+    for msg, parsed in validate_constraint_rows_batch(constraint_rows, inplace=True):
+        row_num = msg.row_num
         if msg.errors:
             logger.info("opt_compile.constraint_row_errors", extra={"row": row_num, "key": msg.key, "errors": msg.errors})
             messages.append(msg)
@@ -106,32 +110,9 @@ def compile_constraint_sets(
                 "opt_compile.constraint_row_warnings", extra={"row": row_num, "key": msg.key, "warnings": msg.warnings}
             )
             messages.append(msg)
-        
-        normalized = dict(raw)
-        if "constraint_type" in normalized:
-            normalized["constraint_type"] = str(normalized["constraint_type"]).strip().lower().replace(" ", "_")
-        if "dimension" in normalized:
-            normalized["dimension"] = str(normalized["dimension"]).strip().lower()
-        if "dimension_key" in normalized and normalized.get("dimension_key") is not None:
-            # Preserve case for free-text identifiers (bundles, bundle keys, etc.).
-            # Only strip here; specific constraint handlers will normalize as appropriate.
-            normalized["dimension_key"] = str(normalized["dimension_key"]).strip()
-        
-        try:
-            parsed = _CONSTRAINT_ADAPTER.validate_python(normalized)
-        except ValidationError as ve:
-            logger.warning(
-                "opt_compile.constraint_row_parse_failed",
-                extra={"row": row_num, "key": msg.key, "errors": [err["msg"] for err in ve.errors()][:3]},
-            )
-            messages.append(
-                ValidationMessage(
-                    row_num=row_num,
-                    key=msg.key,
-                    errors=[err["msg"] for err in ve.errors()],
-                    warnings=[],
-                )
-            )
+            if EMPTY_ROW_WARNING in msg.warnings:
+                continue
+        if parsed is None:  # unreachable: only error and empty rows come back without a model
             continue
 
         constraint_set = _bucket(compiled, str(parsed.scenario_name), str(parsed.constraint_set_name))
@@ -156,7 +137,7 @@ def compile_constraint_sets(
                 members = [p.strip() for p in (parsed.bundle_member_keys or "").split("|") if p.strip()]
                 members = _normalize_key_list(members)
                 if members:
-                    constraint_set.bundles.append(BundleCompiled(bundle_key=str(parsed.dimension_key), members=members))
+                    constraint_set.bundles.append(BundleCompiled.model_construct(bundle_key=str(parsed.dimension_key), members=members))
         elif isinstance(parsed, ExcludePairRowSchema):
             parts = [p.strip() for p in (parsed.dimension_key or "").split("|") if p.strip()]
             if len(parts) >= 2:
@@ -172,8 +153,7 @@ def compile_constraint_sets(
                     ValidationMessage(
                         row_num=row_num,
                         key=msg.key,
-                        errors=[],
-                        warnings=["exclude_pair must contain two initiative keys separated by '|'"],
+                        warnings=("exclude_pair must contain two initiative keys separated by '|'",),
                     )
                 )
         elif isinstance(parsed, ExcludeInitiativeRowSchema):
@@ -218,6 +198,8 @@ def compile_constraint_sets(
                 "opt_compile.target_row_warnings", extra={"row": row_num, "key": msg.key, "warnings": msg.warnings}
             )
             messages.append(msg)
+            if EMPTY_ROW_WARNING in msg.warnings:
+                continue
         
         normalized = dict(raw)
         if "dimension" in normalized and normalized.get("dimension") is not None:
@@ -228,7 +210,7 @@ def compile_constraint_sets(
             normalized["kpi_key"] = str(normalized["kpi_key"]).strip()
         
         try:
-            parsed_target = _TARGET_ADAPTER.validate_python(normalized)
+            parsed_target = _TARGET_VALIDATOR.validate_python(normalized)
         except ValidationError as ve:
             logger.warning(
                 "opt_compile.target_row_parse_failed",
@@ -245,8 +227,7 @@ def compile_constraint_sets(
                             str(normalized.get("kpi_key", "")).strip(),
                         ]
                     ).strip("|"),
-                    errors=[err["msg"] for err in ve.errors()],
-                    warnings=[],
+                    errors=tuple(err["msg"] for err in ve.errors()),
                 )
             )
             continue
@@ -13,7 +13,7 @@ Key principles:
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional
 from datetime import datetime, timezone
 
 from app.schemas.optimization_problem import OptimizationProblem, Candidate
@@ -28,11 +28,21 @@ logger = logging.getLogger(__name__)
 KPI_SCALE = 1_000_000
 
 
+def selected_keys_of(solution: OptimizationSolution) -> FrozenSet[str]:
+    """Initiative keys the solver picked (selected=True).
+
+    Callers building several artifacts for one run compute this once and pass it to
+    each builder; it is not cached on the (mutable) solution model.
+    """
+    return frozenset(item.initiative_key for item in solution.selected if item.selected)
+
+
 def build_runs_row(
     *,
     run: OptimizationRun,
     problem: OptimizationProblem,
     solution: OptimizationSolution,
+    selected_keys: Optional[FrozenSet[str]] = None,
 ) -> Dict[str, Any]:
     """
     Build single row dict for Runs tab (one row per optimization run).
@@ -41,6 +51,7 @@ def build_runs_row(
         run: OptimizationRun DB model
         problem: OptimizationProblem schema (frozen snapshot)
         solution: OptimizationSolution from solver
+        selected_keys: selected_keys_of(solution), when the caller already has it
         
     Returns:
         Dict with Runs tab columns
@@ -52,8 +63,9 @@ def build_runs_row(
     selected_items = solution.selected or []
     selected_count = sum(1 for item in selected_items if item.selected)
     
-    # Build set of selected initiative keys (only selected=True)
-    selected_keys = {item.initiative_key for item in selected_items if item.selected}
+    # Set of selected initiative keys (only selected=True)
+    if selected_keys is None:
+        selected_keys = selected_keys_of(solution)
     
     # Compute total capacity used (sum of engineering_tokens for selected)
     capacity_used = sum(
@@ -72,7 +84,7 @@ def build_runs_row(
     if solution.status == "infeasible" and "feasibility_summary" in diagnostics:
         gap_summary = f"INFEASIBLE: {diagnostics['feasibility_summary']}"
     else:
-        gap_summary = _build_gap_summary(problem, solution)
+        gap_summary = _build_gap_summary(problem, selected_keys)
     
     # Extract values from problem snapshot (stable/frozen)
     scenario_name = getattr(problem, "scenario_name", None) or "unknown"
@@ -103,6 +115,7 @@ def build_results_rows(
     run_id: str,
     problem: OptimizationProblem,
     solution: OptimizationSolution,
+    selected_keys: Optional[FrozenSet[str]] = None,
 ) -> List[Dict[str, Any]]:
     """
     Build N rows for Results tab (one per candidate in problem).
@@ -114,12 +127,13 @@ def build_results_rows(
         run_id: Unique run identifier
         problem: OptimizationProblem schema (frozen snapshot)
         solution: OptimizationSolution from solver
+        selected_keys: selected_keys_of(solution), when the caller already has it
         
     Returns:
         List of dicts (one per candidate)
     """
-    selected_items = solution.selected or []
-    selected_keys = {item.initiative_key for item in selected_items if item.selected}
+    if selected_keys is None:
+        selected_keys = selected_keys_of(solution)
     objective_spec = problem.objective
     obj_mode = str(objective_spec.mode).lower() if objective_spec.mode else "unknown"
     
@@ -191,6 +205,7 @@ def build_gaps_rows(
     run_id: str,
     problem: OptimizationProblem,
     solution: OptimizationSolution,
+    selected_keys: Optional[FrozenSet[str]] = None,
 ) -> List[Dict[str, Any]]:
     """
     Build M rows for Gaps_and_Alerts tab (one per target constraint).
@@ -201,13 +216,14 @@ def build_gaps_rows(
         run_id: Unique run identifier
         problem: OptimizationProblem schema
         solution: OptimizationSolution from solver
+        selected_keys: selected_keys_of(solution), when the caller already has it
         
     Returns:
         List of dicts (one per target)
     """
     targets = problem.constraint_set.targets or {}
-    selected_items = solution.selected or []
-    selected_keys = {item.initiative_key for item in selected_items if item.selected}
+    if selected_keys is None:
+        selected_keys = selected_keys_of(solution)
     
     rows = []
     for dimension_raw, dim_map in targets.items():
@@ -309,7 +325,7 @@ def _compute_objective_contribution(
 def _compute_achieved_contribution(
     *,
     candidates: List[Candidate],
-    selected_keys: set[str],
+    selected_keys: FrozenSet[str],
     dimension: str,
     dimension_key: str,
     kpi_key: str,
@@ -389,15 +405,13 @@ def _compute_severity(gap: float, target: float) -> str:
         return "CRITICAL"
 
 
-def _build_gap_summary(problem: OptimizationProblem, solution: OptimizationSolution) -> str:
+def _build_gap_summary(problem: OptimizationProblem, selected_keys: FrozenSet[str]) -> str:
     """
     Build short gap summary string for Runs tab.
     
     Format: "UK GMV: -120; ALL retention: -0.01" (first 3 gaps, truncated)
     """
     targets = problem.constraint_set.targets or {}
-    selected_items = solution.selected or []
-    selected_keys = {item.initiative_key for item in selected_items if item.selected}
     
     gap_items = []
     for dimension_raw, dim_map in targets.items():
@@ -241,8 +241,7 @@ def sync_constraint_sets_from_sheets(
                     ValidationMessage(
                         row_num=0,
                         key=f"{scenario_name}|{constraint_set_name}",
-                        errors=[f"Scenario not found: {scenario_name}"],
-                        warnings=[],
+                        errors=(f"Scenario not found: {scenario_name}",),
                     )
                 )
                 continue
@@ -33,6 +33,15 @@ logger = logging.getLogger(__name__)
 TOKEN_SCALE = 1000
 KPI_SCALE = 1_000_000  # preserve up to 6 decimals (good for rates like conversion)
 
+# CP-SAT integer status codes -> SolveStatus strings (anything else maps to "unknown")
+_CP_SAT_STATUS: Dict[int, str] = {
+    cp_model.OPTIMAL: "optimal",
+    cp_model.FEASIBLE: "feasible",
+    cp_model.INFEASIBLE: "infeasible",
+    cp_model.MODEL_INVALID: "model_invalid",
+}
+_SOLVED_STATUSES = frozenset({"optimal", "feasible"})
+
 
 @dataclass(frozen=True)
 class CpSatConfig:
@@ -87,15 +96,47 @@ def _get_candidate_dim_value(c: "Candidate", dimension: str) -> Optional[str]:
     # Unknown dimension => not supported in v1
     return None
 
-def _get_candidate_dim_value_for_targets(c: "Candidate", dimension: str) -> Optional[str]:
+_SLICE_DIMENSIONS = ("country", "department", "category", "program", "product", "segment")
+
+
+def _build_candidate_slices(candidates: List["Candidate"]) -> Dict[str, Dict[str, List["Candidate"]]]:
+    """
+    Group candidates by (dimension, lowercased dimension value) in a single pass.
+
+    Caps, floors and target floors all select a slice by exact lowercased match on
+    the candidate's dimension value, so index once instead of rescanning the whole
+    candidate list for every constraint. Candidate order is preserved within a slice.
+    """
+    slices: Dict[str, Dict[str, List["Candidate"]]] = {dim: {} for dim in _SLICE_DIMENSIONS}
+    for c in candidates:
+        for dim, by_value in slices.items():
+            v = _get_candidate_dim_value(c, dim)
+            if v is None:
+                continue
+            by_value.setdefault(str(v).strip().lower(), []).append(c)
+    slices["all"] = {"all": list(candidates)}
+    return slices
+
+
+def _scaled_kpi_contributions(candidates: List["Candidate"], kpi_key: str) -> Dict[str, int]:
     """
-    Extract dimension value from candidate for target matching.
-    Lowercases the result to match target compiler's lowercasing behavior.
+    Scaled-integer contributions to one KPI, keyed by initiative_key.
+
+    Candidates with a missing, non-numeric or zero (after scaling) contribution are
+    omitted, so every entry is a usable term for a target floor on this KPI.
     """
-    v = _get_candidate_dim_value(c, dimension)
-    if v is None:
-        return None
-    return str(v).strip().lower()
+    out: Dict[str, int] = {}
+    for c in candidates:
+        contrib = c.kpi_contributions.get(kpi_key)
+        if contrib is None:
+            continue
+        try:
+            contrib_int = _scaled_int(float(contrib), KPI_SCALE)
+        except Exception:
+            continue
+        if contrib_int != 0:
+            out[c.initiative_key] = contrib_int
+    return out
 
 
 def _resolve_kpi_scale_from_targets_any(
@@ -525,6 +566,9 @@ class OrtoolsCpSatSolverAdapter:
             },
         )
 
+        # Slice index shared by caps, floors and target floors (built once per solve)
+        slices = _build_candidate_slices(problem.candidates)
+
         # ---- Capacity caps (Step 6) ----
         # We may have both:
         #  - scenario.capacity_total_tokens
@@ -551,16 +595,8 @@ class OrtoolsCpSatSolverAdapter:
                 dim_s = str(dim).strip().lower()
                 dkey_s = str(dim_key).strip().lower()
 
-                # Determine which candidates are in this slice
-                in_slice: List[str] = []
-                for c in problem.candidates:
-                    v = _get_candidate_dim_value(c, dim_s)
-                    if v is None:
-                        continue
-                    # For targets you lowercase country; for caps you decided not to lowercase dimension_key.
-                    # Keep exact match semantics.
-                    if str(v).strip().lower() == dkey_s:
-                        in_slice.append(c.initiative_key)
+                # Determine which candidates are in this slice (exact lowercased match)
+                in_slice = [c.initiative_key for c in slices.get(dim_s, {}).get(dkey_s, ())]
 
                 # If cap is defined for a slice but no candidates match, that's okay; cap is vacuously satisfied.
                 if not in_slice:
@@ -625,21 +661,8 @@ class OrtoolsCpSatSolverAdapter:
 
                 dkey_s = str(dim_key).strip().lower()
 
-                # Build slice token sum
-                slice_keys: List[str] = []
-                for c in problem.candidates:
-                    v = _get_candidate_dim_value(c, dim_s)
-                    if v is None:
-                        continue
-
-                    if dim_s == "all":
-                        if dkey_s != "all":
-                            continue
-                        slice_keys.append(c.initiative_key)
-                    else:
-                        # Floors match exact dimension_key (same semantics as caps)
-                        if str(v).strip().lower() == dkey_s:
-                            slice_keys.append(c.initiative_key)
+                # Build slice token sum (floors match exact dimension_key, same semantics as caps)
+                slice_keys = [c.initiative_key for c in slices.get(dim_s, {}).get(dkey_s, ())]
 
                 if not slice_keys:
                     floors_empty_slice += 1
@@ -692,6 +715,8 @@ class OrtoolsCpSatSolverAdapter:
         target_floors_empty_slice = 0
         target_floors_already_satisfied = 0  # baseline >= target cases
         target_floor_details: List[Dict[str, Any]] = []  # For diagnostics
+        # Scaled contributions per KPI, shared by every slice that targets the same KPI
+        scaled_contribs: Dict[str, Dict[str, int]] = {}
 
         # targets shape: {dimension: {dimension_key: {kpi_key: {type,value,baseline?,notes?}}}}
         for dim, dim_map in targets.items():
@@ -809,32 +834,16 @@ class OrtoolsCpSatSolverAdapter:
                     })
 
                     # Build linear expression for this slice and KPI
-                    terms = []
-                    for c in problem.candidates:
-                        # Slice membership check
-                        c_dim_val = _get_candidate_dim_value_for_targets(c, dim_s)
-                        if c_dim_val is None:
-                            continue
-                        if dim_s == "all":
-                            # only accept all/all
-                            if dim_key_s != "all":
-                                continue
-                        else:
-                            if c_dim_val != dim_key_s:
-                                continue
-
-                        # Contribution lookup
-                        contrib = c.kpi_contributions.get(str(kpi_key))
-                        if contrib is None:
-                            continue
-                        try:
-                            contrib_int = _scaled_int(float(contrib), KPI_SCALE)
-                        except Exception:
-                            continue
-                        if contrib_int == 0:
-                            continue
-
-                        terms.append(contrib_int * x[c.initiative_key])
+                    kpi_ints = scaled_contribs.get(str(kpi_key))
+                    if kpi_ints is None:
+                        kpi_ints = scaled_contribs[str(kpi_key)] = _scaled_kpi_contributions(
+                            problem.candidates, str(kpi_key)
+                        )
+                    terms = [
+                        kpi_ints[c.initiative_key] * x[c.initiative_key]
+                        for c in slices.get(dim_s, {}).get(dim_key_s, ())
+                        if c.initiative_key in kpi_ints
+                    ]
 
                     floor_int = _scaled_int(floor_val, KPI_SCALE)
 
@@ -1140,18 +1149,13 @@ class OrtoolsCpSatSolverAdapter:
 
         status = solver.Solve(model)
 
-        status_map = {
-            cp_model.OPTIMAL: "optimal",
-            cp_model.FEASIBLE: "feasible",
-            cp_model.INFEASIBLE: "infeasible",
-            cp_model.MODEL_INVALID: "model_invalid",
-        }
-        out_status = status_map.get(status, "unknown")
+        out_status = _CP_SAT_STATUS.get(status, "unknown")
+        has_solution = out_status in _SOLVED_STATUSES
 
         # Extract objective value if solution found
         objective_value_raw = 0
         objective_value = 0.0
-        if out_status in {"optimal", "feasible"}:
+        if has_solution:
             try:
                 objective_value_raw = int(solver.ObjectiveValue())
                 objective_value = float(objective_value_raw) / KPI_SCALE
@@ -1173,7 +1177,7 @@ class OrtoolsCpSatSolverAdapter:
 
         for c in problem.candidates:
             key = c.initiative_key
-            is_sel = bool(solver.Value(x[key])) if out_status in {"optimal", "feasible"} else False
+            is_sel = bool(solver.Value(x[key])) if has_solution else False
             if is_sel:
                 used_tokens_int += token_cost[key]
             selected_items.append(
@@ -1184,7 +1188,7 @@ class OrtoolsCpSatSolverAdapter:
                 )
             )
 
-        used_tokens = used_tokens_int / TOKEN_SCALE if out_status in {"optimal", "feasible"} else None
+        used_tokens = used_tokens_int / TOKEN_SCALE if has_solution else None
 
         selected_count = sum(1 for item in selected_items if item.selected)
         logger.info(
@@ -240,13 +240,27 @@ def write_backlog_fields_batch(
     updates_by_key: Dict[str, Dict[str, Any]],
 ) -> int:
     """Update specific backlog columns for selected initiative rows only."""
+    written_keys, _ = _write_backlog_fields(client, spreadsheet_id, tab_name, updates_by_key)
+    return len(written_keys)
+
+
+def _write_backlog_fields(
+    client: SheetsClient,
+    spreadsheet_id: str,
+    tab_name: str,
+    updates_by_key: Dict[str, Dict[str, Any]],
+) -> tuple[set[str], set[str]]:
+    """Write targeted backlog cells; return (keys with a cell written, keys found on the sheet).
+
+    A key can be found but not written when none of its fields has a column on the sheet.
+    """
     if not updates_by_key:
-        return 0
+        return set(), set()
 
     header_values = client.get_values(spreadsheet_id, f"{tab_name}!1:1")
     if not header_values or not header_values[0]:
         logger.warning("backlog_writer.fields.empty_sheet", extra={"tab": tab_name})
-        return 0
+        return set(), set()
 
     headers = header_values[0]
     norm_headers = [normalize_header(str(h)) for h in headers]
@@ -267,7 +281,7 @@ def write_backlog_fields_batch(
 
     if key_col is None:
         logger.warning("backlog_writer.fields.missing_key_column", extra={"tab": tab_name})
-        return 0
+        return set(), set()
 
     start_row = data_start_row(tab_name)
     key_col_a1 = _col_index_to_a1(key_col + 1)
@@ -275,12 +289,14 @@ def write_backlog_fields_batch(
 
     batch_updates: List[Dict[str, Any]] = []
     updated_keys: set[str] = set()
+    found_keys: set[str] = set()
 
     for row_number, row in enumerate(key_values, start=start_row):
         key = str(row[0]).strip() if row else ""
         field_updates = updates_by_key.get(key)
         if not key or not field_updates:
             continue
+        found_keys.add(key)
 
         wrote_any = False
         for field, value in field_updates.items():
@@ -304,7 +320,50 @@ def write_backlog_fields_batch(
             chunk = batch_updates[start : start + TARGETED_BACKLOG_BATCH_UPDATE_SIZE]
             client.batch_update_values(spreadsheet_id, chunk)
 
-    return len(updated_keys)
+    return updated_keys, found_keys
+
+
+def write_backlog_fields_from_db(
+    db: Session,
+    client: SheetsClient,
+    spreadsheet_id: str,
+    tab_name: str = "Backlog",
+    *,
+    initiative_keys: List[str],
+    fields: List[str],
+) -> dict[str, int]:
+    """Refresh selected backlog columns for selected initiatives from their DB values.
+
+    Targeted alternative to write_backlog_from_db for jobs that only changed a few
+    fields on a known set of initiatives. Rows are located by Initiative Key; columns
+    missing from the sheet are skipped.
+
+    Returns:
+        Dict with counts: {initiatives_written, initiatives_missing}; missing counts
+        initiatives with no row on the sheet, not rows where no column matched.
+    """
+    if not initiative_keys or not fields:
+        return {"initiatives_written": 0, "initiatives_missing": 0}
+
+    initiatives: List[Initiative] = (
+        db.query(Initiative).filter(Initiative.initiative_key.in_(initiative_keys)).all()
+    )
+    now_ts = datetime.now(timezone.utc)
+    updates_by_key: Dict[str, Dict[str, Any]] = {
+        str(ini.initiative_key): {
+            field: _to_sheet_value(_initiative_field_value(field, ini, now_ts)) for field in fields
+        }
+        for ini in initiatives
+    }
+
+    written_keys, found_keys = _write_backlog_fields(client, spreadsheet_id, tab_name, updates_by_key)
+    written = len(written_keys)
+
+    logger.info(
+        "backlog.targeted_write_complete",
+        extra={"tab": tab_name, "initiatives": len(updates_by_key), "written": written},
+    )
+    return {"initiatives_written": written, "initiatives_missing": len(updates_by_key) - len(found_keys)}
 
 
 def write_backlog_from_db(
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 import logging
 
 from googleapiclient.discovery import build
@@ -28,10 +28,14 @@ class SheetsClient:
 
     - get_values returns evaluated values (not formulas) by default.
     - update_values writes a 2D block with USER_ENTERED semantics by default.
+    - Requests are retried on rate limits (429) and server errors with exponential
+      backoff plus jitter. Appends and structural batchUpdate requests (add/delete
+      protected ranges, inserts) are not idempotent and are sent once.
     """
 
-    def __init__(self, service) -> None:
+    def __init__(self, service, num_retries: Optional[int] = None) -> None:
         self.service = service
+        self.num_retries = settings.SHEETS_API_NUM_RETRIES if num_retries is None else num_retries
 
     def get_values(
         self,
@@ -48,7 +52,7 @@ class SheetsClient:
                 range=range_,
                 valueRenderOption=value_render_option,
             )
-            .execute()
+            .execute(num_retries=self.num_retries)
         )
         return resp.get("values", [])
 
@@ -73,7 +77,7 @@ class SheetsClient:
                 ranges=ranges,
                 valueRenderOption=value_render_option,
             )
-            .execute()
+            .execute(num_retries=self.num_retries)
         )
         return resp.get("valueRanges", [])
 
@@ -95,7 +99,7 @@ class SheetsClient:
                 valueInputOption=value_input_option,
                 body=body,
             )
-            .execute()
+            .execute(num_retries=self.num_retries)
         )
 
     def clear_values(self, spreadsheet_id: str, range_: str) -> None:
@@ -104,7 +108,7 @@ class SheetsClient:
             self.service.spreadsheets()
             .values()
             .clear(spreadsheetId=spreadsheet_id, range=range_, body={})
-            .execute()
+            .execute(num_retries=self.num_retries)
         )
 
     def batch_clear_values(self, spreadsheet_id: str, ranges: List[str]) -> None:
@@ -116,7 +120,7 @@ class SheetsClient:
             self.service.spreadsheets()
             .values()
             .batchClear(spreadsheetId=spreadsheet_id, body={"ranges": ranges})
-            .execute()
+            .execute(num_retries=self.num_retries)
         )
 
     def get_sheet_grid_size(self, spreadsheet_id: str, tab_name: str) -> tuple[int, int]:
@@ -127,7 +131,7 @@ class SheetsClient:
         resp = (
             self.service.spreadsheets()
             .get(spreadsheetId=spreadsheet_id, fields="sheets.properties(title,gridProperties)")
-            .execute()
+            .execute(num_retries=self.num_retries)
         )
         sheets = resp.get("sheets", [])
         for sh in sheets:
@@ -151,7 +155,7 @@ class SheetsClient:
                 spreadsheetId=spreadsheet_id,
                 fields="sheets(properties(title,sheetId,gridProperties),protectedRanges)",
             )
-            .execute()
+            .execute(num_retries=self.num_retries)
         )
         for sheet in resp.get("sheets", []):
             props = sheet.get("properties", {})
@@ -196,7 +200,11 @@ class SheetsClient:
         return resp
 
     def batch_update(self, spreadsheet_id: str, requests: list[dict]) -> None:
-        """Send a batchUpdate with the provided list of requests."""
+        """Send a batchUpdate with the provided list of requests.
+
+        Not retried: a structural request that succeeded server-side but timed out
+        would be applied twice on retry (e.g. a duplicate addProtectedRange).
+        """
         if not requests:
             return
         body = {"requests": requests}
@@ -239,7 +247,7 @@ class SheetsClient:
             self.service.spreadsheets()
             .values()
             .batchUpdate(spreadsheetId=spreadsheet_id, body=body)
-            .execute()
+            .execute(num_retries=self.num_retries)
         )
         
         logger.debug(
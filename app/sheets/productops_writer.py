@@ -37,6 +37,8 @@ _SCORING_INPUTS_KEY_HEADERS = ["initiative_key", "Initiative Key", "initiative k
 _SCORING_INPUTS_TITLE_HEADERS = ["initiative_title", "Initiative Title", "initiative title", "title_of_initiative"]
 _SCORING_INPUTS_KEY_HEADER_SET = {_normalize_header(h) for h in _SCORING_INPUTS_KEY_HEADERS}
 _SCORING_INPUTS_TITLE_HEADER_SET = {_normalize_header(h) for h in _SCORING_INPUTS_TITLE_HEADERS}
+# Normalized headers recognized as the per-row Status column
+_STATUS_HEADERS = frozenset({"status", "last_run_status", "run_status"})
 
 
 def _now_iso() -> str:
@@ -70,6 +72,7 @@ def write_scores_to_productops_sheet(
     *,
     initiative_keys: List[str] | None = None,
     warnings_by_key: Dict[str, Any] | None = None,
+    status_by_key: Dict[str, str] | None = None,
 ) -> int:
     """Write per-framework scores from DB to Product Ops sheet using targeted cell updates.
 
@@ -84,6 +87,8 @@ def write_scores_to_productops_sheet(
         client: SheetsClient instance
         spreadsheet_id: Product Ops spreadsheet ID
         tab_name: Sheet tab name (default: "Scoring_Inputs")
+        status_by_key: Optional per-row Status messages, written in the same batch
+            (same rules as write_status_to_productops_sheet)
 
     Returns:
         Number of initiatives with scores updated in sheet
@@ -112,10 +117,14 @@ def write_scores_to_productops_sheet(
 
     # Step 2: Find which columns correspond to each score field + initiative_key
     col_map: Dict[str, int] = {}  # field_name -> column_index (0-based)
+    status_col: int | None = None
     for i, nh in enumerate(norm_headers):
         if nh == "initiative_key":
             col_map["initiative_key"] = i
             continue
+        if nh in _STATUS_HEADERS:
+            status_col = i
+            continue
         if nh in {"updated_source", "updated source"}:
             col_map["updated_source"] = i
             continue
@@ -131,6 +140,8 @@ def write_scores_to_productops_sheet(
         return 0
 
     key_col = col_map["initiative_key"]
+    if status_by_key and status_col is None:
+        logger.warning("productops_writer.status.no_status_column", extra={"tab": tab_name})
 
     # Step 3: Fetch only the needed columns (initiative_key + score/provenance columns)
     _dsr = data_start_row(tab_name)
@@ -195,6 +206,20 @@ def write_scores_to_productops_sheet(
                 break
             continue
         blank_run = 0
+
+        # Status is written for every listed key, independent of score updates
+        status_msg = status_by_key.get(key) if status_by_key and status_col is not None else None
+        if status_msg is not None:
+            batch_updates.append({
+                "range": _cell_range_for_update(tab_name, cast(int, status_col), row_idx),
+                "values": [[status_msg]],
+            })
+            if "updated_at" in col_map:
+                batch_updates.append({
+                    "range": _cell_range_for_update(tab_name, col_map["updated_at"], row_idx),
+                    "values": [[_now_iso()]],
+                })
+
         if allowed is not None and key not in allowed:
             continue
 
@@ -251,7 +276,7 @@ def write_scores_to_productops_sheet(
                     "range": cell_range,
                     "values": [[token(Provenance.FLOW3_PRODUCTOPSSHEET_WRITE_SCORES)]],
                 })
-            if "updated_at" in col_map:
+            if "updated_at" in col_map and status_msg is None:
                 ua_col_idx = col_map["updated_at"]
                 cell_range = _cell_range_for_update(tab_name, ua_col_idx, row_idx)
                 batch_updates.append({
@@ -314,7 +339,7 @@ def write_status_to_productops_sheet(
     for i, nh in enumerate(norm_headers):
         if nh == "initiative_key":
             key_col = i
-        elif nh in {"status", "last_run_status", "run_status"}:
+        elif nh in _STATUS_HEADERS:
             status_col = i
         elif nh in {"updated_at", "updated at"}:
             updated_at_col = i
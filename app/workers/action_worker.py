@@ -6,7 +6,7 @@ from typing import Optional
 
 from app.config import setup_json_logging, settings
 from app.db.session import SessionLocal
-from app.services.action_runner import execute_next_queued_run
+from app.services.action_runner import execute_queued_runs
 
 
 logger = logging.getLogger("app.workers.action_worker")
@@ -16,6 +16,8 @@ def run_worker_loop(
     poll_interval_seconds: float = 1.0,
     idle_sleep_seconds: float = 2.0,
     max_runs: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    batch_max_seconds: Optional[float] = None,
 ) -> int:
     """
     Continuously execute queued ActionRuns.
@@ -23,13 +25,27 @@ def run_worker_loop(
     - poll_interval_seconds: how often we try to fetch a queued run (tight loop cadence)
     - idle_sleep_seconds: sleep time when no jobs are queued (reduces DB load)
     - max_runs: if set, execute at most N runs then exit (useful for local testing)
+    - batch_size: runs claimed per poll and executed on one DB session
+      (default: settings.ACTION_WORKER_BATCH_SIZE)
+    - batch_max_seconds: time budget per batch; runs not started by then are requeued
+      (default: settings.ACTION_WORKER_BATCH_MAX_SECONDS)
     """
     setup_json_logging(log_level=getattr(logging, str(settings.LOG_LEVEL).upper(), logging.INFO))
 
+    if batch_size is None:
+        batch_size = max(1, settings.ACTION_WORKER_BATCH_SIZE)
+    if batch_max_seconds is None:
+        batch_max_seconds = settings.ACTION_WORKER_BATCH_MAX_SECONDS
+
     executed = 0
     logger.info(
         "action_worker.start",
-        extra={"poll_interval": poll_interval_seconds, "idle_sleep": idle_sleep_seconds},
+        extra={
+            "poll_interval": poll_interval_seconds,
+            "idle_sleep": idle_sleep_seconds,
+            "batch_size": batch_size,
+            "batch_max_seconds": batch_max_seconds,
+        },
     )
 
     while True:
@@ -37,21 +53,22 @@ def run_worker_loop(
             logger.info("action_worker.stop_max_runs", extra={"executed": executed})
             return executed
 
+        limit = batch_size if max_runs is None else min(batch_size, max_runs - executed)
         db = SessionLocal()
         try:
-            run = execute_next_queued_run(db)
+            runs = execute_queued_runs(db, max_runs=limit, max_seconds=batch_max_seconds)
         except Exception:
             # If something unexpected happens at the worker level, log and keep going
             logger.exception("action_worker.loop_error")
-            run = None
+            runs = []
         finally:
             db.close()
 
-        if run is None:
+        if not runs:
             # No queued runs: sleep longer (idle)
             time.sleep(idle_sleep_seconds)
         else:
-            executed += 1
+            executed += len(runs)
             # Small sleep to avoid hammering if queue is huge; tune later
             time.sleep(poll_interval_seconds)
 
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+from sqlalchemy import create_engine, select, update
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.db.models.action_run import ActionRun
+from app.services import action_runner
+from app.services.action_runner import (
+    STATUS_FAILED,
+    STATUS_QUEUED,
+    STATUS_RUNNING,
+    STATUS_SUCCESS,
+    _claim_n_queued,
+    _requeue_runs,
+    enqueue_action_runs,
+    execute_queued_runs,
+)
+
+
+ACTION = "pm.backlog_sync"
+
+
+@pytest.fixture()
+def db_session():
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+    session = Session()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(bind=engine)
+        engine.dispose()
+
+
+def _payload(tab: str = "Backlog") -> dict[str, Any]:
+    return {
+        "action": ACTION,
+        "requested_by": {"user_email": "pm@example.com", "ui": "sheets"},
+        "sheet_context": {"spreadsheet_id": "sheet-1", "tab": tab},
+        "scope": {"type": "initiative_keys", "initiative_keys": ["INIT-000001", "INIT-000002"]},
+    }
+
+
+def _enqueue_in_order(db_session, count: int) -> list[str]:
+    """Enqueue count runs with strictly increasing created_at (bulk inserts can share a timestamp)."""
+    run_ids = enqueue_action_runs(db_session, [_payload() for _ in range(count)])
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    for offset, run_id in enumerate(run_ids):
+        db_session.execute(
+            update(ActionRun).where(ActionRun.run_id == run_id).values(created_at=base + timedelta(minutes=offset))
+        )
+    db_session.commit()
+    return run_ids
+
+
+def _statuses(db_session) -> dict[str, str]:
+    return dict(db_session.execute(select(ActionRun.run_id, ActionRun.status)).all())
+
+
+def _stub_actions(monkeypatch, fn) -> None:
+    monkeypatch.setattr(action_runner, "_build_action_context", lambda payload, action: payload)
+    monkeypatch.setattr(action_runner, "_resolve_action", lambda action: fn)
+    monkeypatch.setattr(action_runner, "_extract_summary", lambda action, result: {"ok": True})
+
+
+def test_enqueue_action_runs_bulk_inserts_queued_rows(db_session) -> None:
+    run_ids = enqueue_action_runs(db_session, [_payload("Backlog"), _payload("Scoring_Inputs")])
+
+    assert len(run_ids) == 2
+    assert len(set(run_ids)) == 2
+
+    rows = {row.run_id: row for row in db_session.execute(select(ActionRun)).scalars()}
+    assert set(rows) == set(run_ids)
+    first = rows[run_ids[0]]
+    assert first.status == STATUS_QUEUED
+    assert first.action == ACTION
+    assert first.requested_by_email == "pm@example.com"
+    assert first.spreadsheet_id == "sheet-1"
+    assert first.tab_name == "Backlog"
+    assert first.scope_type == "initiative_keys"
+    assert first.scope_summary == "2 initiatives"
+    assert first.payload_json["action"] == ACTION
+    assert rows[run_ids[1]].tab_name == "Scoring_Inputs"
+
+
+def test_enqueue_action_runs_empty_list_is_noop(db_session) -> None:
+    assert enqueue_action_runs(db_session, []) == []
+    assert _statuses(db_session) == {}
+
+
+@pytest.mark.parametrize(
+    "bad_payload, message",
+    [
+        ({"action": "pm.not_a_real_action"}, "Unknown action: pm.not_a_real_action"),
+        ({"action": ""}, "payload.action is required"),
+    ],
+)
+def test_enqueue_action_runs_rejects_batch_with_invalid_payload(db_session, bad_payload, message) -> None:
+    with pytest.raises(ValueError, match=message):
+        enqueue_action_runs(db_session, [_payload(), bad_payload, _payload()])
+
+    # Validation happens before the INSERT, so nothing from the batch is written
+    assert _statuses(db_session) == {}
+
+
+def test_claim_n_queued_claims_oldest_first_up_to_limit(db_session) -> None:
+    run_ids = _enqueue_in_order(db_session, 4)
+    # Insert order differs from queue order: the last run is now the oldest
+    db_session.execute(
+        update(ActionRun)
+        .where(ActionRun.run_id == run_ids[3])
+        .values(created_at=datetime(2025, 12, 31, tzinfo=timezone.utc))
+    )
+    db_session.commit()
+
+    claimed = _claim_n_queued(db_session, 2)
+
+    assert [run.run_id for run in claimed] == [run_ids[3], run_ids[0]]
+    assert all(run.status == STATUS_RUNNING and run.started_at is not None for run in claimed)
+    assert _statuses(db_session) == {
+        run_ids[0]: STATUS_RUNNING,
+        run_ids[1]: STATUS_QUEUED,
+        run_ids[2]: STATUS_QUEUED,
+        run_ids[3]: STATUS_RUNNING,
+    }
+
+
+def test_claim_n_queued_skips_non_queued_and_handles_empty_queue(db_session) -> None:
+    assert _claim_n_queued(db_session, 3) == []
+    assert _claim_n_queued(db_session, 0) == []
+
+    run_ids = _enqueue_in_order(db_session, 2)
+    db_session.execute(update(ActionRun).where(ActionRun.run_id == run_ids[0]).values(status=STATUS_SUCCESS))
+    db_session.commit()
+
+    claimed = _claim_n_queued(db_session, 5)
+
+    assert [run.run_id for run in claimed] == [run_ids[1]]
+
+
+def test_execute_queued_runs_failure_does_not_poison_batch(db_session, monkeypatch) -> None:
+    run_ids = _enqueue_in_order(db_session, 3)
+    seen: list[str] = []
+
+    def fake_action(db, ctx):
+        seen.append(ctx["sheet_context"]["tab"])
+        if len(seen) == 2:
+            raise RuntimeError("sheet unavailable")
+        return {"status": "ok"}
+
+    _stub_actions(monkeypatch, fake_action)
+
+    executed = execute_queued_runs(db_session, max_runs=3)
+
+    assert [run.run_id for run in executed] == run_ids
+    assert [run.status for run in executed] == [STATUS_SUCCESS, STATUS_FAILED, STATUS_SUCCESS]
+    assert len(seen) == 3
+
+    rows = {row.run_id: row for row in db_session.execute(select(ActionRun)).scalars()}
+    assert rows[run_ids[0]].status == STATUS_SUCCESS
+    assert rows[run_ids[0]].result_json == {"raw": {"status": "ok"}, "summary": {"ok": True}}
+    assert rows[run_ids[1]].status == STATUS_FAILED
+    assert "sheet unavailable" in rows[run_ids[1]].error_text
+    assert rows[run_ids[1]].finished_at is not None
+    assert rows[run_ids[2]].status == STATUS_SUCCESS
+
+
+def test_execute_queued_runs_respects_max_runs(db_session, monkeypatch) -> None:
+    run_ids = _enqueue_in_order(db_session, 3)
+    _stub_actions(monkeypatch, lambda db, ctx: {"status": "ok"})
+
+    executed = execute_queued_runs(db_session, max_runs=2)
+
+    assert [run.run_id for run in executed] == run_ids[:2]
+    assert _statuses(db_session)[run_ids[2]] == STATUS_QUEUED
+
+
+def test_execute_queued_runs_requeues_unstarted_runs_after_max_seconds(db_session, monkeypatch) -> None:
+    run_ids = _enqueue_in_order(db_session, 3)
+    _stub_actions(monkeypatch, lambda db, ctx: {"status": "ok"})
+
+    # The first run always executes; the budget is already spent when the second is due
+    executed = execute_queued_runs(db_session, max_runs=3, max_seconds=0)
+
+    assert [run.run_id for run in executed] == run_ids[:1]
+    assert _statuses(db_session) == {
+        run_ids[0]: STATUS_SUCCESS,
+        run_ids[1]: STATUS_QUEUED,
+        run_ids[2]: STATUS_QUEUED,
+    }
+    started = dict(db_session.execute(select(ActionRun.run_id, ActionRun.started_at)).all())
+    assert started[run_ids[1]] is None
+    assert started[run_ids[2]] is None
+
+    # Requeued runs are claimable again, still in queue order
+    assert [run.run_id for run in _claim_n_queued(db_session, 5)] == run_ids[1:]
+
+
+def test_requeue_runs_resets_claimed_runs(db_session) -> None:
+    run_ids = _enqueue_in_order(db_session, 2)
+    claimed = _claim_n_queued(db_session, 2)
+
+    _requeue_runs(db_session, claimed)
+
+    assert [(run.status, run.started_at) for run in claimed] == [(STATUS_QUEUED, None), (STATUS_QUEUED, None)]
+    assert _statuses(db_session) == {run_ids[0]: STATUS_QUEUED, run_ids[1]: STATUS_QUEUED}
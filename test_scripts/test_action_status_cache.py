@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, delete, update
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.deps import get_db
+from app.api.routes import actions
+from app.config import settings
+from app.db.base import Base
+from app.db.models.action_run import ActionRun
+
+
+SECRET = "test-secret"
+AUTH = {"X-ROADMAP-AI-SECRET": SECRET}
+
+
+@pytest.fixture()
+def db_session():
+    # One shared connection so the TestClient's worker thread sees the same in-memory DB
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+    session = Session()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(bind=engine)
+        engine.dispose()
+
+
+@pytest.fixture()
+def client(db_session, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "ROADMAP_AI_SECRET", SECRET)
+    monkeypatch.setattr(actions, "_terminal_responses", OrderedDict())
+
+    app = FastAPI()
+    app.include_router(actions.router)
+    app.dependency_overrides[get_db] = lambda: db_session
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def _add_run(db_session, run_id: str, status: str, **values) -> None:
+    db_session.add(
+        ActionRun(
+            run_id=run_id,
+            action="pm.optimize_run_selected_candidates",
+            status=status,
+            payload_json={"action": "pm.optimize_run_selected_candidates"},
+            created_at=datetime(2026, 1, 1, 9, 0, tzinfo=timezone.utc),
+            **values,
+        )
+    )
+    db_session.commit()
+
+
+def test_cached_terminal_response_matches_uncached_bytes(client, db_session) -> None:
+    _add_run(
+        db_session,
+        "run-1",
+        "success",
+        started_at=datetime(2026, 1, 1, 9, 0, 5, tzinfo=timezone.utc),
+        finished_at=datetime(2026, 1, 1, 9, 1, tzinfo=timezone.utc),
+        result_json={"raw": {"selected": ["INIT-000001", "INIT-000002"], "objective": 12.5}, "summary": {"total": 2}},
+    )
+
+    first = client.get("/actions/run/run-1", headers=AUTH)
+    assert first.status_code == 200
+    assert first.json()["status"] == "success"
+    assert first.json()["result"]["raw"]["objective"] == 12.5
+    assert list(actions._terminal_responses) == ["run-1"]
+
+    # Served from the cache: the row is gone, yet the response is byte-for-byte the same
+    db_session.execute(delete(ActionRun).where(ActionRun.run_id == "run-1"))
+    db_session.commit()
+    second = client.get("/actions/run/run-1", headers=AUTH)
+
+    assert second.status_code == 200
+    assert second.content == first.content
+    assert second.headers["content-type"] == first.headers["content-type"]
+
+
+def test_cached_terminal_response_still_requires_secret(client, db_session) -> None:
+    _add_run(db_session, "run-1", "failed", error_text="boom")
+    assert client.get("/actions/run/run-1", headers=AUTH).status_code == 200
+    assert "run-1" in actions._terminal_responses
+
+    assert client.get("/actions/run/run-1").status_code == 401
+    assert client.get("/actions/run/run-1", headers={"X-ROADMAP-AI-SECRET": "wrong"}).status_code == 401
+
+
+def test_terminal_response_cache_evicts_least_recently_used(client, db_session, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(actions, "_TERMINAL_RESPONSE_CACHE_MAX", 2)
+    for run_id in ("run-1", "run-2", "run-3"):
+        _add_run(db_session, run_id, "success", result_json={"raw": {}, "summary": {}})
+
+    client.get("/actions/run/run-1", headers=AUTH)
+    client.get("/actions/run/run-2", headers=AUTH)
+    # A cache hit refreshes run-1, so run-2 is the one evicted
+    client.get("/actions/run/run-1", headers=AUTH)
+    client.get("/actions/run/run-3", headers=AUTH)
+
+    assert list(actions._terminal_responses) == ["run-1", "run-3"]
+
+
+def test_non_terminal_runs_are_not_cached(client, db_session) -> None:
+    _add_run(db_session, "run-1", "queued")
+
+    queued = client.get("/actions/run/run-1", headers=AUTH)
+    assert queued.json()["status"] == "queued"
+    assert "run-1" not in actions._terminal_responses
+
+    db_session.execute(
+        update(ActionRun)
+        .where(ActionRun.run_id == "run-1")
+        .values(status="running", started_at=datetime(2026, 1, 1, 9, 0, 5, tzinfo=timezone.utc))
+    )
+    db_session.commit()
+    running = client.get("/actions/run/run-1", headers=AUTH)
+    assert running.json()["status"] == "running"
+    assert "run-1" not in actions._terminal_responses
+
+    db_session.execute(update(ActionRun).where(ActionRun.run_id == "run-1").values(status="success"))
+    db_session.commit()
+    finished = client.get("/actions/run/run-1", headers=AUTH)
+    assert finished.json()["status"] == "success"
+    assert "run-1" in actions._terminal_responses
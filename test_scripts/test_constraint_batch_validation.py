@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import copy
+
+import pytest
+
+from app.schemas.optimization_center import (
+    EMPTY_ROW_WARNING,
+    CapacityFloorRowSchema,
+    ValidationMessage,
+    validate_constraint_row,
+    validate_constraint_rows_batch,
+)
+from app.services.optimization.optimization_compiler import compile_constraint_sets
+
+
+def _floor_row(**overrides) -> dict:
+    row = {
+        "scenario_name": " Q1 2026 ",
+        "constraint_set_name": "Baseline",
+        "constraint_type": "Capacity Floor",
+        "dimension": " Country ",
+        "dimension_key": " UK ",
+        "min_tokens": "10",
+        "max_tokens": "",
+    }
+    row.update(overrides)
+    return row
+
+
+def _mixed_rows() -> list[tuple[int, dict]]:
+    return [
+        (5, _floor_row()),
+        (6, _floor_row(constraint_type="capacity_cap", dimension="all", dimension_key="", max_tokens="")),
+        (7, {"notes": "trailer row"}),
+        (8, {"scenario_name": "Q1 2026", "constraint_set_name": "Baseline", "constraint_type": "mandatory",
+             "dimension": "initiative", "dimension_key": "INIT-000001"}),
+        (9, _floor_row(min_tokens="lots")),
+        (10, _floor_row(min_tokens="20", max_tokens="5")),
+        (11, _floor_row(min_tokens="0")),
+    ]
+
+
+def test_batch_attributes_errors_to_failing_rows_and_keeps_clean_models() -> None:
+    results = validate_constraint_rows_batch(_mixed_rows())
+
+    assert [message.row_num for message, _ in results] == [5, 6, 7, 8, 9, 10, 11]
+
+    floor_msg, floor_model = results[0]
+    assert floor_msg.errors == ()
+    assert floor_msg.key == "Q1 2026|Baseline|capacity_floor|country|UK"
+    assert type(floor_model).__name__ == "CapacityFloorRowSchema"
+    assert floor_model.min_tokens == 10.0
+
+    cap_msg, cap_model = results[1]
+    assert cap_model is None
+    assert any("capacity_cap requires max_tokens" in err for err in cap_msg.errors)
+
+    # A clean row after a failing one is still parsed (re-validated on its own)
+    mandatory_msg, mandatory_model = results[3]
+    assert mandatory_msg.errors == ()
+    assert type(mandatory_model).__name__ == "MandatoryRowSchema"
+
+    number_msg, number_model = results[4]
+    assert number_model is None
+    assert len(number_msg.errors) == 1
+
+    range_msg, range_model = results[5]
+    assert range_model is not None
+    assert range_msg.errors == ("min_tokens cannot exceed max_tokens",)
+
+    zero_msg, _ = results[6]
+    assert zero_msg.errors == ()
+    assert zero_msg.warnings == ("min_tokens is 0",)
+
+
+def test_batch_skips_empty_rows_with_warning() -> None:
+    results = validate_constraint_rows_batch([(3, {"notes": "only notes"}), (4, {"scenario_name": " "})])
+
+    for row_num, (message, model) in zip((3, 4), results):
+        assert model is None
+        assert message.row_num == row_num
+        assert message.key == ""
+        assert message.errors == ()
+        assert message.warnings == (EMPTY_ROW_WARNING,)
+
+
+def test_batch_matches_single_row_validation() -> None:
+    rows = _mixed_rows()
+
+    batch_messages = [message for message, _ in validate_constraint_rows_batch(copy.deepcopy(rows))]
+    single_messages = [validate_constraint_row(row_num, dict(data)) for row_num, data in rows]
+
+    assert batch_messages == single_messages
+
+
+def test_batch_copies_rows_unless_inplace() -> None:
+    rows = _mixed_rows()
+    original = copy.deepcopy(rows)
+
+    validate_constraint_rows_batch(rows)
+    assert rows == original
+
+    validate_constraint_rows_batch(rows, inplace=True)
+    normalized = rows[0][1]
+    assert normalized["constraint_type"] == "capacity_floor"
+    assert normalized["dimension"] == "country"
+    assert normalized["dimension_key"] == "UK"
+    # Empty rows are skipped before normalization
+    assert rows[2][1] == {"notes": "trailer row"}
+
+
+def test_schema_validation_does_not_mutate_input() -> None:
+    ok = _floor_row(constraint_type="capacity_floor", dimension="country")
+    bad = _floor_row(constraint_type="capacity_floor", dimension="country", min_tokens="lots")
+    before = copy.deepcopy([ok, bad])
+
+    CapacityFloorRowSchema.model_validate(ok)
+    try:
+        CapacityFloorRowSchema.model_validate(bad)
+    except ValueError:
+        pass
+
+    assert [ok, bad] == before
+
+
+def test_batch_inplace_and_copy_produce_same_results() -> None:
+    copied = validate_constraint_rows_batch(_mixed_rows())
+    inplace = validate_constraint_rows_batch(_mixed_rows(), inplace=True)
+
+    assert [message for message, _ in copied] == [message for message, _ in inplace]
+    assert [model.model_dump() if model else None for _, model in copied] == [
+        model.model_dump() if model else None for _, model in inplace
+    ]
+
+
+def test_batch_of_only_empty_rows_and_no_rows() -> None:
+    assert validate_constraint_rows_batch([]) == []
+    results = validate_constraint_rows_batch([(2, {})])
+    assert results[0][0].warnings == (EMPTY_ROW_WARNING,)
+
+
+def test_validation_message_str_keeps_user_facing_format() -> None:
+    message = ValidationMessage(row_num=3, key="k", errors=("e",))
+
+    assert str(message) == "row_num=3 key='k' errors=['e'] warnings=[]"
+
+
+def test_compiler_logs_skipped_empty_constraint_rows_as_warnings(caplog: pytest.LogCaptureFixture) -> None:
+    with caplog.at_level("INFO", logger="app.services.optimization.optimization_compiler"):
+        compiled, messages = compile_constraint_sets([(5, _floor_row()), (6, {"notes": "trailer row"})], [])
+
+    assert list(compiled) == [("Q1 2026", "Baseline")]
+    assert [(m.row_num, m.warnings) for m in messages] == [(6, (EMPTY_ROW_WARNING,))]
+    logged = [record.message for record in caplog.records]
+    assert "opt_compile.constraint_row_errors" not in logged
+    assert logged.count("opt_compile.constraint_row_warnings") == 1
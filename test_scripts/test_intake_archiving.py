@@ -12,6 +12,7 @@ from sqlalchemy.orm import sessionmaker
 from app.db.base import Base
 from app.db.models.initiative import Initiative
 from app.db.models.scoring import InitiativeMathModel
+from app.jobs.backlog_sync_job import run_all_backlog_sync_for_keys
 from app.jobs.flow3_product_ops_job import run_flow3_sync_inputs_to_initiatives
 from app.jobs.flow3_product_ops_job import run_flow3_populate_initiatives
 from app.jobs.math_model_generation_job import run_math_model_generation_job
@@ -29,12 +30,12 @@ from app.services.backlog_reconciliation_service import BacklogReconciliationSer
 from app.services.backlog_service import BacklogService
 from app.services.intake_mapper import map_sheet_row_to_initiative_create
 from app.services.intake_service import IntakeService
-from app.sheets.backlog_writer import write_backlog_fields_batch, write_backlog_from_db, write_llm_summaries_to_backlog_sheet
+from app.sheets.backlog_writer import write_backlog_fields_batch, write_backlog_fields_from_db, write_backlog_from_db, write_llm_summaries_to_backlog_sheet
 from app.sheets.intake_writer import GoogleSheetsIntakeWriter
 from app.sheets.layout import data_start_row
 from app.sheets.llm_context_reader import LLMContextReader
 from app.sheets.models import MathModelRow, MetricsConfigRow
-from app.sheets.productops_writer import upsert_initiatives_to_scoring_inputs
+from app.sheets.productops_writer import upsert_initiatives_to_scoring_inputs, write_scores_to_productops_sheet
 from app.sheets.scoring_inputs_reader import ScoringInputsRow
 from app.config import BacklogSheetConfig, IntakeSheetConfig, IntakeTabConfig, settings
 
@@ -970,6 +971,126 @@ def test_write_backlog_fields_batch_chunks_large_updates(monkeypatch: pytest.Mon
     assert client.batch_sizes == [2, 1]
 
 
+def test_write_backlog_fields_from_db_writes_only_listed_fields_and_rows(db_session) -> None:
+    for key, summary in (("INIT-000001", "Summary 1"), ("INIT-000002", "Summary 2"), ("INIT-000003", "Summary 3")):
+        initiative = _create_initiative(db_session, initiative_key=key, title=f"Title {key}")
+        cast(Any, initiative).llm_summary = summary
+        cast(Any, initiative).value_score = 4.0
+    db_session.commit()
+    client = BacklogSummaryClient(
+        ["Initiative Key", "Title", "Value Score", "LLM Summary"],
+        ["INIT-000001", "INIT-000002", "INIT-000003"],
+    )
+
+    result = write_backlog_fields_from_db(
+        db_session,
+        cast(Any, client),
+        "sheet-1",
+        "Backlog",
+        initiative_keys=["INIT-000001", "INIT-000003"],
+        fields=["llm_summary"],
+    )
+
+    assert result == {"initiatives_written": 2, "initiatives_missing": 0}
+    assert client.updated == [
+        {"range": "Backlog!D5", "values": [["Summary 1"]]},
+        {"range": "Backlog!D7", "values": [["Summary 3"]]},
+    ]
+
+
+def test_write_backlog_fields_from_db_counts_row_without_field_columns_as_found(db_session) -> None:
+    _create_initiative(db_session, initiative_key="INIT-000001")
+    client = BacklogSummaryClient(["Initiative Key", "Title"], ["INIT-000001"])
+
+    result = write_backlog_fields_from_db(
+        db_session,
+        cast(Any, client),
+        "sheet-1",
+        "Backlog",
+        initiative_keys=["INIT-000001"],
+        fields=["llm_summary"],
+    )
+
+    # The row exists; the sheet just has no LLM Summary column, so nothing is missing
+    assert result == {"initiatives_written": 0, "initiatives_missing": 0}
+    assert client.updated == []
+
+
+def _run_backlog_sync_for_keys_with_fake_client(db_session, monkeypatch: pytest.MonkeyPatch, client, keys: list[str], fields: list[str]):
+    full_writes: list[str] = []
+
+    def fake_write_backlog_from_db(**kwargs):
+        full_writes.append(kwargs["backlog_spreadsheet_id"])
+        return {"initiatives_written": 5, "cells_updated": 40, "archived_rows_excluded": 1}
+
+    monkeypatch.setattr("app.jobs.backlog_sync_job.get_sheets_service", lambda: object())
+    monkeypatch.setattr("app.jobs.backlog_sync_job.SheetsClient", lambda service: client)
+    monkeypatch.setattr("app.jobs.backlog_sync_job.write_backlog_from_db", fake_write_backlog_from_db)
+
+    original_central_backlog = settings.CENTRAL_BACKLOG
+    original_backlog_sheets = settings.CENTRAL_BACKLOG_SHEETS
+    settings.CENTRAL_BACKLOG = BacklogSheetConfig(spreadsheet_id="backlog-sheet-1", tab_name="Backlog")
+    settings.CENTRAL_BACKLOG_SHEETS = []
+    try:
+        result = run_all_backlog_sync_for_keys(db_session, keys, fields)
+    finally:
+        settings.CENTRAL_BACKLOG = original_central_backlog
+        settings.CENTRAL_BACKLOG_SHEETS = original_backlog_sheets
+    return result, full_writes
+
+
+def test_run_all_backlog_sync_for_keys_targets_listed_cells(db_session, monkeypatch: pytest.MonkeyPatch) -> None:
+    initiative = _create_initiative(db_session, initiative_key="INIT-000002")
+    cast(Any, initiative).llm_summary = "Fresh summary"
+    _create_initiative(db_session, initiative_key="INIT-000001")
+    db_session.commit()
+    client = BacklogSummaryClient(["Initiative Key", "LLM Summary"], ["INIT-000001", "INIT-000002"])
+
+    result, full_writes = _run_backlog_sync_for_keys_with_fake_client(
+        db_session, monkeypatch, client, ["INIT-000002"], ["llm_summary"]
+    )
+
+    assert full_writes == []
+    assert client.updated == [{"range": "Backlog!B6", "values": [["Fresh summary"]]}]
+    assert result == {
+        "sheets_processed": 1,
+        "initiatives_written": 1,
+        "cells_updated": 0,
+        "archived_rows_excluded": 0,
+    }
+
+
+def test_run_all_backlog_sync_for_keys_falls_back_when_key_missing_from_sheet(db_session, monkeypatch: pytest.MonkeyPatch) -> None:
+    _create_initiative(db_session, initiative_key="INIT-000001")
+    _create_initiative(db_session, initiative_key="INIT-000009")
+    client = BacklogSummaryClient(["Initiative Key", "LLM Summary"], ["INIT-000001"])
+
+    result, full_writes = _run_backlog_sync_for_keys_with_fake_client(
+        db_session, monkeypatch, client, ["INIT-000001", "INIT-000009"], ["llm_summary"]
+    )
+
+    assert full_writes == ["backlog-sheet-1"]
+    assert result == {
+        "sheets_processed": 1,
+        "initiatives_written": 5,
+        "cells_updated": 40,
+        "archived_rows_excluded": 1,
+    }
+
+
+def test_run_all_backlog_sync_for_keys_does_not_regenerate_when_columns_absent(db_session, monkeypatch: pytest.MonkeyPatch) -> None:
+    _create_initiative(db_session, initiative_key="INIT-000001")
+    client = BacklogSummaryClient(["Initiative Key", "Title"], ["INIT-000001"])
+
+    result, full_writes = _run_backlog_sync_for_keys_with_fake_client(
+        db_session, monkeypatch, client, ["INIT-000001"], ["llm_summary"]
+    )
+
+    assert full_writes == []
+    assert client.updated == []
+    assert result["initiatives_written"] == 0
+
+
 def test_backlog_service_ignores_db_owned_llm_summary_sheet_edit(db_session) -> None:
     initiative = _create_initiative(
         db_session,
@@ -1642,6 +1763,90 @@ def test_upsert_initiatives_to_scoring_inputs_warns_when_title_column_missing(ca
     assert any(record.message == "productops_writer.upsert.title_column_missing" for record in caplog.records)
 
 
+class ScoresStatusClient:
+    def __init__(self, header: list[str], keys: list[str]) -> None:
+        self.header = header
+        self.keys = keys
+        self.updated: list[dict[str, Any]] = []
+
+    def get_values(self, spreadsheet_id: str, range_: str, value_render_option: str = "UNFORMATTED_VALUE"):
+        return [self.header]
+
+    def batch_get_values(self, spreadsheet_id: str, ranges: list[str], value_render_option: str = "UNFORMATTED_VALUE"):
+        key_col = "ABCDEFGHIJ"[self.header.index("Initiative Key")]
+        return [
+            {"values": [[key] for key in self.keys]} if range_.split("!")[1].startswith(key_col) else {}
+            for range_ in ranges
+        ]
+
+    def batch_update_values(self, spreadsheet_id: str, data: list[dict], value_input_option: str = "USER_ENTERED") -> None:
+        self.updated.extend(data)
+
+
+def _create_scored_initiatives(db_session) -> None:
+    for key, score in (("INIT-000001", 1.5), ("INIT-000002", 2.0)):
+        initiative = _create_initiative(db_session, initiative_key=key)
+        cast(Any, initiative).rice_value_score = score
+    db_session.commit()
+
+
+def test_write_scores_to_productops_sheet_writes_status_for_every_listed_key(db_session, monkeypatch: pytest.MonkeyPatch) -> None:
+    _create_scored_initiatives(db_session)
+    monkeypatch.setattr("app.sheets.productops_writer._now_iso", lambda: "2026-01-01T00:00:00Z")
+    client = ScoresStatusClient(
+        ["Initiative Key", "RICE Value Score", "Status", "Updated At"],
+        ["INIT-000001", "INIT-000002", "INIT-000003"],
+    )
+
+    updated = write_scores_to_productops_sheet(
+        db_session,
+        cast(Any, client),
+        "sheet-1",
+        "Scoring_Inputs",
+        initiative_keys=["INIT-000001"],
+        status_by_key={"INIT-000001": "OK", "INIT-000002": "Skipped: not selected"},
+    )
+
+    assert updated == 1
+    writes = {item["range"]: item["values"] for item in client.updated}
+    # INIT-000002 is filtered out of score updates but still gets its Status
+    assert writes["Scoring_Inputs!C5:C5"] == [["OK"]]
+    assert writes["Scoring_Inputs!C6:C6"] == [["Skipped: not selected"]]
+    assert writes["Scoring_Inputs!B5:B5"] == [[1.5]]
+    assert "Scoring_Inputs!B6:B6" not in writes
+    assert not any(item["range"].endswith("7") for item in client.updated)
+    # Updated At is written once per row, whether or not the row also got scores
+    updated_at_ranges = [item["range"] for item in client.updated if item["range"].startswith("Scoring_Inputs!D")]
+    assert updated_at_ranges == ["Scoring_Inputs!D5:D5", "Scoring_Inputs!D6:D6"]
+
+
+def test_write_scores_to_productops_sheet_without_status_column_still_writes_scores(
+    db_session, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    _create_scored_initiatives(db_session)
+    monkeypatch.setattr("app.sheets.productops_writer._now_iso", lambda: "2026-01-01T00:00:00Z")
+    client = ScoresStatusClient(["Initiative Key", "RICE Value Score", "Updated At"], ["INIT-000001", "INIT-000002"])
+
+    with caplog.at_level("WARNING"):
+        updated = write_scores_to_productops_sheet(
+            db_session,
+            cast(Any, client),
+            "sheet-1",
+            "Scoring_Inputs",
+            initiative_keys=["INIT-000001", "INIT-000002"],
+            status_by_key={"INIT-000001": "OK", "INIT-000002": "OK"},
+        )
+
+    assert updated == 2
+    assert client.updated == [
+        {"range": "Scoring_Inputs!B5:B5", "values": [[1.5]]},
+        {"range": "Scoring_Inputs!C5:C5", "values": [["2026-01-01T00:00:00Z"]]},
+        {"range": "Scoring_Inputs!B6:B6", "values": [[2.0]]},
+        {"range": "Scoring_Inputs!C6:C6", "values": [["2026-01-01T00:00:00Z"]]},
+    ]
+    assert any(record.message == "productops_writer.status.no_status_column" for record in caplog.records)
+
+
 def test_run_sync_for_sheet_raises_on_backfill_failure(db_session, monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(
         "app.jobs.sync_intake_job.IntakeReader.get_rows_for_sheet",
@@ -2106,7 +2311,7 @@ def test_pm_generate_llm_summary_returns_counts(db_session, monkeypatch: pytest.
             }
         ),
     )
-    monkeypatch.setattr("app.sheets.productops_writer.write_status_to_sheet", lambda *_args, **_kwargs: 1)
+    monkeypatch.setattr("app.services.action_runner.write_status_to_sheet", lambda *_args, **_kwargs: 1)
 
     try:
         ctx = ActionContext(
@@ -2172,7 +2377,7 @@ def test_pm_sync_backlog_db_returns_counts(db_session, monkeypatch: pytest.Monke
             }
         ),
     )
-    monkeypatch.setattr("app.sheets.productops_writer.write_status_to_sheet", lambda *_args, **_kwargs: 1)
+    monkeypatch.setattr("app.services.action_runner.write_status_to_sheet", lambda *_args, **_kwargs: 1)
 
     try:
         ctx = ActionContext(
@@ -2324,7 +2529,7 @@ def test_pm_suggest_math_model_llm_passes_shared_llm_context(db_session, monkeyp
     monkeypatch.setattr("app.llm.scoring_assistant.build_math_model_prompt_enrichment", fake_build_math_model_prompt_enrichment)
     monkeypatch.setattr("app.llm.scoring_assistant.load_metrics_config_prompt_json", lambda *args, **kwargs: [{"kpi_key": "active_restaurants", "kpi_level": "north_star"}])
     monkeypatch.setattr("app.llm.client.build_constructed_math_model_prompt", fake_build_constructed_math_model_prompt)
-    monkeypatch.setattr("app.sheets.productops_writer.write_status_to_sheet", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr("app.services.action_runner.write_status_to_sheet", lambda *_args, **_kwargs: None)
 
     try:
         ctx = ActionContext(
@@ -2428,7 +2633,7 @@ def test_pm_suggest_math_model_llm_rejects_without_writing(db_session, monkeypat
     monkeypatch.setattr("app.llm.scoring_assistant.build_math_model_prompt_enrichment", lambda *args, **kwargs: ("[Strategy]\n- Focus", "- north_star_gmv | name=GMV"))
     monkeypatch.setattr("app.llm.scoring_assistant.load_metrics_config_prompt_json", lambda *args, **kwargs: [{"kpi_key": "active_restaurants", "kpi_level": "north_star"}])
     monkeypatch.setattr("app.llm.client.build_constructed_math_model_prompt", lambda payload: "[system]\nTest system\n\n[user]\nTest user")
-    monkeypatch.setattr("app.sheets.productops_writer.write_status_to_sheet", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr("app.services.action_runner.write_status_to_sheet", lambda *_args, **_kwargs: None)
 
     try:
         ctx = ActionContext(
@@ -2523,7 +2728,7 @@ def test_pm_seed_math_params_passes_model_name_to_params_sheet(db_session, monke
     monkeypatch.setattr("app.sheets.params_reader.ParamsReader", FakeParamsReader)
     monkeypatch.setattr("app.sheets.params_writer.ParamsWriter", FakeParamsWriter)
     monkeypatch.setattr("app.llm.scoring_assistant.suggest_param_metadata_for_model", lambda **_kwargs: FakeSuggestion())
-    monkeypatch.setattr("app.sheets.productops_writer.write_status_to_sheet", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr("app.services.action_runner.write_status_to_sheet", lambda *_args, **_kwargs: None)
     monkeypatch.setattr("app.utils.safe_eval.validate_formula", lambda _formula: [])
     monkeypatch.setattr("app.utils.safe_eval.extract_identifiers", lambda _formula: ["potential_restaurants"])
 
@@ -2600,7 +2805,7 @@ def test_pm_seed_math_params_backfills_model_name_for_existing_params(db_session
     monkeypatch.setattr("app.sheets.math_models_reader.MathModelsReader", FakeMathModelsReader)
     monkeypatch.setattr("app.sheets.params_reader.ParamsReader", FakeParamsReader)
     monkeypatch.setattr("app.sheets.params_writer.ParamsWriter", FakeParamsWriter)
-    monkeypatch.setattr("app.sheets.productops_writer.write_status_to_sheet", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr("app.services.action_runner.write_status_to_sheet", lambda *_args, **_kwargs: None)
     monkeypatch.setattr("app.utils.safe_eval.validate_formula", lambda _formula: [])
     monkeypatch.setattr("app.utils.safe_eval.extract_identifiers", lambda _formula: ["potential_restaurants"])
 
@@ -2911,6 +3116,7 @@ def test_pm_switch_framework_routes_normalized_scoring_tab_to_canonical_tab(db_s
     original_product_ops = settings.PRODUCT_OPS
     sync_tabs: list[str] = []
     write_tabs: list[str] = []
+    write_statuses: list[dict[str, str]] = []
     status_tabs: list[str] = []
 
     class FakeScoringService:
@@ -2929,10 +3135,12 @@ def test_pm_switch_framework_routes_normalized_scoring_tab_to_canonical_tab(db_s
     monkeypatch.setattr("app.services.action_runner.ScoringService", FakeScoringService)
     monkeypatch.setattr(
         "app.services.action_runner.run_flow3_write_scores_to_sheet",
-        lambda **kwargs: write_tabs.append(kwargs["tab_name"]) or len(kwargs["initiative_keys"]),
+        lambda **kwargs: write_tabs.append(kwargs["tab_name"])
+        or write_statuses.append(kwargs["status_by_key"])
+        or len(kwargs["initiative_keys"]),
     )
     monkeypatch.setattr(
-        "app.sheets.productops_writer.write_status_to_sheet",
+        "app.services.action_runner.write_status_to_sheet",
         lambda _client, _spreadsheet_id, tab_name, _statuses: status_tabs.append(tab_name),
     )
 
@@ -2951,7 +3159,9 @@ def test_pm_switch_framework_routes_normalized_scoring_tab_to_canonical_tab(db_s
         assert result["tab"] == "Scoring_Inputs"
         assert sync_tabs == ["Scoring_Inputs"]
         assert write_tabs == ["Scoring_Inputs"]
-        assert status_tabs == ["Scoring_Inputs"]
+        # Status rides along with the score write; no separate status request
+        assert write_statuses == [{"INIT-000001": "OK"}]
+        assert status_tabs == []
     finally:
         settings.PRODUCT_OPS = original_product_ops
 